@@ -0,0 +1,99 @@
+"""
+Benchmark: pandas vs polars engine on a full week.
+
+Times the tracking steps NFLPipeline runs for a week with each engine:
+loading all tracking rows, building the unique-play table, indexing plays
+and fetching single plays. Runs against the raw CSV by default or the columnar
+store with --store.
+
+Usage (from the playgenerate directory):
+    python benchmarks/bench_engines.py --week 1
+    python benchmarks/bench_engines.py --week 1 --store
+"""
+
+import argparse
+import os
+import sys
+import time
+import warnings
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+from pipeline import NFLPipeline
+
+ENGINES = ['pandas', 'polars']
+
+
+def timed(fn, *args, **kwargs):
+    """Run fn and return (result, seconds)."""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run_engine(engine: str, data_dir: str, output_dir: str, filename: str,
+               use_store: bool, lookups: int) -> dict:
+    """Time each tracking step with one engine."""
+    pipeline = NFLPipeline(data_dir, output_dir, use_store=use_store, engine=engine)
+    timings = {}
+
+    tracking, timings['load week'] = timed(pipeline.load_tracking_data, filename)
+    plays, timings['unique plays'] = timed(pipeline.load_unique_plays, filename)
+    index, timings['index plays'] = timed(pipeline.build_play_index, tracking)
+
+    # Single-play fetches without an index: full-frame mask for pandas,
+    # a pushed-down filter on the scan for polars
+    source = tracking if engine == 'pandas' else pipeline.scan_tracking(filename)
+    keys = plays[['game_id', 'play_id']].head(lookups).itertuples(index=False)
+    start = time.perf_counter()
+    for game_id, play_id in keys:
+        pipeline.get_play_tracking_data(source, game_id, play_id)
+    timings['play lookup (avg)'] = (time.perf_counter() - start) / min(lookups, len(plays))
+
+    return {'rows': len(tracking), 'plays': len(plays), 'timings': timings}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='pandas vs polars engine benchmark')
+    parser.add_argument('--data-dir', default='data/nfl-big-data-bowl-2026-prediction',
+                       help='Directory containing Big Data Bowl data')
+    parser.add_argument('--output-dir', default='output',
+                       help='Pipeline output directory (holds the tracking store)')
+    parser.add_argument('--season', type=int, default=2023)
+    parser.add_argument('--week', type=int, default=1)
+    parser.add_argument('--store', action='store_true',
+                       help='Read through the columnar store instead of the CSV')
+    parser.add_argument('--lookups', type=int, default=20,
+                       help='Single-play fetches to time')
+    args = parser.parse_args()
+
+    data_dir = os.path.join(PLAYGEN_DIR, args.data_dir)
+    output_dir = os.path.join(PLAYGEN_DIR, args.output_dir)
+    filename = f"input_{args.season}_w{args.week:02d}.csv"
+
+    # Pipeline progress output would drown the table
+    warnings.simplefilter('ignore')
+    results = {}
+    for engine in ENGINES:
+        with open(os.devnull, 'w') as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                results[engine] = run_engine(
+                    engine, data_dir, output_dir, filename, args.store, args.lookups
+                )
+            finally:
+                sys.stdout = stdout
+
+    source = 'columnar store' if args.store else 'CSV'
+    print(f"{filename} via {source}: {results['pandas']['rows']:,} rows, "
+          f"{results['pandas']['plays']:,} plays\n")
+    print(f"{'step':<20} {'pandas s':>10} {'polars s':>10} {'speedup':>9}")
+    for step in results['pandas']['timings']:
+        p = results['pandas']['timings'][step]
+        q = results['polars']['timings'][step]
+        print(f"{step:<20} {p:>10.4f} {q:>10.4f} {p / q:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
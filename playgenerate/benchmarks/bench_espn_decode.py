@@ -0,0 +1,139 @@
+"""
+Benchmark: decoding ESPN game summaries.
+
+Decodes game summary bodies several ways and reports time per summary,
+peak traced allocation while decoding and the memory still held by the
+result:
+
+    json            json.loads of the whole body (what response.json() did)
+    orjson          orjson.loads of the whole body
+    client          ESPNClient._decode: orjson when installed, trimmed to
+                    the header, drives and gameInfo subtrees
+    client+parse    client decode plus parsing into a PlayTable
+
+Summaries come from --summaries (a directory of recorded summary JSON
+files) or, by default, from the synthetic games the ESPN stub serves. Record
+real summaries once with --record (needs network access):
+
+Usage (from the playgenerate directory):
+    python benchmarks/bench_espn_decode.py --games 16 --padding 3
+    python benchmarks/bench_espn_decode.py --record output/summaries --events 401547353,401547403
+    python benchmarks/bench_espn_decode.py --summaries output/summaries
+"""
+
+import argparse
+import gc
+import glob
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PLAYGEN_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+import requests
+
+from enrichment.espn_client import ORJSON_AVAILABLE, ESPNClient
+from enrichment.play_table import PlayTable
+from lru_cache import approx_size
+
+from stubs import summary_payload
+from synthetic import week_game_ids
+
+SEASON = 2023
+WEEK = 1
+
+
+def record(out_dir: str, events: list[str]) -> None:
+    """Save raw summary bodies from the live API."""
+    os.makedirs(out_dir, exist_ok=True)
+    client = ESPNClient(cache_enabled=False)
+    for event in events:
+        response = requests.get(client.summary_url(event), timeout=ESPNClient.TIMEOUT)
+        response.raise_for_status()
+        path = os.path.join(out_dir, f"{event}.json")
+        with open(path, 'wb') as f:
+            f.write(response.content)
+        print(f"Saved {path} ({len(response.content) / 1024:.0f} KB)")
+
+
+def load_bodies(summaries_dir: str, games: int, padding: int) -> list[bytes]:
+    """Recorded summary bodies, or synthetic ones from the stub's generator."""
+    if summaries_dir:
+        bodies = []
+        for path in sorted(glob.glob(os.path.join(summaries_dir, '*.json'))):
+            with open(path, 'rb') as f:
+                bodies.append(f.read())
+        return bodies
+    game_ids = week_game_ids(SEASON, WEEK, games / 16)
+    return [json.dumps(summary_payload(str(g), padding)).encode() for g in game_ids]
+
+
+def decoders() -> dict:
+    client = ESPNClient(cache_enabled=False, rate_limit_seconds=0)
+    result = {'json': json.loads}
+    if ORJSON_AVAILABLE:
+        import orjson
+        result['orjson'] = orjson.loads
+    result['client'] = lambda body: client._decode(body, trim=True)
+    result['client+parse'] = lambda body: PlayTable.from_summary(client._decode(body, trim=True))
+    return result
+
+
+def measure(decode, bodies: list[bytes], repeat: int) -> tuple[float, int, int]:
+    """(ms per summary, peak traced KB per summary, retained KB per summary)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for body in bodies:
+            decode(body)
+    ms = (time.perf_counter() - start) / (repeat * len(bodies)) * 1000
+
+    gc.collect()
+    peaks = []
+    for body in bodies:
+        tracemalloc.start()
+        decode(body)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    retained = [approx_size(decode(body)) for body in bodies]
+    return ms, sum(peaks) // len(peaks) // 1024, sum(retained) // len(retained) // 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ESPN summary decoding benchmark')
+    parser.add_argument('--summaries', default=None,
+                       help='Directory of recorded summary JSON files (default: synthetic)')
+    parser.add_argument('--games', type=int, default=16,
+                       help='Synthetic summaries to decode')
+    parser.add_argument('--padding', type=int, default=3,
+                       help='Run plays before each scripted play in synthetic summaries')
+    parser.add_argument('--repeat', type=int, default=5,
+                       help='Timed passes over the summaries')
+    parser.add_argument('--record', default=None,
+                       help='Save live summaries for --events into this directory and exit')
+    parser.add_argument('--events', default='',
+                       help='Comma-separated ESPN game IDs to record')
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record, [e for e in args.events.split(',') if e])
+        return
+
+    bodies = load_bodies(args.summaries, args.games, args.padding)
+    if not bodies:
+        sys.exit(f"No summaries found in {args.summaries}")
+    size_kb = sum(len(b) for b in bodies) / len(bodies) / 1024
+    print(f"{len(bodies)} summaries, {size_kb:.0f} KB of JSON each"
+          + ("" if ORJSON_AVAILABLE else " (orjson not installed)"))
+
+    print(f"\n{'decoder':<14}{'ms/summary':>12}{'peak KB':>10}{'held KB':>10}")
+    for name, decode in decoders().items():
+        ms, peak_kb, held_kb = measure(decode, bodies, args.repeat)
+        print(f"{name:<14}{ms:>12.2f}{peak_kb:>10}{held_kb:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: ESPN HTTP transport, one-shot requests.get vs the pooled session.
+
+Fetches scoreboards and game summaries from the local ESPN stub (stubs.py)
+with caching and rate limiting off, first the way ESPNClient used to (a
+module-level requests.get per URL: new connection every time, no retries)
+and then through ESPNClient's pooled session (keep-alive, retry/backoff).
+Reports requests/sec, TCP connections opened and how many fetches came back
+empty when the stub fails every Nth request (--fail-every).
+
+The stub speaks plain HTTP on localhost, so the saving from reusing
+connections excludes the TLS handshake the real API would add.
+
+Usage (from the playgenerate directory):
+    python benchmarks/bench_espn_http.py --requests 500 --threads 1,4
+    python benchmarks/bench_espn_http.py --fail-every 20
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PLAYGEN_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+import requests
+
+from enrichment.espn_client import ESPNClient
+
+from stubs import ESPNStub
+from synthetic import week_game_ids
+
+SEASON = 2023
+WEEK = 1
+
+
+def one_shot_get(url: str):
+    """The previous transport: a fresh connection per request, no retries."""
+    try:
+        response = requests.get(url, timeout=30)
+        response.raise_for_status()
+        return response.json()
+    except requests.RequestException:
+        return None
+
+
+def week_urls(base_url: str, count: int) -> list[str]:
+    """Scoreboard and summary URLs for the synthetic week, cycled to count."""
+    game_ids = [str(g) for g in week_game_ids(SEASON, WEEK, 1)]
+    urls = [f"{base_url}/scoreboard?dates={d}" for d in sorted({g[:8] for g in game_ids})]
+    urls += [f"{base_url}/summary?event={g}" for g in game_ids]
+    return [urls[i % len(urls)] for i in range(count)]
+
+
+def run(fetch, urls: list[str], threads: int) -> tuple[float, int]:
+    """Fetch every URL; return (seconds, empty results)."""
+    start = time.perf_counter()
+    if threads == 1:
+        results = [fetch(url) for url in urls]
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = list(pool.map(fetch, urls))
+    return time.perf_counter() - start, sum(1 for r in results if r is None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ESPN HTTP transport benchmark')
+    parser.add_argument('--requests', type=int, default=500,
+                       help='Requests per run')
+    parser.add_argument('--threads', default='1,4',
+                       help='Comma-separated concurrency levels')
+    parser.add_argument('--latency', type=float, default=0.0,
+                       help='Seconds the stub waits per request')
+    parser.add_argument('--fail-every', type=int, default=0,
+                       help='Stub answers every Nth request with 503')
+    args = parser.parse_args()
+
+    print(f"{'transport':<12}{'threads':>8}{'req/s':>10}{'conns':>8}{'empty':>8}")
+    for threads in [int(t) for t in args.threads.split(',')]:
+        for name in ('requests.get', 'session'):
+            with ESPNStub(latency=args.latency, fail_every=args.fail_every) as espn:
+                urls = week_urls(espn.base_url, args.requests)
+                if name == 'session':
+                    client = ESPNClient(cache_enabled=False, rate_limit_seconds=0)
+                    client.BASE_URL = espn.base_url
+                    # Retries shouldn't stall the benchmark
+                    client.session.get_adapter(espn.base_url).max_retries.backoff_factor = 0
+                    fetch = client._get
+                else:
+                    fetch = one_shot_get
+                seconds, empty = run(fetch, urls, threads)
+                print(f"{name:<12}{threads:>8}{len(urls) / seconds:>10.1f}"
+                      f"{espn.connections:>8}{empty:>8}")
+
+
+if __name__ == "__main__":
+    main()
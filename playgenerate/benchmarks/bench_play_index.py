@@ -0,0 +1,94 @@
+"""
+Benchmark: per-play tracking lookups, boolean mask vs PlayIndex.
+
+Builds synthetic tracking frames of 1, 10 and 100 weeks and times fetching a
+play's rows with the old full-frame mask and with a PlayIndex slice. Mask
+cost grows with the number of rows; index lookups stay flat.
+
+Usage (from the playgenerate directory):
+    python benchmarks/bench_play_index.py --scales 1,10,100
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+from tracking.play_index import PlayIndex
+
+
+def synthetic_tracking(weeks: int, games_per_week: int, plays_per_game: int,
+                       rows_per_play: int, seed: int = 0) -> pd.DataFrame:
+    """Build a lean tracking frame (keys, frame_id, kinematics) of the given size."""
+    rng = np.random.default_rng(seed)
+    num_plays = weeks * games_per_week * plays_per_game
+
+    game_ids = 2023090700 + np.arange(weeks * games_per_week).repeat(plays_per_game)
+    play_ids = np.tile(np.arange(plays_per_game) * 25 + 50, weeks * games_per_week)
+    rows = num_plays * rows_per_play
+
+    return pd.DataFrame({
+        'game_id': game_ids.repeat(rows_per_play),
+        'play_id': play_ids.repeat(rows_per_play),
+        'frame_id': np.tile(np.arange(rows_per_play) % 30 + 1, num_plays),
+        'x': rng.random(rows, dtype=np.float32) * 120,
+        'y': rng.random(rows, dtype=np.float32) * 53.3,
+        's': rng.random(rows, dtype=np.float32) * 10,
+    })
+
+
+def time_lookups(fn, keys: list[tuple[int, int]]) -> float:
+    """Average seconds per lookup over the given play keys."""
+    start = time.perf_counter()
+    for game_id, play_id in keys:
+        fn(game_id, play_id)
+    return (time.perf_counter() - start) / len(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-play lookup benchmark')
+    parser.add_argument('--scales', default='1,10,100',
+                       help='Comma-separated numbers of weeks to benchmark')
+    parser.add_argument('--games-per-week', type=int, default=16)
+    parser.add_argument('--plays-per-game', type=int, default=60)
+    parser.add_argument('--rows-per-play', type=int, default=100)
+    parser.add_argument('--mask-samples', type=int, default=20,
+                       help='Lookups timed with the boolean mask')
+    parser.add_argument('--index-samples', type=int, default=2000,
+                       help='Lookups timed with the PlayIndex')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+
+    print(f"{'weeks':>6} {'rows':>12} {'mask ms':>10} {'build s':>9} {'index us':>10} {'speedup':>9}")
+    for weeks in [int(w) for w in args.scales.split(',')]:
+        df = synthetic_tracking(weeks, args.games_per_week, args.plays_per_game, args.rows_per_play)
+
+        start = time.perf_counter()
+        index = PlayIndex(df)
+        build_seconds = time.perf_counter() - start
+
+        all_keys = list(index.keys())
+        picks = rng.integers(0, len(all_keys), max(args.mask_samples, args.index_samples))
+        keys = [all_keys[i] for i in picks]
+
+        def mask_lookup(game_id, play_id):
+            return df[(df['game_id'] == game_id) & (df['play_id'] == play_id)]
+
+        mask_seconds = time_lookups(mask_lookup, keys[:args.mask_samples])
+        index_seconds = time_lookups(index.get, keys[:args.index_samples])
+
+        print(f"{weeks:>6} {len(df):>12,} {mask_seconds * 1e3:>10.2f} {build_seconds:>9.2f} "
+              f"{index_seconds * 1e6:>10.1f} {mask_seconds / index_seconds:>8.0f}x")
+
+        del df, index
+
+
+if __name__ == "__main__":
+    main()
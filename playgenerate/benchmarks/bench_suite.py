@@ -0,0 +1,208 @@
+"""
+Benchmark: end-to-end pipeline steps at 1x, 10x and 100x a real week.
+
+Generates synthetic BDB weeks (synthetic.py, cached under --work-dir) and
+times each step the pipeline runs, with ESPN, Gemini and Veo replaced by the
+local stubs in stubs.py:
+
+    load            read the week's tracking CSV (lean dtypes applied)
+    unique plays    extract_unique_plays on the loaded frame
+    match_play      PlayMatcher.match_play per play against the ESPN stub,
+                    starting from cold caches
+    index           PlayIndex + per-player features for the whole week
+    scene format    SceneGenerator.generate_description per play (formation
+                    analysis, tracking summary, prompt) with a stub model
+    relay           kaggle_evaluation relay serialize + deserialize of a
+                    play's gateway batch (skipped if grpc isn't installed)
+
+Per-play steps are timed over --plays plays sampled across the week. A 100x week is
+about 25M rows (3.7 GB of CSV); it takes several minutes to generate the
+first time and needs enough RAM to load.
+
+Usage (from the playgenerate directory):
+    python benchmarks/bench_suite.py --scales 1,10,100
+    python benchmarks/bench_suite.py --scales 1 --espn-latency 0.05 --json results.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import warnings
+from contextlib import contextmanager
+from dataclasses import asdict
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PLAYGEN_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+from pipeline import NFLPipeline
+from enrichment.espn_client import ESPNClient
+from enrichment.game_mapper import GameMapper
+from enrichment.play_matcher import PlayMatcher
+
+from stubs import ESPNStub, StubGeminiModel
+from synthetic import ensure_dataset
+
+# The relay ships with the competition data and needs grpc
+try:
+    sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'data', 'nfl-big-data-bowl-2026-prediction'))
+    import polars as pl
+    from kaggle_evaluation.core import relay
+    from kaggle_evaluation.core.generated import kaggle_evaluation_pb2
+    RELAY_AVAILABLE = True
+except ImportError:
+    RELAY_AVAILABLE = False
+
+SEASON = 2023
+WEEK = 1
+
+
+@contextmanager
+def quiet():
+    """Silence pipeline progress output."""
+    with open(os.devnull, 'w') as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            yield
+        finally:
+            sys.stdout = stdout
+
+
+def timed(fn, *args, **kwargs):
+    """Run fn and return (result, seconds)."""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def relay_roundtrip(batch) -> None:
+    """Serialize a gateway batch to protobuf bytes and back, like a relay call."""
+    wire = relay._serialize(batch).SerializeToString()
+    relay._deserialize(kaggle_evaluation_pb2.Payload.FromString(wire))
+
+
+def run_scale(scale: float, work_dir: str, sample: int, espn_latency: float) -> dict:
+    """Time every step on a week of the given scale."""
+    data_dir = os.path.join(work_dir, f"{scale:g}x")
+    ensure_dataset(data_dir, SEASON, WEEK, scale)
+    filename = f"input_{SEASON}_w{WEEK:02d}.csv"
+
+    timings = {}
+    with quiet():
+        pipeline = NFLPipeline(data_dir, os.path.join(data_dir, 'output'), use_store=False)
+        tracking, timings['load'] = timed(pipeline.load_tracking_data, filename)
+        plays, timings['unique plays'] = timed(pipeline.extract_unique_plays, tracking)
+    # Spread the sample over the week's games, in file order
+    sample_plays = plays.sample(min(sample, len(plays)), random_state=0).sort_index()
+
+    # Fresh client, mapper and matcher so every game is fetched once
+    with ESPNStub(latency=espn_latency) as espn, quiet():
+        client = ESPNClient(rate_limit_seconds=0)
+        client.BASE_URL = espn.base_url
+        matcher = PlayMatcher(client, GameMapper(client))
+
+        enriched = []
+        start = time.perf_counter()
+        for idx, row in sample_plays.iterrows():
+            match = matcher.match_play(
+                game_id=str(row['game_id']),
+                play_id=int(row['play_id']),
+                absolute_yardline=int(row['absolute_yardline']),
+                play_direction=row['play_direction'],
+                ball_land_x=float(row['ball_land_x']),
+                ball_land_y=float(row['ball_land_y']),
+                num_frames=int(row['num_frames']),
+                play_sequence_hint=int(idx)
+            )
+            if match:
+                enriched.append(asdict(match))
+        timings['match_play'] = (time.perf_counter() - start) / len(sample_plays)
+        espn_requests = espn.requests
+
+    with quiet():
+        play_index, index_seconds = timed(pipeline.build_play_index, tracking)
+        feature_index, features_seconds = timed(pipeline.build_feature_index, play_index)
+    timings['index'] = index_seconds + features_seconds
+
+    generator = pipeline.scene_generator
+    generator.model = StubGeminiModel()
+    start = time.perf_counter()
+    for play in enriched:
+        generator.generate_description(
+            play,
+            play_index.get(play['game_id'], play['play_id']),
+            feature_index.get(play['game_id'], play['play_id'])
+        )
+    timings['scene format'] = (time.perf_counter() - start) / max(len(enriched), 1)
+
+    if RELAY_AVAILABLE:
+        batches = []
+        for row in sample_plays.itertuples(index=False):
+            frames = pl.from_pandas(play_index.get(row.game_id, row.play_id).astype(
+                {c: str for c in ('play_direction', 'player_name', 'player_position',
+                                  'player_side', 'player_role', 'player_height',
+                                  'player_birth_date')}
+            ))
+            batches.append((frames.select('game_id', 'play_id', 'nfl_id', 'frame_id'), frames))
+        start = time.perf_counter()
+        for batch in batches:
+            relay_roundtrip(batch)
+        timings['relay'] = (time.perf_counter() - start) / len(batches)
+
+    return {
+        'scale': scale,
+        'rows': len(tracking),
+        'plays': len(plays),
+        'matched': len(enriched),
+        'sampled': len(sample_plays),
+        'espn_requests': espn_requests,
+        'timings': timings,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='End-to-end pipeline benchmark suite')
+    parser.add_argument('--scales', default='1,10,100',
+                       help='Comma-separated multiples of a real week')
+    parser.add_argument('--work-dir', default='output/bench_data',
+                       help='Where synthetic datasets are generated and reused')
+    parser.add_argument('--plays', type=int, default=200,
+                       help='Plays sampled for the per-play steps')
+    parser.add_argument('--espn-latency', type=float, default=0.0,
+                       help='Seconds the ESPN stub waits per request')
+    parser.add_argument('--json', default=None,
+                       help='Also write the results to this JSON file')
+    args = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    work_dir = os.path.join(PLAYGEN_DIR, args.work_dir)
+
+    results = []
+    for scale in [float(s) for s in args.scales.split(',')]:
+        result = run_scale(scale, work_dir, args.plays, args.espn_latency)
+        results.append(result)
+        print(f"{scale:g}x: {result['rows']:,} rows, {result['plays']:,} plays, "
+              f"{result['matched']}/{result['sampled']} sampled plays matched, "
+              f"{result['espn_requests']} ESPN requests")
+
+    header = ''.join(f"{format(r['scale'], 'g') + 'x':>12}" for r in results)
+    print(f"\n{'step':<14}{header}")
+    for step, unit in (('load', 's'), ('unique plays', 's'), ('index', 's'),
+                       ('match_play', 'ms/play'), ('scene format', 'ms/play'), ('relay', 'ms/play')):
+        if step not in results[0]['timings']:
+            print(f"{step:<14}{'(relay unavailable: install grpcio)':>24}")
+            continue
+        scale_factor = 1000 if unit == 'ms/play' else 1
+        cells = ''.join(f"{r['timings'][step] * scale_factor:>12.3f}" for r in results)
+        print(f"{step:<14}{cells}  {unit}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
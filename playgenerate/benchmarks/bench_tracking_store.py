@@ -0,0 +1,101 @@
+"""
+Benchmark: CSV vs columnar store tracking loads.
+
+Compares load time and peak RSS for a full week of tracking data read from
+the raw CSV and from the partitioned Parquet store, both for all columns and
+for the column projection used by extract_unique_plays.
+
+Each variant runs in a fresh interpreter so peak RSS is measured in isolation.
+
+Usage (from the playgenerate directory):
+    python benchmarks/bench_tracking_store.py --week 1
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+VARIANTS = ['csv_full', 'store_full', 'csv_plays', 'store_plays']
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports KB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_variant(variant: str, csv_path: str, store_dir: str, season: int, week: int) -> dict:
+    """Load the week once with the given variant and report timing/memory."""
+    import pandas as pd
+    from tracking.store import TrackingStore
+    from pipeline import NFLPipeline
+
+    baseline_mb = _peak_rss_mb()
+    columns = NFLPipeline.PLAY_COLUMNS if variant.endswith('_plays') else None
+
+    start = time.perf_counter()
+    if variant.startswith('csv'):
+        df = pd.read_csv(csv_path, usecols=columns)
+    else:
+        df = TrackingStore(store_dir).read_week(season, week, columns=columns)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'variant': variant,
+        'rows': len(df),
+        'columns': len(df.columns),
+        'seconds': elapsed,
+        'peak_rss_mb': _peak_rss_mb(),
+        'load_rss_mb': _peak_rss_mb() - baseline_mb,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CSV vs columnar store load benchmark')
+    parser.add_argument('--data-dir', default='data/nfl-big-data-bowl-2026-prediction',
+                       help='Directory containing Big Data Bowl data')
+    parser.add_argument('--store-dir', default='output/tracking_store',
+                       help='Columnar tracking store directory')
+    parser.add_argument('--season', type=int, default=2023)
+    parser.add_argument('--week', type=int, default=1)
+    parser.add_argument('--child', choices=VARIANTS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    csv_path = os.path.join(PLAYGEN_DIR, args.data_dir, 'train',
+                            f"input_{args.season}_w{args.week:02d}.csv")
+    store_dir = os.path.join(PLAYGEN_DIR, args.store_dir)
+
+    if args.child:
+        result = run_variant(args.child, csv_path, store_dir, args.season, args.week)
+        print(json.dumps(result))
+        return
+
+    from tracking.store import TrackingStore
+
+    store = TrackingStore(store_dir)
+    if not store.has_week(args.season, args.week, csv_path):
+        start = time.perf_counter()
+        store.convert_csv(csv_path, args.season, args.week)
+        print(f"One-time conversion: {time.perf_counter() - start:.2f}s")
+
+    print(f"\n{'variant':<12} {'rows':>10} {'cols':>5} {'seconds':>9} {'peak MB':>9} {'load MB':>9}")
+    for variant in VARIANTS:
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child', variant,
+             '--data-dir', args.data_dir, '--store-dir', args.store_dir,
+             '--season', str(args.season), '--week', str(args.week)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        r = json.loads(output.strip().splitlines()[-1])
+        print(f"{r['variant']:<12} {r['rows']:>10} {r['columns']:>5} {r['seconds']:>9.3f} "
+              f"{r['peak_rss_mb']:>9.1f} {r['load_rss_mb']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""
+Local stand-ins for ESPN, Gemini and Veo.
+
+ESPNStub is a real HTTP server on localhost serving ESPN-shaped scoreboard
+and summary JSON for the synthetic games in synthetic.py, so the benchmarks
+exercise the actual ESPNClient request, JSON decoding and caching path.
+StubGeminiModel and StubVeoClient replace the SDK objects on a
+SceneGenerator / VideoGenerator. Each stub can add a fixed latency to
+approximate the real service. ESPNStub sends an ETag with every response,
+answers matching If-None-Match requests with 304 Not Modified and can fail
+every Nth request with a 503 to exercise retries.
+
+Usage:
+    with ESPNStub(latency=0.05) as espn:
+        client = ESPNClient(rate_limit_seconds=0)
+        client.BASE_URL = espn.base_url
+        ...
+
+    pipeline.scene_generator.model = StubGeminiModel(latency=1.0)
+    pipeline.video_generator.client = StubVeoClient(latency=5.0)
+"""
+
+import datetime as dt
+import functools
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from synthetic import GAMES_PER_DATE, game_teams, play_script, week_game_ids
+
+
+BASE_PATH = '/apis/site/v2/sports/football/nfl'
+
+
+def _competitors(game_id: int, home_score: int = 24, away_score: int = 17) -> list[dict]:
+    (home_name, home_abbrev), (away_name, away_abbrev) = game_teams(game_id)
+    return [
+        {'homeAway': 'home', 'score': str(home_score),
+         'team': {'displayName': home_name, 'abbreviation': home_abbrev}},
+        {'homeAway': 'away', 'score': str(away_score),
+         'team': {'displayName': away_name, 'abbreviation': away_abbrev}},
+    ]
+
+
+def _status() -> dict:
+    return {'type': {'name': 'STATUS_FINAL', 'completed': True}}
+
+
+def _venue(game_id: int) -> dict:
+    home_name = game_teams(game_id)[0][0]
+    return {'fullName': f"{home_name.split()[-1]} Stadium"}
+
+
+def scoreboard_payload(date: str) -> dict:
+    """ESPN scoreboard for a date (YYYYMMDD): its synthetic games in game_id order."""
+    day = dt.datetime.strptime(date, '%Y%m%d')
+    events = []
+    for number in range(GAMES_PER_DATE):
+        game_id = int(date) * 100 + number
+        events.append({
+            'id': str(game_id),
+            'date': day.strftime('%Y-%m-%dT17:00Z'),
+            'status': _status(),
+            'competitions': [{
+                'competitors': _competitors(game_id),
+                'venue': _venue(game_id),
+            }],
+        })
+    return {'events': events}
+
+
+def week_scoreboard_payload(season: int, week: int) -> dict:
+    """ESPN scoreboard for a season week: every date's games of a 1x synthetic week."""
+    dates = dict.fromkeys(str(game_id // 100) for game_id in week_game_ids(season, week))
+    return {'events': [event for date in dates for event in scoreboard_payload(date)['events']]}
+
+
+def summary_payload(event: str, padding_plays: int = 1) -> dict:
+    """
+    ESPN game summary for a synthetic game.
+
+    Every scripted passing play appears in its drive, preceded by
+    padding_plays run plays, and the summary carries a bulky boxscore like
+    the real one, so decoding costs are realistic.
+    """
+    game_id = int(event)
+    home_abbrev = game_teams(game_id)[0][1]
+    drives = []
+    plays = []
+    home_score = away_score = 0
+
+    for i, play in enumerate(play_script(game_id)):
+        start = {
+            'down': play.down,
+            'distance': play.distance,
+            'yardLine': 110 - play.absolute_yardline,
+            'team': {'abbreviation': home_abbrev},
+        }
+        for pad in range(padding_plays):
+            plays.append({
+                'id': f"{game_id}{i:03d}{pad}",
+                'period': {'number': play.quarter},
+                'clock': {'displayValue': play.clock},
+                'start': {**start, 'yardLine': max(1, start['yardLine'] - 4)},
+                'text': "RB up the middle for 4 yards.",
+                'type': {'text': 'Rush'},
+                'scoringPlay': False,
+                'homeScore': home_score,
+                'awayScore': away_score,
+            })
+        plays.append({
+            'id': f"{game_id}{i:03d}9",
+            'period': {'number': play.quarter},
+            'clock': {'displayValue': play.clock},
+            'start': start,
+            'text': play.text,
+            'type': {'text': 'Pass Reception' if 'incomplete' not in play.text else 'Pass Incompletion'},
+            'scoringPlay': False,
+            'homeScore': home_score,
+            'awayScore': away_score,
+        })
+        if i % 8 == 7:
+            drives.append({'id': str(len(drives)), 'plays': plays})
+            plays = []
+            home_score += 7 if len(drives) % 2 else 0
+            away_score += 3 if len(drives) % 3 == 0 else 0
+    if plays:
+        drives.append({'id': str(len(drives)), 'plays': plays})
+
+    boxscore = {
+        'players': [
+            {
+                'team': {'abbreviation': abbrev},
+                'statistics': [
+                    {
+                        'name': category,
+                        'athletes': [
+                            {'athlete': {'id': str(n), 'displayName': f"Player {n}"},
+                             'stats': [str((n * 7 + k) % 97) for k in range(12)]}
+                            for n in range(60)
+                        ],
+                    }
+                    for category in ('passing', 'rushing', 'receiving', 'defensive', 'kicking')
+                ],
+            }
+            for _, abbrev in game_teams(game_id)
+        ]
+    }
+
+    return {
+        'header': {
+            'id': event,
+            'competitions': [{
+                'date': dt.datetime.strptime(event[:8], '%Y%m%d').strftime('%Y-%m-%dT17:00Z'),
+                'competitors': _competitors(game_id, home_score, away_score),
+                'status': _status(),
+            }],
+        },
+        'gameInfo': {'venue': _venue(game_id)},
+        'drives': {'previous': drives},
+        'boxscore': boxscore,
+        'winprobability': [
+            {'playId': play['id'], 'homeWinPercentage': 0.5, 'tiePercentage': 0.0}
+            for drive in drives for play in drive['plays']
+        ],
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _response_body(path: str) -> Optional[tuple[bytes, str]]:
+    """Encoded JSON body and ETag for a request path (built once per path)."""
+    url = urlparse(path)
+    query = parse_qs(url.query)
+    if url.path == f"{BASE_PATH}/scoreboard" and 'week' in query and 'dates' in query:
+        payload = week_scoreboard_payload(int(query['dates'][0]), int(query['week'][0]))
+    elif url.path == f"{BASE_PATH}/scoreboard" and 'dates' in query:
+        payload = scoreboard_payload(query['dates'][0])
+    elif url.path == f"{BASE_PATH}/summary" and 'event' in query:
+        payload = summary_payload(query['event'][0])
+    else:
+        return None
+
+    body = json.dumps(payload).encode()
+    return body, '"{}"'.format(hashlib.sha1(body).hexdigest())
+
+
+class ESPNStub:
+    """Local HTTP server answering ESPN scoreboard and summary requests."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        fail_every: int = 0
+    ):
+        """
+        Initialize the stub (call start() or use it as a context manager).
+
+        Args:
+            latency: Seconds to wait before answering each request
+            host: Interface to bind
+            port: Port to listen on (0 picks a free one)
+            fail_every: Answer every Nth request with 503 (0 never fails)
+        """
+        self.latency = latency
+        self.fail_every = fail_every
+        self.requests = 0
+        self.failures = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """URL to use as ESPNClient.BASE_URL."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{BASE_PATH}"
+
+    def _handler(self) -> type:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body go out in separate writes; without this,
+            # keep-alive clients stall on Nagle + delayed ACK for small bodies
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.requests += 1
+                    fail = stub.fail_every and stub.requests % stub.fail_every == 0
+                    if fail:
+                        stub.failures += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if fail:
+                    self.send_response(503)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                response = _response_body(self.path)
+                if response is None:
+                    self.send_error(404)
+                    return
+
+                body, etag = response
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> 'ESPNStub':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'ESPNStub':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class StubGeminiModel:
+    """Stands in for genai.GenerativeModel in a SceneGenerator."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def generate_content(self, prompt: str) -> SimpleNamespace:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return SimpleNamespace(
+            text=f"All-22 view. Stub scene {self.calls} from a {len(prompt)}-character prompt."
+        )
+
+
+class _StubVideo:
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as f:
+            f.write(b'\x00\x00\x00\x18ftypmp42stub')
+
+
+class StubVeoClient:
+    """Stands in for genai.Client in a VideoGenerator; videos finish on submit."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+        self.models = SimpleNamespace(generate_videos=self._generate_videos)
+        self.operations = SimpleNamespace(get=lambda operation: operation)
+        self.files = SimpleNamespace(download=lambda file: None)
+
+    def _generate_videos(self, model: str, prompt: str, config=None) -> SimpleNamespace:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return SimpleNamespace(
+            done=True,
+            response=SimpleNamespace(generated_videos=[SimpleNamespace(video=_StubVideo())]),
+        )
@@ -0,0 +1,358 @@
+"""
+Synthetic Big Data Bowl 2026 data at configurable scale.
+
+Writes BDB-shaped files for benchmarks and local runs without the Kaggle
+download:
+
+    train/input_{season}_w{NN}.csv    pre-pass tracking (all BDB 2026 columns)
+    train/output_{season}_w{NN}.csv   post-pass positions of predicted players
+    test_input.csv / test.csv         a few plays in the gateway's test layout
+
+A real week has about 16 games of ~50 passing plays, each with ~12 tracked
+players over ~25 pre-pass frames (roughly 250k rows). scale=10 writes ten
+times as many games into the same week file. Games are generated and written
+a block at a time, so memory stays flat at any scale.
+
+Each game's play-by-play script (yard line, down, distance, clock) comes
+from play_script(), seeded by the game_id. The ESPN stub in stubs.py serves
+the same scripts, so PlayMatcher finds real matches against synthetic data.
+
+Usage (from the playgenerate directory):
+    python benchmarks/synthetic.py --out-dir output/bench_data/1x --scale 1
+"""
+
+import argparse
+import datetime as dt
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+GAMES_PER_WEEK = 16
+GAMES_PER_DATE = 8
+GAME_BLOCK = 16  # games generated and written per chunk
+
+TEAMS = [
+    ("Arizona Cardinals", "ARI"), ("Atlanta Falcons", "ATL"), ("Baltimore Ravens", "BAL"),
+    ("Buffalo Bills", "BUF"), ("Carolina Panthers", "CAR"), ("Chicago Bears", "CHI"),
+    ("Cincinnati Bengals", "CIN"), ("Cleveland Browns", "CLE"), ("Dallas Cowboys", "DAL"),
+    ("Denver Broncos", "DEN"), ("Detroit Lions", "DET"), ("Green Bay Packers", "GB"),
+    ("Houston Texans", "HOU"), ("Indianapolis Colts", "IND"), ("Jacksonville Jaguars", "JAX"),
+    ("Kansas City Chiefs", "KC"), ("Las Vegas Raiders", "LV"), ("Los Angeles Chargers", "LAC"),
+    ("Los Angeles Rams", "LAR"), ("Miami Dolphins", "MIA"), ("Minnesota Vikings", "MIN"),
+    ("New England Patriots", "NE"), ("New Orleans Saints", "NO"), ("New York Giants", "NYG"),
+    ("New York Jets", "NYJ"), ("Philadelphia Eagles", "PHI"), ("Pittsburgh Steelers", "PIT"),
+    ("San Francisco 49ers", "SF"), ("Seattle Seahawks", "SEA"), ("Tampa Bay Buccaneers", "TB"),
+    ("Tennessee Titans", "TEN"), ("Washington Commanders", "WAS"),
+]
+
+FIRST_NAMES = ["Josh", "Travis", "Justin", "Tyreek", "Davante", "Cooper", "Micah", "Jalen",
+               "Patrick", "Derrick", "Aaron", "Sauce", "Minkah", "Fred", "Darius", "Trevon"]
+LAST_NAMES = ["Allen", "Kelce", "Jefferson", "Hill", "Adams", "Kupp", "Parsons", "Ramsey",
+              "Mahomes", "Henry", "Donald", "Gardner", "Fitzpatrick", "Warner", "Slay", "Diggs"]
+
+# Pre-pass tracked players per play: offense first, then defense
+OFFENSE_POSITIONS = ['QB', 'WR', 'WR', 'TE', 'RB', 'WR']
+DEFENSE_POSITIONS = ['CB', 'CB', 'FS', 'SS', 'OLB', 'ILB', 'CB']
+
+INPUT_COLUMNS = [
+    'game_id', 'play_id', 'player_to_predict', 'nfl_id', 'frame_id', 'play_direction',
+    'absolute_yardline_number', 'player_name', 'player_height', 'player_weight',
+    'player_birth_date', 'player_position', 'player_side', 'player_role', 'x', 'y',
+    's', 'a', 'dir', 'o', 'num_frames_output', 'ball_land_x', 'ball_land_y',
+]
+
+
+@dataclass
+class ScriptedPlay:
+    """One passing play as both BDB and ESPN see it."""
+    play_id: int
+    absolute_yardline: int
+    play_direction: str
+    quarter: int
+    clock: str
+    down: int
+    distance: int
+    text: str
+
+
+def week_game_ids(season: int, week: int, scale: float = 1.0) -> list[int]:
+    """
+    BDB game_ids (YYYYMMDDNN) for a synthetic week.
+
+    Games are spread over dates GAMES_PER_DATE at a time, so ESPN
+    scoreboards stay realistically sized at any scale.
+    """
+    num_games = max(1, int(round(GAMES_PER_WEEK * scale)))
+    start = dt.date(season, 9, 7) + dt.timedelta(weeks=week - 1)
+    return [
+        int((start + dt.timedelta(days=g // GAMES_PER_DATE)).strftime('%Y%m%d')) * 100
+        + g % GAMES_PER_DATE
+        for g in range(num_games)
+    ]
+
+
+def game_teams(game_id: int) -> tuple[tuple[str, str], tuple[str, str]]:
+    """(home, away) (name, abbreviation) pairs for a game."""
+    rng = np.random.default_rng(game_id)
+    home, away = rng.choice(len(TEAMS), size=2, replace=False)
+    return TEAMS[home], TEAMS[away]
+
+
+def play_script(game_id: int) -> list[ScriptedPlay]:
+    """
+    Deterministic passing-play script for a game.
+
+    Args:
+        game_id: BDB game_id (seeds the generator)
+
+    Returns:
+        ScriptedPlays in game order
+    """
+    rng = np.random.default_rng(game_id)
+    rng.choice(len(TEAMS), size=2, replace=False)  # keep in step with game_teams
+
+    num_plays = int(rng.integers(40, 65))
+    play_ids = 55 + np.cumsum(rng.integers(20, 120, num_plays))
+    yardlines = rng.integers(15, 106, num_plays)
+    directions = rng.choice(['left', 'right'], num_plays)
+    downs = rng.choice([1, 2, 3, 4], num_plays, p=[0.45, 0.3, 0.22, 0.03])
+    distances = rng.integers(1, 16, num_plays)
+    seconds_left = np.sort(rng.integers(0, 3600, num_plays))[::-1]
+    receivers = rng.choice(LAST_NAMES, num_plays)
+    gains = rng.integers(-3, 35, num_plays)
+
+    plays = []
+    for i in range(num_plays):
+        quarter = min(4, 4 - int(seconds_left[i]) // 900)
+        clock = int(seconds_left[i]) % 900
+        outcome = f"pass short right to {receivers[i]} for {gains[i]} yards" if gains[i] > 0 \
+            else f"pass incomplete deep left intended for {receivers[i]}"
+        plays.append(ScriptedPlay(
+            play_id=int(play_ids[i]),
+            absolute_yardline=int(yardlines[i]),
+            play_direction=str(directions[i]),
+            quarter=quarter,
+            clock=f"{clock // 60}:{clock % 60:02d}",
+            down=int(downs[i]),
+            distance=int(distances[i]),
+            text=f"(Shotgun) QB {outcome}.",
+        ))
+    return plays
+
+
+def generate_games(game_ids: list[int], seed: int = 0) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Tracking input and output rows for a block of games.
+
+    Args:
+        game_ids: Games to generate
+        seed: Seed for player motion (play scripts are seeded by game_id)
+
+    Returns:
+        (input rows in INPUT_COLUMNS, output rows with game_id, play_id,
+        nfl_id, frame_id, x, y)
+    """
+    rng = np.random.default_rng([seed, game_ids[0]])
+
+    # One row per (play, player)
+    keys = {k: [] for k in ('game_id', 'play_id', 'yardline', 'direction', 'frames',
+                            'out_frames', 'player', 'side', 'role', 'position', 'predict')}
+    for game_id in game_ids:
+        for play in play_script(game_id):
+            n_off = int(rng.integers(4, len(OFFENSE_POSITIONS) + 1))
+            n_def = int(rng.integers(5, len(DEFENSE_POSITIONS) + 1))
+            frames = int(rng.integers(15, 40))
+            out_frames = int(rng.integers(5, 30))
+            target = int(rng.integers(1, n_off))
+
+            for k in range(n_off + n_def):
+                offense = k < n_off
+                role = ('Passer' if k == 0 else 'Targeted Receiver' if k == target
+                        else 'Other Route Runner') if offense else 'Defensive Coverage'
+                keys['game_id'].append(game_id)
+                keys['play_id'].append(play.play_id)
+                keys['yardline'].append(play.absolute_yardline)
+                keys['direction'].append(play.play_direction)
+                keys['frames'].append(frames)
+                keys['out_frames'].append(out_frames)
+                keys['player'].append(k if offense else len(OFFENSE_POSITIONS) + k - n_off)
+                keys['side'].append('Offense' if offense else 'Defense')
+                keys['role'].append(role)
+                keys['position'].append(
+                    OFFENSE_POSITIONS[k] if offense else DEFENSE_POSITIONS[k - n_off]
+                )
+                keys['predict'].append(role in ('Targeted Receiver', 'Defensive Coverage'))
+
+    players = pd.DataFrame(keys)
+    n = len(players)
+
+    # Per-player identity (stable per game and slot)
+    slot = players['player'].to_numpy()
+    game = players['game_id'].to_numpy()
+    nfl_id = (37000 + (game % 1000) * 20 + slot).astype(np.int64)
+    names = np.array([f"{f} {l}" for f in FIRST_NAMES for l in LAST_NAMES])
+    heights = np.array(['5-10', '5-11', '6-0', '6-1', '6-2', '6-3', '6-4', '6-5'])
+    births = np.array(['1994-03-12', '1996-07-30', '1997-11-02', '1998-05-19', '2000-01-25'])
+    ident = nfl_id % len(names)
+
+    # Start position and velocity per (play, player)
+    sign = np.where(players['direction'].to_numpy() == 'right', 1.0, -1.0)
+    x0 = players['yardline'].to_numpy() + rng.normal(0, 4, n) - sign * 2
+    y0 = rng.uniform(5, 48, n)
+    speed = rng.uniform(0.5, 8.0, n)
+    heading = np.where(sign > 0, 90.0, 270.0) + rng.normal(0, 35, n)
+    vx = speed * np.sin(np.radians(heading))
+    vy = speed * np.cos(np.radians(heading))
+
+    def expand(frames_column: str) -> tuple[np.ndarray, np.ndarray]:
+        frames = players[frames_column].to_numpy()
+        rows = np.repeat(np.arange(n), frames)
+        starts = np.cumsum(frames) - frames
+        frame_id = np.arange(len(rows)) - np.repeat(starts, frames) + 1
+        return rows, frame_id
+
+    rows, frame_id = expand('frames')
+    t = frame_id * 0.1
+    m = len(rows)
+    tracking = pd.DataFrame({
+        'game_id': game[rows],
+        'play_id': players['play_id'].to_numpy()[rows],
+        'player_to_predict': players['predict'].to_numpy()[rows],
+        'nfl_id': nfl_id[rows],
+        'frame_id': frame_id,
+        'play_direction': players['direction'].to_numpy()[rows],
+        'absolute_yardline_number': players['yardline'].to_numpy()[rows],
+        'player_name': names[ident][rows],
+        'player_height': heights[ident % len(heights)][rows],
+        'player_weight': (180 + ident * 7 % 140)[rows],
+        'player_birth_date': births[ident % len(births)][rows],
+        'player_position': players['position'].to_numpy()[rows],
+        'player_side': players['side'].to_numpy()[rows],
+        'player_role': players['role'].to_numpy()[rows],
+        'x': np.round(np.clip(x0[rows] + vx[rows] * t + rng.normal(0, 0.05, m), 0, 120), 2),
+        'y': np.round(np.clip(y0[rows] + vy[rows] * t + rng.normal(0, 0.05, m), 0, 53.3), 2),
+        's': np.round(np.abs(speed[rows] + rng.normal(0, 0.3, m)), 2),
+        'a': np.round(np.abs(rng.normal(1.5, 1.0, m)), 2),
+        'dir': np.round(heading[rows] % 360, 2),
+        'o': np.round((heading[rows] + rng.normal(0, 20, m)) % 360, 2),
+        'num_frames_output': players['out_frames'].to_numpy()[rows],
+    })
+    # Ball lands near the targeted receiver's path
+    land = players.groupby(['game_id', 'play_id']).ngroup().to_numpy()
+    land_x = np.clip(players['yardline'].to_numpy() + sign * rng.uniform(5, 30, n), 10, 110)
+    land_y = rng.uniform(5, 48, n)
+    first = np.unique(land, return_index=True)[1]
+    tracking['ball_land_x'] = np.round(land_x[first][land], 2)[rows]
+    tracking['ball_land_y'] = np.round(land_y[first][land], 2)[rows]
+
+    # Post-pass frames for the players to predict
+    predicted = players['predict'].to_numpy()
+    out_rows, out_frame = expand('out_frames')
+    keep = predicted[out_rows]
+    out_rows, out_frame = out_rows[keep], out_frame[keep]
+    t_out = (players['frames'].to_numpy()[out_rows] + out_frame) * 0.1
+    output = pd.DataFrame({
+        'game_id': game[out_rows],
+        'play_id': players['play_id'].to_numpy()[out_rows],
+        'nfl_id': nfl_id[out_rows],
+        'frame_id': out_frame,
+        'x': np.round(np.clip(x0[out_rows] + vx[out_rows] * t_out, 0, 120), 2),
+        'y': np.round(np.clip(y0[out_rows] + vy[out_rows] * t_out, 0, 53.3), 2),
+    })
+
+    return tracking[INPUT_COLUMNS], output
+
+
+def write_week(out_dir: str, season: int = 2023, week: int = 1,
+               scale: float = 1.0, seed: int = 0) -> dict:
+    """
+    Write a week's input and output CSVs under {out_dir}/train/.
+
+    Args:
+        out_dir: Dataset root (the pipeline's --data-dir)
+        season: Season year
+        week: Week number
+        scale: Multiple of a real week's game count
+        seed: Seed for player motion
+
+    Returns:
+        Dict with 'input_path', 'output_path', 'games', 'plays' and 'rows'
+    """
+    train_dir = os.path.join(out_dir, 'train')
+    os.makedirs(train_dir, exist_ok=True)
+    input_path = os.path.join(train_dir, f"input_{season}_w{week:02d}.csv")
+    output_path = os.path.join(train_dir, f"output_{season}_w{week:02d}.csv")
+
+    game_ids = week_game_ids(season, week, scale)
+    plays = rows = 0
+    for i in range(0, len(game_ids), GAME_BLOCK):
+        tracking, output = generate_games(game_ids[i:i + GAME_BLOCK], seed=seed)
+        first = i == 0
+        tracking.to_csv(input_path, mode='w' if first else 'a', header=first, index=False)
+        output.to_csv(output_path, mode='w' if first else 'a', header=first, index=False)
+        plays += tracking[['game_id', 'play_id']].drop_duplicates().shape[0]
+        rows += len(tracking)
+
+    return {
+        'input_path': input_path,
+        'output_path': output_path,
+        'games': len(game_ids),
+        'plays': plays,
+        'rows': rows,
+    }
+
+
+def write_test_files(out_dir: str, season: int = 2023, week: int = 1,
+                     games: int = 2, seed: int = 0) -> None:
+    """Write test_input.csv and test.csv (gateway layout) for a few games."""
+    tracking, output = generate_games(week_game_ids(season, week)[:games], seed=seed + 1)
+    tracking.to_csv(os.path.join(out_dir, 'test_input.csv'), index=False)
+
+    test = output[['game_id', 'play_id', 'nfl_id', 'frame_id']].copy()
+    test.insert(0, 'id', [
+        f"{g}_{p}_{n}_{f}" for g, p, n, f in test.itertuples(index=False)
+    ])
+    test.to_csv(os.path.join(out_dir, 'test.csv'), index=False)
+
+
+def ensure_dataset(out_dir: str, season: int = 2023, week: int = 1,
+                   scale: float = 1.0, seed: int = 0) -> str:
+    """
+    Write the dataset unless it already exists.
+
+    Returns:
+        Path to the week's input CSV
+    """
+    input_path = os.path.join(out_dir, 'train', f"input_{season}_w{week:02d}.csv")
+    if not os.path.exists(input_path):
+        info = write_week(out_dir, season, week, scale, seed)
+        write_test_files(out_dir, season, week, seed=seed)
+        print(f"Generated {info['rows']:,} rows ({info['plays']:,} plays, "
+              f"{info['games']} games) in {out_dir}")
+    return input_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic BDB tracking data')
+    parser.add_argument('--out-dir', default='output/bench_data/1x',
+                       help='Dataset root to write (train/ and test files)')
+    parser.add_argument('--season', type=int, default=2023)
+    parser.add_argument('--weeks', default='1',
+                       help='Comma-separated week numbers')
+    parser.add_argument('--scale', type=float, default=1.0,
+                       help='Multiple of a real week (16 games)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for week in [int(w) for w in args.weeks.split(',')]:
+        info = write_week(args.out_dir, args.season, week, args.scale, args.seed)
+        print(f"{info['input_path']}: {info['rows']:,} rows, {info['plays']:,} plays, "
+              f"{info['games']} games")
+    write_test_files(args.out_dir, args.season, int(args.weeks.split(',')[0]), seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Parallel multi-week / multi-season batch runner.
+
+Fans (season, week) tasks out across a process pool. Each worker keeps one
+NFLPipeline for all the weeks it processes. Workers share ESPN responses
+through a BoundedCache hosted in a manager process, so a scoreboard or game
+summary is downloaded once per batch rather than once per worker (the
+persistent ESPN cache, a WAL-mode SQLite file, carries them over to later
+batches). The shared cache is capped by espn_memory_mb like a single
+client's, so a long batch doesn't grow the manager without bound. Workers
+share the game mapping cache through the locked, atomically replaced JSON
+file written by GameMapper.
+
+The per-week enriched CSVs are written as usual and then merged into one
+file per season.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.managers import SyncManager
+from typing import MutableMapping, Optional
+
+import pandas as pd
+
+from enrichment.espn_client import ESPNClient
+from lru_cache import MB, BoundedCache
+from metrics import METRICS
+from pipeline import NFLPipeline
+
+
+# Pipeline owned by the current worker process
+_worker_pipeline: Optional[NFLPipeline] = None
+
+
+class CacheManager(SyncManager):
+    """Manager process that can host a BoundedCache shared by workers."""
+
+
+CacheManager.register('BoundedCache', BoundedCache, exposed=(
+    '__contains__', '__delitem__', '__getitem__', '__len__', '__setitem__',
+    'clear', 'get', 'pop', 'put', 'stats',
+))
+
+
+def parse_range(spec: str) -> list[int]:
+    """
+    Parse a range spec like '1-18' or '1,3,5-7' into a sorted list.
+
+    Args:
+        spec: Comma-separated numbers and inclusive ranges
+
+    Returns:
+        Sorted list of unique integers
+    """
+    values = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-', 1)
+            values.update(range(int(start), int(end) + 1))
+        else:
+            values.add(int(part))
+    return sorted(values)
+
+
+def _init_worker(
+    data_dir: str,
+    output_dir: str,
+    espn_cache: MutableMapping,
+    pipeline_kwargs: dict
+) -> None:
+    """Create the worker's pipeline on top of the shared ESPN cache."""
+    global _worker_pipeline
+    _worker_pipeline = NFLPipeline(
+        data_dir=data_dir,
+        output_dir=output_dir,
+        espn_cache=espn_cache,
+        **pipeline_kwargs
+    )
+
+
+def _process_week(season: int, week: int, max_plays: Optional[int], full: bool) -> dict:
+    """Run one week in a worker and report where its output went."""
+    start = time.time()
+    # Workers process several weeks; keep each week's metrics separate
+    METRICS.reset()
+    _worker_pipeline.memory.reset()
+    try:
+        if full:
+            results = _worker_pipeline.run_full_pipeline(
+                week_num=week, year=season, max_plays=max_plays, generate_video=False
+            )
+            plays = results['plays_enriched']
+        else:
+            plays = len(_worker_pipeline.process_week(
+                week_num=week, year=season, max_plays=max_plays
+            ))
+        error = None
+    except Exception as e:
+        # One bad week must not take down the rest of the batch
+        plays = 0
+        error = f"{type(e).__name__}: {e}"
+
+    _worker_pipeline.write_metrics(
+        {'season': season, 'week': week, 'plays_enriched': plays, 'error': error},
+        name=f"pipeline_{season}_w{week:02d}"
+    )
+
+    return {
+        'season': season,
+        'week': week,
+        'plays_enriched': plays,
+        'seconds': time.time() - start,
+        'error': error,
+    }
+
+
+def merge_season_outputs(output_dir: str, season: int, weeks: list[int]) -> Optional[str]:
+    """
+    Concatenate a season's per-week enriched CSVs into one file.
+
+    Args:
+        output_dir: Pipeline output directory
+        season: Season year
+        weeks: Weeks to merge (missing or empty files are skipped)
+
+    Returns:
+        Path to the merged CSV, or None if no week produced output
+    """
+    frames = []
+    for week in weeks:
+        path = os.path.join(output_dir, 'enriched', f"enriched_{season}_w{week:02d}.csv")
+        try:
+            frames.append(pd.read_csv(path).assign(week=week))
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            # Week failed or had no enriched plays
+            continue
+
+    if not frames:
+        return None
+
+    merged_path = os.path.join(
+        output_dir, 'enriched', f"enriched_{season}_w{weeks[0]:02d}-w{weeks[-1]:02d}.csv"
+    )
+    pd.concat(frames, ignore_index=True).to_csv(merged_path, index=False)
+    print(f"Merged {len(frames)} weeks into {merged_path}")
+    return merged_path
+
+
+def run_batch(
+    data_dir: str,
+    output_dir: str,
+    seasons: list[int],
+    weeks: list[int],
+    workers: Optional[int] = None,
+    max_plays: Optional[int] = None,
+    full: bool = False,
+    **pipeline_kwargs
+) -> list[dict]:
+    """
+    Process many weeks (and seasons) in parallel.
+
+    Args:
+        data_dir: Directory containing Big Data Bowl data
+        output_dir: Directory for output files
+        seasons: Season years to process
+        weeks: Week numbers to process in every season
+        workers: Number of worker processes (defaults to CPU count)
+        max_plays: Optional per-week limit on number of plays
+        full: Also generate scene descriptions (videos are never generated
+            in batch mode)
+        **pipeline_kwargs: Extra NFLPipeline options (use_store, memory_limit_mb,
+            resume, espn_cache_mb, espn_memory_mb, rate_limits, rate_limit_dir)
+
+    Returns:
+        Per-week result dicts, ordered by (season, week)
+    """
+    tasks = [(season, week) for season in seasons for week in weeks]
+    if not tasks:
+        print("No weeks to process")
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    print(f"Processing {len(tasks)} weeks with {workers} workers")
+
+    results = []
+    with CacheManager() as manager:
+        espn_memory_mb = pipeline_kwargs.get('espn_memory_mb', ESPNClient.DEFAULT_MEMORY_CACHE_MB)
+        espn_cache = manager.BoundedCache(int(espn_memory_mb * MB), name='espn_shared')
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(data_dir, output_dir, espn_cache, pipeline_kwargs),
+        ) as pool:
+            futures = [
+                pool.submit(_process_week, season, week, max_plays, full)
+                for season, week in tasks
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                status = f"error: {result['error']}" if result['error'] else \
+                    f"{result['plays_enriched']} plays"
+                print(f"[{result['season']} w{result['week']:02d}] {status} "
+                      f"({result['seconds']:.1f}s)")
+                results.append(result)
+
+        stats = espn_cache.stats()
+        print(f"Shared ESPN cache holds {stats['entries']} responses "
+              f"({stats['bytes'] / MB:.1f} of {stats['max_bytes'] / MB:.0f} MB, "
+              f"{stats['evictions']} evicted)")
+
+    for season in seasons:
+        merge_season_outputs(output_dir, season, weeks)
+
+    return sorted(results, key=lambda r: (r['season'], r['week']))
@@ -0,0 +1,144 @@
+"""
+Per-play, per-stage checkpoints for resumable pipeline runs.
+
+Every stage result (enrichment, scene description, video) is saved as a
+small JSON file together with a content hash of the stage's inputs. On a
+rerun, a play whose inputs hash the same is loaded from its checkpoint
+instead of calling ESPN, Gemini or Veo again, so a crash or a change to a
+handful of plays only costs the work that is actually missing.
+
+Layout:
+    checkpoints/{stage}/{game_id}_{play_id}.json
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import Counter
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from metrics import METRICS
+
+
+def content_hash(*parts: Any) -> str:
+    """
+    Hash stage inputs into a stable hex digest.
+
+    DataFrames are hashed by content (values, column names and order, not
+    the index), everything else by its JSON representation.
+
+    Args:
+        *parts: Inputs to hash (dicts, strings, numbers, DataFrames, None)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, pd.DataFrame):
+            digest.update(json.dumps(list(map(str, part.columns))).encode())
+            digest.update(pd.util.hash_pandas_object(part, index=False).to_numpy().tobytes())
+        else:
+            digest.update(json.dumps(part, sort_keys=True, default=_json_default).encode())
+        # Separator so ('ab', 'c') and ('a', 'bc') hash differently
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    """Convert numpy scalars and other stragglers for JSON encoding."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+class CheckpointStore:
+    """Stores stage results per play, keyed by a hash of the stage inputs."""
+
+    def __init__(self, checkpoint_dir: str, enabled: bool = True):
+        """
+        Initialize the checkpoint store.
+
+        Args:
+            checkpoint_dir: Directory holding one subdirectory per stage
+            enabled: If False, lookups always miss (results are still saved,
+                so a forced run refreshes the checkpoints)
+        """
+        self.checkpoint_dir = checkpoint_dir
+        self.enabled = enabled
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def _path(self, stage: str, game_id, play_id) -> str:
+        return os.path.join(self.checkpoint_dir, stage, f"{int(game_id)}_{int(play_id)}.json")
+
+    def get(self, stage: str, game_id, play_id, key: str) -> Optional[dict]:
+        """
+        Load a stage result if it was computed from the same inputs.
+
+        Args:
+            stage: Stage name ('enrich', 'scene', 'video')
+            game_id: Game ID
+            play_id: Play ID
+            key: Content hash of the stage inputs
+
+        Returns:
+            The saved result, or None if missing, stale or disabled
+        """
+        result = self._load(stage, game_id, play_id, key) if self.enabled else None
+        with self._lock:
+            if result is None:
+                self.misses[stage] += 1
+            else:
+                self.hits[stage] += 1
+        METRICS.cache_lookup(f"checkpoint_{stage}", result is not None)
+        return result
+
+    def _load(self, stage: str, game_id, play_id, key: str) -> Optional[dict]:
+        try:
+            with open(self._path(stage, game_id, play_id), 'r') as f:
+                checkpoint = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return checkpoint['result'] if checkpoint.get('key') == key else None
+
+    def put(self, stage: str, game_id, play_id, key: str, result: dict) -> None:
+        """
+        Save a stage result.
+
+        The file is written to a temporary name and renamed into place, so
+        a crash never leaves a truncated checkpoint behind.
+
+        Args:
+            stage: Stage name
+            game_id: Game ID
+            play_id: Play ID
+            key: Content hash of the stage inputs
+            result: JSON-serializable result
+        """
+        path = self._path(stage, game_id, play_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'key': key, 'result': result}, f, default=_json_default)
+            os.replace(tmp_path, path)
+        except (IOError, OSError, TypeError) as e:
+            print(f"Error saving checkpoint {path}: {e}")
+
+    def reset(self, *stages: str) -> None:
+        """Zero the hit/miss counts of the given stages."""
+        with self._lock:
+            for stage in stages:
+                self.hits[stage] = 0
+                self.misses[stage] = 0
+
+    def summary(self, stage: str) -> str:
+        """One-line hit/miss summary of a stage for logging."""
+        return f"{stage}: {self.hits[stage]} reused from checkpoints, {self.misses[stage]} computed"
@@ -1,14 +1,20 @@
 # Imports are done lazily to avoid circular imports during development
-__all__ = ['ESPNClient', 'GameMapper', 'PlayMatcher']
+__all__ = ['ESPNClient', 'AsyncESPNClient', 'GameMapper', 'PlayMatcher', 'ResponseCache']
 
 def __getattr__(name):
     if name == 'ESPNClient':
         from .espn_client import ESPNClient
         return ESPNClient
+    elif name == 'AsyncESPNClient':
+        from .async_client import AsyncESPNClient
+        return AsyncESPNClient
     elif name == 'GameMapper':
         from .game_mapper import GameMapper
         return GameMapper
     elif name == 'PlayMatcher':
         from .play_matcher import PlayMatcher
         return PlayMatcher
+    elif name == 'ResponseCache':
+        from .response_cache import ResponseCache
+        return ResponseCache
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
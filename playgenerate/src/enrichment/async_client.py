@@ -0,0 +1,193 @@
+"""
+Asynchronous ESPN client for fetching many games concurrently.
+
+AsyncESPNClient has the same get_scoreboard / get_game_summary / get_plays /
+get_game_info surface as ESPNClient, as coroutines. It wraps an ESPNClient
+and shares everything with it: the in-memory and persistent caches, the
+pooled HTTP session and the rate budget. Waiting for a rate-limit slot is
+an asyncio.sleep rather than a blocking sleep, and the blocking request
+itself runs in a worker thread, so up to max_concurrency requests are in
+flight while the event loop schedules the rest.
+
+Usage:
+    client = AsyncESPNClient(ESPNClient())
+    summaries = asyncio.run(client.get_game_summaries(['401547353', '401547403']))
+"""
+
+import asyncio
+import os
+import sys
+import time
+from typing import Optional
+
+# Handle both package and script execution
+try:
+    from metrics import METRICS
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from metrics import METRICS
+
+try:
+    from .espn_client import ESPNClient, GameInfo, PlayInfo
+    from .play_table import ParsedGame
+except ImportError:
+    from espn_client import ESPNClient, GameInfo, PlayInfo
+    from play_table import ParsedGame
+
+
+class AsyncESPNClient:
+    """asyncio counterpart of ESPNClient sharing its caches and rate budget."""
+
+    def __init__(self, client: Optional[ESPNClient] = None, max_concurrency: int = ESPNClient.POOL_SIZE):
+        """
+        Initialize the async client.
+
+        Args:
+            client: ESPNClient to share caches, session and rate budget with
+                (creates a new one if not provided)
+            max_concurrency: Maximum requests in flight at once
+        """
+        self.client = client or ESPNClient()
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _limit(self) -> asyncio.Semaphore:
+        # Semaphores belong to one event loop; each asyncio.run gets its own
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def _get(self, url: str, trim: bool = False) -> Optional[dict]:
+        """
+        Make a GET request with caching and rate limiting.
+
+        Args:
+            url: Full URL to request
+            trim: Keep only the SUMMARY_KEYS of a game summary (cached
+                apart from the whole response)
+
+        Returns:
+            JSON response as dict, or None if request failed
+        """
+        async with self._limit():
+            # The persistent cache decompresses and decodes; keep it off the loop
+            data, stored = await asyncio.to_thread(self.client._lookup, url, trim)
+            if data is not None:
+                return data
+
+            wait_start = time.perf_counter()
+            delay = self.client._reserve_slot()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            METRICS.observe('rate_limit_wait_seconds', time.perf_counter() - wait_start, service='espn')
+
+            return await asyncio.to_thread(self.client._fetch, url, stored, trim)
+
+    async def get_scoreboard(self, date: str) -> list[GameInfo]:
+        """
+        Get all NFL games for a specific date.
+
+        Args:
+            date: Date in YYYYMMDD format (e.g., "20230907")
+
+        Returns:
+            List of GameInfo objects for games on that date
+        """
+        return ESPNClient._parse_scoreboard(await self._get(self.client.scoreboard_url(date)))
+
+    async def get_game_summary(self, espn_game_id: str) -> Optional[dict]:
+        """
+        Get full game summary including play-by-play.
+
+        Args:
+            espn_game_id: ESPN's game ID (e.g., "401547353")
+
+        Returns:
+            Full game summary dict, or None if request failed
+        """
+        return await self._get(self.client.summary_url(espn_game_id))
+
+    async def get_parsed_game(self, espn_game_id: str) -> Optional[ParsedGame]:
+        """
+        Get a game's info and play table, parsing its summary only once.
+
+        Args:
+            espn_game_id: ESPN's game ID
+
+        Returns:
+            ParsedGame, or None if request failed
+        """
+        game = self.client._games.get(espn_game_id)
+        if game is None:
+            summary = await self._get(
+                self.client.summary_url(espn_game_id), trim=self.client.trim_summaries
+            )
+            game = self.client._store_game(espn_game_id, summary)
+        return game
+
+    async def get_plays(self, espn_game_id: str) -> list[PlayInfo]:
+        """
+        Get all plays for a game.
+
+        Args:
+            espn_game_id: ESPN's game ID
+
+        Returns:
+            List of PlayInfo objects for all plays in the game
+        """
+        game = await self.get_parsed_game(espn_game_id)
+        return game.plays.to_plays() if game else []
+
+    async def get_game_info(self, espn_game_id: str) -> Optional[GameInfo]:
+        """
+        Get game info from a game summary.
+
+        Args:
+            espn_game_id: ESPN's game ID
+
+        Returns:
+            GameInfo object, or None if request failed
+        """
+        game = await self.get_parsed_game(espn_game_id)
+        return game.info if game else None
+
+    async def get_week_scoreboard(
+        self,
+        season: int,
+        week: int,
+        season_type: int = ESPNClient.REGULAR_SEASON
+    ) -> list[GameInfo]:
+        """
+        Get all NFL games of a season week in one request.
+
+        Args:
+            season: Season year (e.g., 2023)
+            week: Week number
+            season_type: ESPN season type (2 = regular season)
+
+        Returns:
+            List of GameInfo objects for the week's games
+        """
+        url = self.client.week_scoreboard_url(season, week, season_type)
+        return ESPNClient._parse_scoreboard(await self._get(url))
+
+    async def get_scoreboards(self, dates: list[str]) -> dict[str, list[GameInfo]]:
+        """Fetch several dates' scoreboards concurrently, keyed by date."""
+        dates = list(dict.fromkeys(dates))
+        results = await asyncio.gather(*(self.get_scoreboard(d) for d in dates))
+        return dict(zip(dates, results))
+
+    async def get_game_summaries(self, espn_game_ids: list[str]) -> dict[str, Optional[dict]]:
+        """Fetch several game summaries concurrently, keyed by ESPN game ID."""
+        espn_game_ids = list(dict.fromkeys(espn_game_ids))
+        results = await asyncio.gather(*(self.get_game_summary(g) for g in espn_game_ids))
+        return dict(zip(espn_game_ids, results))
+
+    async def get_parsed_games(self, espn_game_ids: list[str]) -> dict[str, Optional[ParsedGame]]:
+        """Fetch and parse several games concurrently, keyed by ESPN game ID."""
+        espn_game_ids = list(dict.fromkeys(espn_game_ids))
+        results = await asyncio.gather(*(self.get_parsed_game(g) for g in espn_game_ids))
+        return dict(zip(espn_game_ids, results))
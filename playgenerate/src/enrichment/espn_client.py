@@ -4,12 +4,76 @@ ESPN API Client for NFL play-by-play data.
 Uses ESPN's unofficial (but free) API endpoints:
 - Scoreboard: Get games by date
 - Summary: Get full play-by-play for a game
+
+Game summaries are parsed once into compact play tables (play_table.py)
+and the raw JSON is dropped from the in-memory cache. Both in-memory tiers
+(raw responses and parsed games) are byte-bounded LRU caches; responses
+evicted from memory spill to the persistent cache.
+
+Requests go through one pooled requests.Session per client: connections
+are kept alive and capped per host, timeouts are split into connect and
+read, and connection errors, 429s and 5xx responses are retried with
+bounded exponential backoff (honouring Retry-After). Responses are
+decoded with orjson when it is installed. Summaries fetched to be parsed
+are trimmed to the header, drives and gameInfo subtrees the client reads
+before they are cached, under their own cache key; get_game_summary still
+returns whole summaries.
 """
 
+import asyncio
+import datetime as dt
+import importlib.util
+import json
+import os
+import sys
 import requests
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, MutableMapping, Optional
 from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is optional - it decodes large summaries several times faster. It is
+# imported where it's used, so runs that never touch ESPN don't load it
+try:
+    ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+except ModuleNotFoundError:
+    ORJSON_AVAILABLE = False
+
+# Handle both package and script execution
+try:
+    from lru_cache import MB, BoundedCache
+    from metrics import METRICS
+    from ratelimit import TokenBucket
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from lru_cache import MB, BoundedCache
+    from metrics import METRICS
+    from ratelimit import TokenBucket
+
+try:
+    from .response_cache import CachedResponse, ResponseCache
+except ImportError:
+    from response_cache import CachedResponse, ResponseCache
+
+if TYPE_CHECKING:
+    from .play_table import ParsedGame, PlayTable
+
+
+class _CountingRetry(Retry):
+    """
+    urllib3 Retry that counts every retry in METRICS and caps Retry-After
+    waits at backoff_max, like its own backoff.
+    """
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return min(retry_after, self.backoff_max) if retry_after is not None else None
+    
+    def increment(self, method=None, url=None, response=None, error=None, *args, **kwargs):
+        reason = f"status_{response.status}" if response is not None else type(error).__name__
+        METRICS.inc('retries_total', service='espn', reason=reason)
+        return super().increment(method, url, response, error, *args, **kwargs)
 
 
 @dataclass
@@ -49,54 +113,290 @@ class ESPNClient:
     
     BASE_URL = "https://site.api.espn.com/apis/site/v2/sports/football/nfl"
     
-    def __init__(self, cache_enabled: bool = True, rate_limit_seconds: float = 0.5):
+    # Persistent-cache lifetimes for responses with unfinished games; once
+    # every game in a response is final it is kept forever
+    LIVE_TTL_SECONDS = 60
+    DEFAULT_TTL_SECONDS = 3600
+    
+    # (connect, read) timeouts in seconds
+    TIMEOUT = (5, 30)
+    
+    # Retries for connection errors, 429 and 5xx; sleeps grow as
+    # backoff_factor * 2^(retry - 1), capped at BACKOFF_MAX seconds
+    MAX_RETRIES = 3
+    BACKOFF_FACTOR = 0.5
+    BACKOFF_MAX = 30
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
+    # Keep-alive connections per host (extra concurrent requests wait)
+    POOL_SIZE = 8
+    
+    # Regular-season scoreboards (ESPN seasontype: 1 pre, 2 regular, 3 post)
+    REGULAR_SEASON = 2
+    
+    # Cap on each in-memory tier (raw responses, parsed games)
+    DEFAULT_MEMORY_CACHE_MB = 256
+    
+    # Parts of a game summary the client parses; the rest (boxscore, leaders,
+    # win probability, news, ...) is dropped right after decoding
+    SUMMARY_KEYS = ('header', 'drives', 'gameInfo')
+    
+    # Decoded JSON takes about this many times the bytes of its text;
+    # sizing responses from their length avoids walking multi-MB summaries
+    DECODED_JSON_FACTOR = 7
+    
+    def __init__(
+        self,
+        cache_enabled: bool = True,
+        rate_limit_seconds: float = 0.5,
+        cache: Optional[MutableMapping] = None,
+        disk_cache: Optional[ResponseCache] = None,
+        max_retries: int = MAX_RETRIES,
+        rate_limiter: Optional[TokenBucket] = None,
+        memory_cache_mb: float = DEFAULT_MEMORY_CACHE_MB,
+        trim_summaries: bool = True
+    ):
         """
         Initialize ESPN client.
         
         Args:
             cache_enabled: Whether to cache API responses
-            rate_limit_seconds: Minimum seconds between API calls
+            rate_limit_seconds: Minimum seconds between API calls when no
+                rate_limiter is given (0 disables rate limiting)
+            cache: Optional mapping to cache responses in, e.g. the
+                manager-hosted BoundedCache batch workers share. It is
+                used as is, so it must bound itself; by default responses
+                go in an LRU cache bounded by memory_cache_mb
+            disk_cache: Optional persistent cache consulted after the
+                in-memory one, so responses survive across runs
+            max_retries: Retries per request for connection errors, 429 and
+                5xx responses (0 disables retrying)
+            rate_limiter: Optional token bucket to draw requests from, e.g.
+                ratelimit.shared_limiter('espn', ...) shared with other
+                clients, threads and processes
+            memory_cache_mb: Size cap for each in-memory tier (raw
+                responses and parsed games); least recently used entries
+                are evicted past it
+            trim_summaries: Whether summaries fetched for parsing keep only
+                SUMMARY_KEYS (cached separately, so get_game_summary always
+                returns the whole response)
         """
         self.cache_enabled = cache_enabled
+        self.trim_summaries = trim_summaries
         self.rate_limit_seconds = rate_limit_seconds
-        self._cache: dict = {}
-        self._last_request_time: float = 0
+        self.disk_cache = disk_cache
+        max_bytes = int(memory_cache_mb * MB)
+        self._cache: MutableMapping = cache if cache is not None else BoundedCache(
+            max_bytes, name='espn', on_evict=self._spill
+        )
+        self._games: MutableMapping[str, 'ParsedGame'] = BoundedCache(max_bytes, name='espn_games')
+        self.rate_limiter = rate_limiter
+        if rate_limiter is None and rate_limit_seconds > 0:
+            self.rate_limiter = TokenBucket(rate=1 / rate_limit_seconds)
+        self.session = self._make_session(max_retries)
+    
+    def _make_session(self, max_retries: int) -> requests.Session:
+        """Session with a keep-alive connection pool and retry/backoff."""
+        retry = _CountingRetry(
+            total=max_retries,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset(['GET']),
+            backoff_factor=self.BACKOFF_FACTOR,
+            # Also caps Retry-After waits (see _CountingRetry)
+            backoff_max=self.BACKOFF_MAX,
+            respect_retry_after_header=True,
+            # Hand the last 429/5xx back so raise_for_status reports it
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=self.POOL_SIZE,
+            pool_block=True,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _reserve_slot(self) -> float:
+        """
+        Reserve the next request slot from the rate limiter.
+        
+        Returns:
+            Seconds to wait before sending the request
+        """
+        return self.rate_limiter.reserve() if self.rate_limiter is not None else 0.0
     
     def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_seconds:
-            time.sleep(self.rate_limit_seconds - elapsed)
-        self._last_request_time = time.time()
+        """Enforce rate limiting between requests (safe across threads)."""
+        # Reserve the slot, then sleep without holding any lock
+        delay = self._reserve_slot()
+        if delay > 0:
+            time.sleep(delay)
     
-    def _get(self, url: str) -> Optional[dict]:
+    def _ttl_for(self, data: dict) -> Optional[float]:
+        """
+        Persistent-cache lifetime for a scoreboard or summary response.
+        
+        Returns:
+            None (keep forever) once every game in the response is final,
+            LIVE_TTL_SECONDS while one is in progress, else DEFAULT_TTL_SECONDS
+        """
+        if 'header' in data:
+            statuses = [c.get('status', {}) for c in data['header'].get('competitions', [])]
+        else:
+            statuses = [e.get('status', {}) for e in data.get('events', [])]
+        status_types = [s.get('type', {}) for s in statuses]
+        
+        if status_types and all(t.get('completed') for t in status_types):
+            return None
+        if any(t.get('state') == 'in' for t in status_types):
+            return self.LIVE_TTL_SECONDS
+        return self.DEFAULT_TTL_SECONDS
+    
+    def _remember(self, url: str, data: dict, text_bytes: int) -> None:
+        """Keep a response in the in-memory cache."""
+        # BoundedCache, or a proxy to one shared between processes
+        if hasattr(self._cache, 'put'):
+            self._cache.put(url, data, size=text_bytes * self.DECODED_JSON_FACTOR)
+        else:
+            self._cache[url] = data
+    
+    def _spill(self, url: str, data: dict) -> None:
+        """Keep a response evicted from memory in the persistent cache."""
+        if self.disk_cache is not None and not self.disk_cache.contains(url):
+            self.disk_cache.put(url, data, self._ttl_for(data))
+    
+    def _cache_key(self, url: str, trim: bool = False) -> str:
+        """Cache key for a response; trimmed summaries don't share the URL's."""
+        return f"{url}#{','.join(self.SUMMARY_KEYS)}" if trim else url
+    
+    def _decode(self, content: bytes, trim: bool = False) -> dict:
+        """
+        Decode a response body.
+        
+        Args:
+            content: Raw JSON body
+            trim: Whether to keep only the SUMMARY_KEYS of a game summary
+            
+        Returns:
+            Decoded JSON
+        """
+        if ORJSON_AVAILABLE:
+            import orjson
+            data = orjson.loads(content)
+        else:
+            data = json.loads(content)
+        if trim and isinstance(data, dict):
+            data = {key: data[key] for key in self.SUMMARY_KEYS if key in data}
+        return data
+    
+    def _lookup(self, url: str, trim: bool = False) -> tuple[Optional[dict], Optional[CachedResponse]]:
+        """
+        Look a URL up in the in-memory and persistent caches.
+        
+        Args:
+            url: Full URL
+            trim: Look up the trimmed summary rather than the whole response
+            
+        Returns:
+            (data, None) on a hit; (None, stale entry or None) on a miss, the
+            stale entry's validators to be sent with the request
+        """
+        if not self.cache_enabled:
+            return None, None
+        
+        key = self._cache_key(url, trim)
+        cached = self._cache.get(key)
+        METRICS.cache_lookup('espn', cached is not None)
+        if cached is not None:
+            return cached, None
+        
+        # Persistent cache: fresh entries are used as-is, expired ones are
+        # revalidated with a conditional request
+        if self.disk_cache is None:
+            return None, None
+        stored = self.disk_cache.get(key)
+        METRICS.cache_lookup('espn_disk', stored is not None and stored.fresh)
+        if stored is not None and stored.fresh:
+            self._remember(key, stored.data, stored.size)
+            return stored.data, None
+        return None, stored
+    
+    def _get(self, url: str, trim: bool = False) -> Optional[dict]:
         """
         Make a GET request with caching and rate limiting.
         
         Args:
             url: Full URL to request
+            trim: Keep only the SUMMARY_KEYS of a game summary (cached
+                apart from the whole response)
             
         Returns:
             JSON response as dict, or None if request failed
         """
-        # Check cache
-        if self.cache_enabled and url in self._cache:
-            return self._cache[url]
+        data, stored = self._lookup(url, trim)
+        if data is not None:
+            return data
         
         # Rate limit
+        wait_start = time.perf_counter()
         self._rate_limit()
+        METRICS.observe('rate_limit_wait_seconds', time.perf_counter() - wait_start, service='espn')
+        
+        return self._fetch(url, stored, trim)
+    
+    def _fetch(self, url: str, stored: Optional[CachedResponse] = None, trim: bool = False) -> Optional[dict]:
+        """
+        Request a URL (already rate limited) and cache the response.
+        
+        Args:
+            url: Full URL to request
+            stored: Expired persistent-cache entry to revalidate, if any
+            trim: Keep only the SUMMARY_KEYS of a game summary (cached
+                apart from the whole response)
+            
+        Returns:
+            JSON response as dict, or None if request failed
+        """
+        headers = {}
+        if stored is not None:
+            if stored.etag:
+                headers['If-None-Match'] = stored.etag
+            if stored.last_modified:
+                headers['If-Modified-Since'] = stored.last_modified
         
+        endpoint = url.split('?')[0].rsplit('/', 1)[-1]
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            with METRICS.timer('external_call_seconds', service='espn', endpoint=endpoint):
+                response = self.session.get(url, timeout=self.TIMEOUT, headers=headers)
+                response.raise_for_status()
+                not_modified = response.status_code == 304 and stored is not None
+                data = stored.data if not_modified else self._decode(response.content, trim)
+            METRICS.inc(
+                'external_calls_total', service='espn', endpoint=endpoint,
+                outcome='not_modified' if not_modified else 'ok'
+            )
             
             # Cache successful response
             if self.cache_enabled:
-                self._cache[url] = data
+                key = self._cache_key(url, trim)
+                self._remember(key, data, stored.size if not_modified else len(response.content))
+                if self.disk_cache is not None:
+                    if not_modified:
+                        self.disk_cache.refresh(key, self._ttl_for(data))
+                    else:
+                        self.disk_cache.put(
+                            key, data, self._ttl_for(data),
+                            etag=response.headers.get('ETag'),
+                            last_modified=response.headers.get('Last-Modified')
+                        )
             
             return data
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
+            # ValueError: malformed JSON body
+            METRICS.inc('external_calls_total', service='espn', endpoint=endpoint, outcome='error')
             print(f"ESPN API request failed: {e}")
             return None
     
@@ -110,9 +410,121 @@ class ESPNClient:
         Returns:
             List of GameInfo objects for games on that date
         """
-        url = f"{self.BASE_URL}/scoreboard?dates={date}"
-        data = self._get(url)
+        return self._parse_scoreboard(self._get(self.scoreboard_url(date)))
+    
+    def scoreboard_url(self, date: str) -> str:
+        """Scoreboard URL for a date (YYYYMMDD)."""
+        return f"{self.BASE_URL}/scoreboard?dates={date}"
+    
+    def summary_url(self, espn_game_id: str) -> str:
+        """Game summary URL for an ESPN game ID."""
+        return f"{self.BASE_URL}/summary?event={espn_game_id}"
+    
+    def week_scoreboard_url(self, season: int, week: int, season_type: int = REGULAR_SEASON) -> str:
+        """Scoreboard URL covering every game of a season week."""
+        return f"{self.BASE_URL}/scoreboard?seasontype={season_type}&week={week}&dates={season}"
+    
+    def get_week_scoreboard(
+        self,
+        season: int,
+        week: int,
+        season_type: int = REGULAR_SEASON
+    ) -> list[GameInfo]:
+        """
+        Get all NFL games of a season week in one request.
+        
+        Args:
+            season: Season year (e.g., 2023)
+            week: Week number
+            season_type: ESPN season type (2 = regular season)
+            
+        Returns:
+            List of GameInfo objects for the week's games
+        """
+        return self._parse_scoreboard(self._get(self.week_scoreboard_url(season, week, season_type)))
+    
+    @staticmethod
+    def scoreboard_date(game: GameInfo) -> str:
+        """
+        The YYYYMMDD date whose scoreboard lists a game.
+        
+        ESPN dates scoreboards in US Eastern time but reports kickoffs in
+        UTC, so night games kick off on the next UTC day. Every NFL kickoff
+        is between 09:30 and 20:30 Eastern, so shifting by five hours lands
+        on the right date under both EST and EDT.
+        """
+        kickoff = dt.datetime.strptime(game.date[:16], '%Y-%m-%dT%H:%M')
+        return (kickoff - dt.timedelta(hours=5)).strftime('%Y%m%d')
+    
+    def prefetch(
+        self,
+        dates: Iterable[str] = (),
+        espn_game_ids: Iterable[str] = (),
+        max_concurrency: int = POOL_SIZE
+    ) -> int:
+        """
+        Fetch scoreboards and game summaries concurrently into the cache.
+        
+        Later get_scoreboard / get_plays / get_game_info calls for them are
+        then served from the cache. Must not be called from a running event
+        loop (use AsyncESPNClient there).
+        
+        Args:
+            dates: Scoreboard dates (YYYYMMDD)
+            espn_game_ids: ESPN game IDs whose summaries to fetch
+            max_concurrency: Maximum requests in flight at once
+            
+        Returns:
+            Number of dates with games plus games now available
+        """
+        return asyncio.run(self._prefetch(dates, espn_game_ids, max_concurrency))
+    
+    def prefetch_week(
+        self,
+        season: int,
+        week: int,
+        season_type: int = REGULAR_SEASON,
+        max_concurrency: int = POOL_SIZE
+    ) -> list[GameInfo]:
+        """
+        Fetch everything a season week needs concurrently into the cache:
+        the week's scoreboard, the per-date scoreboards GameMapper looks
+        games up in, and every game's summary.
+        
+        Args:
+            season: Season year
+            week: Week number
+            season_type: ESPN season type (2 = regular season)
+            max_concurrency: Maximum requests in flight at once
+            
+        Returns:
+            The week's games
+        """
+        games = self.get_week_scoreboard(season, week, season_type)
+        self.prefetch(
+            dates=[self.scoreboard_date(g) for g in games],
+            espn_game_ids=[g.espn_id for g in games],
+            max_concurrency=max_concurrency
+        )
+        return games
+    
+    async def _prefetch(self, dates: Iterable[str], espn_game_ids: Iterable[str], max_concurrency: int) -> int:
+        # Imported here: async_client builds on this module
+        try:
+            from .async_client import AsyncESPNClient
+        except ImportError:
+            from async_client import AsyncESPNClient
         
+        client = AsyncESPNClient(self, max_concurrency)
+        scoreboards, games = await asyncio.gather(
+            client.get_scoreboards(list(dates)),
+            client.get_parsed_games(list(espn_game_ids))
+        )
+        return sum(1 for s in scoreboards.values() if s) + sum(1 for g in games.values() if g)
+    
+    @staticmethod
+    def _parse_scoreboard(data: Optional[dict]) -> list[GameInfo]:
+        """Parse a scoreboard response into GameInfo objects."""
         if not data or 'events' not in data:
             return []
         
@@ -156,61 +568,94 @@ class ESPNClient:
         Returns:
             Full game summary dict, or None if request failed
         """
-        url = f"{self.BASE_URL}/summary?event={espn_game_id}"
-        return self._get(url)
+        return self._get(self.summary_url(espn_game_id))
     
-    def get_plays(self, espn_game_id: str) -> list[PlayInfo]:
+    def get_parsed_game(self, espn_game_id: str) -> Optional['ParsedGame']:
         """
-        Get all plays for a game.
+        Get a game's info and play table, parsing its summary only once.
         
         Args:
             espn_game_id: ESPN's game ID
             
         Returns:
-            List of PlayInfo objects for all plays in the game
+            ParsedGame, or None if request failed
         """
-        summary = self.get_game_summary(espn_game_id)
+        game = self._games.get(espn_game_id)
+        if game is None:
+            summary = self._get(self.summary_url(espn_game_id), trim=self.trim_summaries)
+            game = self._store_game(espn_game_id, summary)
+        return game
+    
+    def _store_game(self, espn_game_id: str, summary: Optional[dict]) -> Optional['ParsedGame']:
+        """Parse a fetched summary and keep the result in place of the raw JSON."""
+        # Imported here: play_table builds on this module
+        try:
+            from .play_table import ParsedGame, PlayTable
+        except ImportError:
+            from play_table import ParsedGame, PlayTable
         
         if not summary:
-            return []
-        
-        plays = []
-        drives = summary.get('drives', {}).get('previous', [])
+            return None
+        game = ParsedGame(
+            info=self._parse_game_info(espn_game_id, summary),
+            plays=PlayTable.from_summary(summary)
+        )
+        if self.cache_enabled:
+            self._games[espn_game_id] = game
+            # The persistent cache still has the summary if it's needed again.
+            # A cache shared with other workers keeps it: they haven't parsed it
+            if isinstance(self._cache, BoundedCache):
+                self._cache.pop(self._cache_key(self.summary_url(espn_game_id), self.trim_summaries), None)
+        return game
+    
+    def get_game_version(self, espn_game_id: str) -> Optional[str]:
+        """
+        Identify the version of a game's ESPN data, so results derived from
+        it can tell when ESPN has updated the game.
         
-        # Also check current drive if game is in progress
-        current = summary.get('drives', {}).get('current', {})
-        if current:
-            drives.append(current)
+        Args:
+            espn_game_id: ESPN's game ID
+            
+        Returns:
+            "<status>:<validator>", the validator being the summary's ETag
+            (or Last-Modified) from the persistent cache, empty without one;
+            None if request failed
+        """
+        game = self.get_parsed_game(espn_game_id)
+        if game is None or game.info is None:
+            return None
+        validator = ''
+        if self.disk_cache is not None:
+            url = self._cache_key(self.summary_url(espn_game_id), self.trim_summaries)
+            etag, last_modified = self.disk_cache.validators(url)
+            validator = etag or last_modified or ''
+        return f"{game.info.status}:{validator}"
+    
+    def get_play_table(self, espn_game_id: str) -> Optional['PlayTable']:
+        """
+        Get all plays for a game as a compact PlayTable.
         
-        for drive in drives:
-            drive_plays = drive.get('plays', [])
+        Args:
+            espn_game_id: ESPN's game ID
             
-            for play in drive_plays:
-                try:
-                    # Parse yard line
-                    yard_line = play.get('start', {}).get('yardLine', 0)
-                    yard_line_side = play.get('start', {}).get('team', {}).get('abbreviation', '')
-                    
-                    play_info = PlayInfo(
-                        play_id=str(play.get('id', '')),
-                        quarter=play.get('period', {}).get('number', 0),
-                        clock=play.get('clock', {}).get('displayValue', ''),
-                        down=play.get('start', {}).get('down', 0),
-                        distance=play.get('start', {}).get('distance', 0),
-                        yard_line=yard_line,
-                        yard_line_side=yard_line_side,
-                        play_text=play.get('text', ''),
-                        play_type=play.get('type', {}).get('text', ''),
-                        scoring_play=play.get('scoringPlay', False),
-                        home_score=play.get('homeScore', 0),
-                        away_score=play.get('awayScore', 0)
-                    )
-                    plays.append(play_info)
-                except (KeyError, ValueError) as e:
-                    print(f"Error parsing play: {e}")
-                    continue
+        Returns:
+            PlayTable, or None if request failed
+        """
+        game = self.get_parsed_game(espn_game_id)
+        return game.plays if game else None
+    
+    def get_plays(self, espn_game_id: str) -> list[PlayInfo]:
+        """
+        Get all plays for a game.
         
-        return plays
+        Args:
+            espn_game_id: ESPN's game ID
+            
+        Returns:
+            List of PlayInfo objects for all plays in the game
+        """
+        game = self.get_parsed_game(espn_game_id)
+        return game.plays.to_plays() if game else []
     
     def get_game_info(self, espn_game_id: str) -> Optional[GameInfo]:
         """
@@ -222,8 +667,12 @@ class ESPNClient:
         Returns:
             GameInfo object, or None if request failed
         """
-        summary = self.get_game_summary(espn_game_id)
-        
+        game = self.get_parsed_game(espn_game_id)
+        return game.info if game else None
+    
+    @staticmethod
+    def _parse_game_info(espn_game_id: str, summary: Optional[dict]) -> Optional[GameInfo]:
+        """Parse a game summary's header into a GameInfo."""
         if not summary:
             return None
         
@@ -255,8 +704,11 @@ class ESPNClient:
             return None
     
     def clear_cache(self) -> None:
-        """Clear the response cache."""
+        """Clear the in-memory and persistent response caches."""
         self._cache.clear()
+        self._games.clear()
+        if self.disk_cache is not None:
+            self.disk_cache.clear()
 
 
 # Example usage
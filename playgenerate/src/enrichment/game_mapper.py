@@ -7,18 +7,28 @@ ESPN game_id format: 9-digit numeric ID (e.g., 401547353)
 This module provides mapping between the two ID systems.
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Optional
+import asyncio
 import json
 import os
 import sys
 
+try:
+    import fcntl
+except ImportError:
+    # Windows: no advisory locks, saves are still atomic
+    fcntl = None
+
 # Handle both module and script execution
 try:
     from .espn_client import ESPNClient, GameInfo
+    from .async_client import AsyncESPNClient
 except ImportError:
     # Running as script - import directly
     from espn_client import ESPNClient, GameInfo
+    from async_client import AsyncESPNClient
 
 
 # Team name normalization mapping
@@ -109,30 +119,61 @@ class GameMapper:
         except (json.JSONDecodeError, FileNotFoundError, TypeError) as e:
             print(f"Error loading cache: {e}")
     
+    @contextmanager
+    def _cache_lock(self):
+        """Hold an exclusive lock on the cache file across processes."""
+        if fcntl is None:
+            yield
+            return
+        
+        with open(self.cache_file + '.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
     def _save_cache(self) -> None:
-        """Save mappings to cache file."""
+        """
+        Save mappings to cache file.
+        
+        Safe to call from several processes sharing one cache file: mappings
+        written by others since this mapper loaded are merged in under a file
+        lock, and the file is replaced atomically.
+        """
         if not self.cache_file:
             return
         
         try:
-            data = {
-                bdb_id: {
-                    'bdb_game_id': m.bdb_game_id,
-                    'espn_game_id': m.espn_game_id,
-                    'date': m.date,
-                    'home_team': m.home_team,
-                    'home_team_abbrev': m.home_team_abbrev,
-                    'away_team': m.away_team,
-                    'away_team_abbrev': m.away_team_abbrev,
-                    'stadium': m.stadium,
-                }
-                for bdb_id, m in self._mappings.items()
-            }
-            
             os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
-            with open(self.cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except (IOError, OSError) as e:
+            
+            with self._cache_lock():
+                # Merge in mappings saved by other processes
+                if os.path.exists(self.cache_file):
+                    with open(self.cache_file, 'r') as f:
+                        for bdb_id, mapping_data in json.load(f).items():
+                            if bdb_id not in self._mappings:
+                                self._mappings[bdb_id] = GameMapping(**mapping_data)
+                
+                data = {
+                    bdb_id: {
+                        'bdb_game_id': m.bdb_game_id,
+                        'espn_game_id': m.espn_game_id,
+                        'date': m.date,
+                        'home_team': m.home_team,
+                        'home_team_abbrev': m.home_team_abbrev,
+                        'away_team': m.away_team,
+                        'away_team_abbrev': m.away_team_abbrev,
+                        'stadium': m.stadium,
+                    }
+                    for bdb_id, m in self._mappings.items()
+                }
+                
+                tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+                with open(tmp_file, 'w') as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_file, self.cache_file)
+        except (IOError, OSError, json.JSONDecodeError, TypeError) as e:
             print(f"Error saving cache: {e}")
     
     @staticmethod
@@ -194,7 +235,31 @@ class GameMapper:
         date, game_num = self.parse_bdb_game_id(bdb_game_id)
         
         # Fetch games for that date from ESPN
-        games = self.espn_client.get_scoreboard(date)
+        mapping = self._match_game(bdb_game_id, self.espn_client.get_scoreboard(date), teams)
+        if mapping:
+            self._mappings[bdb_game_id] = mapping
+            self._save_cache()
+        
+        return mapping
+    
+    def _match_game(
+        self,
+        bdb_game_id: str,
+        games: list[GameInfo],
+        teams: Optional[tuple[str, str]] = None
+    ) -> Optional[GameMapping]:
+        """
+        Pick a game's ESPN counterpart from the games on its date.
+        
+        Args:
+            bdb_game_id: Big Data Bowl game ID
+            games: ESPN scoreboard for the game's date
+            teams: Optional tuple of (home_team, away_team) to help match
+            
+        Returns:
+            GameMapping object if matched, None otherwise
+        """
+        date, game_num = self.parse_bdb_game_id(bdb_game_id)
         
         if not games:
             print(f"No games found for date {date}")
@@ -228,8 +293,7 @@ class GameMapper:
             print(f"Could not match game {bdb_game_id} to ESPN games")
             return None
         
-        # Create and cache mapping
-        mapping = GameMapping(
+        return GameMapping(
             bdb_game_id=bdb_game_id,
             espn_game_id=matched_game.espn_id,
             date=date,
@@ -239,11 +303,54 @@ class GameMapper:
             away_team_abbrev=matched_game.away_team_abbrev,
             stadium=matched_game.stadium,
         )
+    
+    def prefetch(self, bdb_game_ids: Iterable) -> dict[str, GameMapping]:
+        """
+        Map many games at once, fetching their dates' scoreboards concurrently.
         
-        self._mappings[bdb_game_id] = mapping
-        self._save_cache()
+        Must not be called from a running event loop (await prefetch_async
+        there instead).
         
-        return mapping
+        Args:
+            bdb_game_ids: Big Data Bowl game IDs
+            
+        Returns:
+            Mappings for the games that could be matched, by BDB game ID
+        """
+        return asyncio.run(self.prefetch_async(bdb_game_ids))
+    
+    async def prefetch_async(
+        self,
+        bdb_game_ids: Iterable,
+        async_client: Optional[AsyncESPNClient] = None
+    ) -> dict[str, GameMapping]:
+        """
+        Coroutine version of prefetch.
+        
+        Args:
+            bdb_game_ids: Big Data Bowl game IDs
+            async_client: Client to fetch with (defaults to one sharing this
+                mapper's ESPNClient)
+            
+        Returns:
+            Mappings for the games that could be matched, by BDB game ID
+        """
+        bdb_game_ids = list(dict.fromkeys(str(g) for g in bdb_game_ids))
+        missing = [g for g in bdb_game_ids if g not in self._mappings]
+        
+        if missing:
+            client = async_client or AsyncESPNClient(self.espn_client)
+            scoreboards = await client.get_scoreboards(
+                [self.parse_bdb_game_id(g)[0] for g in missing]
+            )
+            for bdb_game_id in missing:
+                games = scoreboards[self.parse_bdb_game_id(bdb_game_id)[0]]
+                mapping = self._match_game(bdb_game_id, games)
+                if mapping:
+                    self._mappings[bdb_game_id] = mapping
+            self._save_cache()
+        
+        return {g: self._mappings[g] for g in bdb_game_ids if g in self._mappings}
     
     def get_all_mappings(self) -> dict[str, GameMapping]:
         """Get all cached mappings."""
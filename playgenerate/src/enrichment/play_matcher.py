@@ -5,20 +5,45 @@ Matches plays from tracking data to ESPN's play-by-play using:
 - Yard line position (absolute_yardline_number)
 - Sequential order within game
 - Ball landing coordinates (for pass plays)
+
+Candidate ESPN plays are scored all at once against each game's PlayTable
+arrays rather than one PlayInfo at a time.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Optional
+import asyncio
 import os
 import sys
 
+import numpy as np
+
+# Handle both package and script execution
+try:
+    from lru_cache import MB, BoundedCache
+    from metrics import METRICS
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from lru_cache import MB, BoundedCache
+    from metrics import METRICS
+
 # Handle both module and script execution
 try:
     from .espn_client import ESPNClient, PlayInfo, GameInfo
+    from .async_client import AsyncESPNClient
     from .game_mapper import GameMapper, GameMapping
+    from .play_table import PlayTable
 except ImportError:
     from espn_client import ESPNClient, PlayInfo, GameInfo
+    from async_client import AsyncESPNClient
     from game_mapper import GameMapper, GameMapping
+    from play_table import PlayTable
+
+
+# calculate_match_score's tiers as lookup tables indexed by distance (the
+# last entry covers every larger distance)
+YARDLINE_SCORES = np.array([0.6, 0.5, 0.5, 0.3, 0.3, 0.3, 0.1, 0.1, 0.1, 0.1, 0.1, 0.0])
+SEQUENCE_SCORES = np.array([0.3, 0.2, 0.2, 0.1, 0.1, 0.1, 0.0])
 
 
 @dataclass
@@ -56,32 +81,113 @@ class EnrichedPlay:
 class PlayMatcher:
     """Matches Big Data Bowl plays to ESPN play-by-play data."""
     
-    def __init__(self, espn_client: Optional[ESPNClient] = None, game_mapper: Optional[GameMapper] = None):
+    def __init__(
+        self,
+        espn_client: Optional[ESPNClient] = None,
+        game_mapper: Optional[GameMapper] = None,
+        cache_mb: float = ESPNClient.DEFAULT_MEMORY_CACHE_MB
+    ):
         """
         Initialize the play matcher.
         
         Args:
             espn_client: ESPN client instance
             game_mapper: Game mapper instance
+            cache_mb: Size cap for the cached play tables (and, separately,
+                game infos); least recently used games are evicted past it
+                and re-read through the ESPN client when needed again
         """
         self.espn_client = espn_client or ESPNClient()
         self.game_mapper = game_mapper or GameMapper(espn_client=self.espn_client)
-        self._espn_plays_cache: dict[str, list[PlayInfo]] = {}
-        self._game_info_cache: dict[str, GameInfo] = {}
+        self._espn_plays_cache: BoundedCache = BoundedCache(int(cache_mb * MB), name='espn_plays')
+        self._game_info_cache: BoundedCache = BoundedCache(int(cache_mb * MB), name='espn_game_info')
     
-    def _get_espn_plays(self, espn_game_id: str) -> list[PlayInfo]:
-        """Get and cache ESPN plays for a game."""
-        if espn_game_id not in self._espn_plays_cache:
-            self._espn_plays_cache[espn_game_id] = self.espn_client.get_plays(espn_game_id)
-        return self._espn_plays_cache[espn_game_id]
+    def _get_espn_plays(self, espn_game_id: str) -> PlayTable:
+        """Get and cache ESPN plays for a game (empty if the request failed)."""
+        plays = self._espn_plays_cache.get(espn_game_id)
+        METRICS.cache_lookup('espn_plays', plays is not None)
+        if plays is None:
+            plays = self.espn_client.get_play_table(espn_game_id)
+            if plays is None:
+                plays = PlayTable()
+            self._espn_plays_cache[espn_game_id] = plays
+        return plays
     
     def _get_game_info(self, espn_game_id: str) -> Optional[GameInfo]:
         """Get and cache game info."""
-        if espn_game_id not in self._game_info_cache:
+        info = self._game_info_cache.get(espn_game_id)
+        if info is None:
             info = self.espn_client.get_game_info(espn_game_id)
             if info:
                 self._game_info_cache[espn_game_id] = info
-        return self._game_info_cache.get(espn_game_id)
+        return info
+    
+    def get_game_version(self, game_id: str) -> Optional[str]:
+        """
+        Identify which ESPN data a game's matches would be made against.
+        
+        Args:
+            game_id: Big Data Bowl game_id
+            
+        Returns:
+            "<espn_game_id>:<status>:<ETag>" (see ESPNClient.get_game_version),
+            or None if the game can't be mapped or fetched
+        """
+        game_mapping = self.game_mapper.get_mapping(game_id)
+        if not game_mapping:
+            return None
+        version = self.espn_client.get_game_version(game_mapping.espn_game_id)
+        return f"{game_mapping.espn_game_id}:{version}" if version else None
+    
+    def prefetch(self, bdb_game_ids: Iterable) -> int:
+        """
+        Map games and fetch their ESPN play-by-play concurrently, so
+        match_play for those games needs no further requests.
+        
+        Must not be called from a running event loop (await prefetch_async
+        there instead).
+        
+        Args:
+            bdb_game_ids: Big Data Bowl game IDs (e.g. a week's games)
+            
+        Returns:
+            Number of games whose plays are ready
+        """
+        return asyncio.run(self.prefetch_async(bdb_game_ids))
+    
+    async def prefetch_async(
+        self,
+        bdb_game_ids: Iterable,
+        async_client: Optional[AsyncESPNClient] = None
+    ) -> int:
+        """
+        Coroutine version of prefetch.
+        
+        Args:
+            bdb_game_ids: Big Data Bowl game IDs
+            async_client: Client to fetch with (defaults to one sharing this
+                matcher's ESPNClient)
+            
+        Returns:
+            Number of games whose plays are ready
+        """
+        client = async_client or AsyncESPNClient(self.espn_client)
+        mappings = await self.game_mapper.prefetch_async(bdb_game_ids, client)
+        
+        espn_game_ids = [
+            m.espn_game_id for m in mappings.values()
+            if m.espn_game_id not in self._espn_plays_cache
+        ]
+        games = await client.get_parsed_games(espn_game_ids)
+        for espn_game_id, game in games.items():
+            # Failed fetches stay uncached so match_play retries them
+            if not game:
+                continue
+            self._espn_plays_cache[espn_game_id] = game.plays
+            if game.info:
+                self._game_info_cache[espn_game_id] = game.info
+        
+        return sum(1 for m in mappings.values() if m.espn_game_id in self._espn_plays_cache)
     
     @staticmethod
     def absolute_to_espn_yardline(absolute_yardline: int) -> int:
@@ -181,6 +287,38 @@ class PlayMatcher:
         
         return min(score, 1.0)
     
+    @staticmethod
+    def match_scores(
+        plays: PlayTable,
+        bdb_yardline: int,
+        play_sequence_hint: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        calculate_match_score for every ESPN play of a game at once.
+        
+        Args:
+            plays: The game's ESPN plays
+            bdb_yardline: Big Data Bowl absolute yardline
+            play_sequence_hint: Approximate position in game sequence
+            
+        Returns:
+            Score per play (0.0 for special teams plays without a yardline)
+        """
+        sequence = np.arange(len(plays))
+        sequence_dist = np.abs(sequence - play_sequence_hint) if play_sequence_hint else sequence
+        yard_line = plays.yard_line.astype(np.int64)
+        yardline_diff = np.abs(PlayMatcher.absolute_to_espn_yardline(bdb_yardline) - yard_line)
+        
+        # Same tiers, added in the same order, as calculate_match_score
+        score = YARDLINE_SCORES[np.minimum(yardline_diff, len(YARDLINE_SCORES) - 1)]
+        score += SEQUENCE_SCORES[np.minimum(sequence_dist, len(SEQUENCE_SCORES) - 1)]
+        score += np.where(plays.down > 0, 0.1, 0.0)
+        np.minimum(score, 1.0, out=score)
+        
+        # Skip special teams plays without meaningful yardlines
+        score[(yard_line == 0) & (plays.down == 0)] = 0.0
+        return score
+    
     def match_play(
         self,
         game_id: str,
@@ -216,45 +354,22 @@ class PlayMatcher:
         
         # Get ESPN plays
         espn_plays = self._get_espn_plays(game_mapping.espn_game_id)
-        if not espn_plays:
+        if not len(espn_plays):
             print(f"No ESPN plays found for game {game_mapping.espn_game_id}")
             return None
         
         # Get game info
         game_info = self._get_game_info(game_mapping.espn_game_id)
         
-        # Convert BDB yardline for comparison (to ESPN's format)
-        bdb_converted = self.absolute_to_espn_yardline(absolute_yardline)
-        
-        # Find best matching play
-        best_match: Optional[PlayInfo] = None
-        best_score = 0.0
-        best_sequence_idx = 0
-        
-        for idx, espn_play in enumerate(espn_plays):
-            # Skip special teams plays without meaningful yardlines
-            if espn_play.yard_line == 0 and espn_play.down == 0:
-                continue
-            
-            # Calculate sequence hint distance
-            sequence_dist = abs(idx - (play_sequence_hint or 0)) if play_sequence_hint else idx
-            
-            score = self.calculate_match_score(
-                bdb_yardline=absolute_yardline,
-                espn_yardline=espn_play.yard_line,
-                bdb_direction=play_direction,
-                espn_down=espn_play.down,
-                sequence_distance=sequence_dist
-            )
-            
-            if score > best_score:
-                best_score = score
-                best_match = espn_play
-                best_sequence_idx = idx
+        # Best match: the first play with the highest score
+        scores = self.match_scores(espn_plays, absolute_yardline, play_sequence_hint)
+        best_idx = int(np.argmax(scores))
+        best_score = float(scores[best_idx])
         
-        if not best_match or best_score < 0.3:
+        if best_score < 0.3:
             print(f"No good match found for play {play_id} (best score: {best_score:.2f})")
             return None
+        best_match = espn_plays.row(best_idx)
         
         # Create enriched play
         return EnrichedPlay(
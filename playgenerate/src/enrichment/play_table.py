@@ -0,0 +1,212 @@
+"""
+Compact, parse-once storage of a game's ESPN play-by-play.
+
+A game summary is several MB of nested JSON, and walking its drives for
+every get_plays / get_game_info call costs CPU on each call. ESPNClient
+instead parses each summary once into a ParsedGame and drops the raw
+summary from its in-memory cache. A ParsedGame holds the game's GameInfo
+and a PlayTable:
+
+    numeric fields  one small-int numpy array per field (quarter, down,
+                    distance, yard line, scores, scoring flag)
+    string fields   play id, clock, yard-line side, type and text as int32
+                    indexes into a per-game StringPool, so repeated values
+                    ("Pass Reception", "15:00", team abbreviations) are
+                    stored once
+
+PlayMatcher scores candidate plays directly against the arrays; row()
+rebuilds a PlayInfo for the matched play.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+try:
+    from .espn_client import GameInfo, PlayInfo
+except ImportError:
+    from espn_client import GameInfo, PlayInfo
+
+
+class StringPool:
+    """Stores each distinct string once; values are referenced by index."""
+
+    __slots__ = ('values', '_ids')
+
+    def __init__(self):
+        self.values: list[str] = []
+        self._ids: dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        """Index of a value, adding it if it is new."""
+        index = self._ids.get(value)
+        if index is None:
+            index = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def __getitem__(self, index: int) -> str:
+        return self.values[index]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+# (field, dtype) of the numeric columns
+NUMERIC_COLUMNS = (
+    ('quarter', np.int8),
+    ('down', np.int8),
+    ('distance', np.int16),
+    ('yard_line', np.int16),
+    ('home_score', np.int16),
+    ('away_score', np.int16),
+    ('scoring_play', np.bool_),
+)
+
+# String columns, stored as indexes into the pool
+STRING_COLUMNS = ('play_id', 'clock', 'yard_line_side', 'play_type', 'play_text')
+
+
+class PlayTable:
+    """Columnar play-by-play for one game, in ESPN order."""
+
+    def __init__(self, columns: Optional[dict[str, np.ndarray]] = None, pool: Optional[StringPool] = None):
+        """
+        Initialize the table (empty if no columns are given).
+
+        Args:
+            columns: Array per field of NUMERIC_COLUMNS and STRING_COLUMNS,
+                all of the same length
+            pool: Pool the string columns index into
+        """
+        if columns is None:
+            columns = {name: np.zeros(0, dtype) for name, dtype in NUMERIC_COLUMNS}
+            columns.update({name: np.zeros(0, np.int32) for name in STRING_COLUMNS})
+        self.pool = pool or StringPool()
+        self.quarter: np.ndarray = columns['quarter']
+        self.down: np.ndarray = columns['down']
+        self.distance: np.ndarray = columns['distance']
+        self.yard_line: np.ndarray = columns['yard_line']
+        self.home_score: np.ndarray = columns['home_score']
+        self.away_score: np.ndarray = columns['away_score']
+        self.scoring_play: np.ndarray = columns['scoring_play']
+        self.play_id: np.ndarray = columns['play_id']
+        self.clock: np.ndarray = columns['clock']
+        self.yard_line_side: np.ndarray = columns['yard_line_side']
+        self.play_type: np.ndarray = columns['play_type']
+        self.play_text: np.ndarray = columns['play_text']
+
+    @classmethod
+    def from_summary(cls, summary: Optional[dict]) -> 'PlayTable':
+        """
+        Parse a game summary's drives (finished ones, then the current one
+        for games in progress).
+
+        Args:
+            summary: ESPN game summary JSON
+
+        Returns:
+            PlayTable with one row per play (empty if summary is None)
+        """
+        if not summary:
+            return cls()
+
+        drives = list(summary.get('drives', {}).get('previous', []))
+        current = summary.get('drives', {}).get('current', {})
+        if current:
+            drives.append(current)
+
+        pool = StringPool()
+        rows = []
+        for drive in drives:
+            for play in drive.get('plays', []):
+                try:
+                    start = play.get('start', {})
+                    rows.append((
+                        play.get('period', {}).get('number', 0) or 0,
+                        start.get('down', 0) or 0,
+                        start.get('distance', 0) or 0,
+                        start.get('yardLine', 0) or 0,
+                        play.get('homeScore', 0) or 0,
+                        play.get('awayScore', 0) or 0,
+                        bool(play.get('scoringPlay', False)),
+                        pool.add(str(play.get('id', ''))),
+                        pool.add(play.get('clock', {}).get('displayValue', '')),
+                        pool.add(start.get('team', {}).get('abbreviation', '')),
+                        pool.add(play.get('type', {}).get('text', '')),
+                        pool.add(play.get('text', '')),
+                    ))
+                except (KeyError, ValueError, AttributeError) as e:
+                    print(f"Error parsing play: {e}")
+                    continue
+
+        if not rows:
+            return cls(pool=pool)
+
+        fields = list(zip(*rows))
+        columns = {
+            name: np.array(values, dtype)
+            for (name, dtype), values in zip(NUMERIC_COLUMNS, fields)
+        }
+        columns.update({
+            name: np.array(values, np.int32)
+            for name, values in zip(STRING_COLUMNS, fields[len(NUMERIC_COLUMNS):])
+        })
+        return cls(columns, pool)
+
+    def __len__(self) -> int:
+        return len(self.quarter)
+
+    def row(self, index: int) -> PlayInfo:
+        """The play at a position as a PlayInfo."""
+        pool = self.pool
+        return PlayInfo(
+            play_id=pool[self.play_id[index]],
+            quarter=int(self.quarter[index]),
+            clock=pool[self.clock[index]],
+            down=int(self.down[index]),
+            distance=int(self.distance[index]),
+            yard_line=int(self.yard_line[index]),
+            yard_line_side=pool[self.yard_line_side[index]],
+            play_text=pool[self.play_text[index]],
+            play_type=pool[self.play_type[index]],
+            scoring_play=bool(self.scoring_play[index]),
+            home_score=int(self.home_score[index]),
+            away_score=int(self.away_score[index]),
+        )
+
+    def to_plays(self) -> list[PlayInfo]:
+        """Every play as a PlayInfo."""
+        values = self.pool.values
+        columns = zip(
+            *(getattr(self, name).tolist() for name, _ in NUMERIC_COLUMNS),
+            *([values[i] for i in getattr(self, name).tolist()] for name in STRING_COLUMNS)
+        )
+        return [
+            PlayInfo(
+                play_id=play_id, quarter=quarter, clock=clock, down=down,
+                distance=distance, yard_line=yard_line, yard_line_side=side,
+                play_text=text, play_type=play_type, scoring_play=scoring,
+                home_score=home_score, away_score=away_score,
+            )
+            for (quarter, down, distance, yard_line, home_score, away_score, scoring,
+                 play_id, clock, side, play_type, text) in columns
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the arrays and pooled strings."""
+        arrays = sum(
+            getattr(self, name).nbytes
+            for name in [n for n, _ in NUMERIC_COLUMNS] + list(STRING_COLUMNS)
+        )
+        return arrays + sum(sys.getsizeof(value) for value in self.pool.values)
+
+
+@dataclass
+class ParsedGame:
+    """A game summary reduced to what matching needs."""
+    info: Optional[GameInfo]
+    plays: PlayTable
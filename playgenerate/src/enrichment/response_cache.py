@@ -0,0 +1,239 @@
+"""
+Persistent, size-capped cache of ESPN API responses.
+
+Responses are stored in one SQLite file keyed by URL, so scoreboards and
+game summaries fetched by one pipeline run (or batch worker) are reused by
+every later run instead of downloaded again:
+
+    final games     kept with no expiry; a completed game never changes
+    other responses expire after a TTL chosen by the caller (short for games
+                    in progress, longer for scheduled games)
+    revalidation    expired entries keep their body and ETag/Last-Modified
+                    validators, so the client can send a conditional request
+                    and refresh the entry on 304 Not Modified
+    size cap        bodies are zlib-compressed; past max_bytes the least
+                    recently used entries are evicted
+
+The database runs in WAL mode, so batch worker processes can share one file.
+
+Layout:
+    espn_cache.sqlite
+"""
+
+import importlib.util
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+# orjson is optional - faster encoding and decoding of stored bodies. It is
+# imported where it's used, so runs that never touch ESPN don't load it
+try:
+    ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+except ModuleNotFoundError:
+    ORJSON_AVAILABLE = False
+
+
+# Default on-disk budget
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Evict down to this fraction of max_bytes so every insert doesn't evict
+EVICT_TO = 0.9
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+def _loads(text: bytes) -> dict:
+    """Decode a stored body."""
+    if ORJSON_AVAILABLE:
+        import orjson
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dumps(data: dict) -> bytes:
+    """Encode a body for storage."""
+    if ORJSON_AVAILABLE:
+        import orjson
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body and its validators."""
+    data: dict
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: Optional[float]
+    size: int = 0  # Length of the JSON text
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be used without revalidating."""
+        return self.expires_at is None or self.expires_at > time.time()
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTLs, validators and an LRU size cap."""
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache (the database is created on first use).
+
+        Args:
+            path: SQLite file path
+            max_bytes: Cap on the total size of stored (compressed) bodies
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections can't be shared with forked worker processes
+        if self._conn is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(SCHEMA)
+            conn.commit()
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Look up a response, fresh or expired.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            CachedResponse (check .fresh before using it as-is), or None
+        """
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                'SELECT body, etag, last_modified, expires_at FROM responses WHERE url = ?',
+                (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute('UPDATE responses SET accessed_at = ? WHERE url = ?', (time.time(), url))
+            conn.commit()
+
+        body, etag, last_modified, expires_at = row
+        text = zlib.decompress(body)
+        return CachedResponse(
+            data=_loads(text),
+            etag=etag,
+            last_modified=last_modified,
+            expires_at=expires_at,
+            size=len(text),
+        )
+
+    def contains(self, url: str) -> bool:
+        """Whether a response is stored, fresh or expired (without decoding it)."""
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT 1 FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+        return row is not None
+
+    def validators(self, url: str) -> tuple[Optional[str], Optional[str]]:
+        """(ETag, Last-Modified) of a stored response (without decoding it)."""
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT etag, last_modified FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+        return row if row is not None else (None, None)
+
+    def put(
+        self,
+        url: str,
+        data: dict,
+        ttl_seconds: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """
+        Store a response.
+
+        Args:
+            url: Request URL
+            data: Decoded JSON body
+            ttl_seconds: Seconds until the entry needs revalidating (None
+                keeps it forever)
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+        """
+        text = _dumps(data)
+        body = zlib.compress(text, 1)
+        now = time.time()
+        expires_at = now + ttl_seconds if ttl_seconds is not None else None
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (url, body, len(body), etag, last_modified, expires_at, now)
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def refresh(self, url: str, ttl_seconds: Optional[float] = None) -> None:
+        """Extend an entry's expiry after a 304 Not Modified."""
+        expires_at = time.time() + ttl_seconds if ttl_seconds is not None else None
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                'UPDATE responses SET expires_at = ?, accessed_at = ? WHERE url = ?',
+                (expires_at, time.time(), url)
+            )
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used entries once the cache is over its cap."""
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = self.max_bytes * EVICT_TO
+        evict = []
+        for url, size in conn.execute('SELECT url, size FROM responses ORDER BY accessed_at'):
+            if total <= target:
+                break
+            evict.append((url,))
+            total -= size
+        conn.executemany('DELETE FROM responses WHERE url = ?', evict)
+        print(f"ESPN cache over {self.max_bytes / 1024 / 1024:g} MB, evicted {len(evict)} responses")
+
+    def stats(self) -> dict:
+        """Entry count and stored bytes."""
+        with self._lock:
+            count, size = self._connection().execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses'
+            ).fetchone()
+        return {'entries': count, 'bytes': size}
+
+    def clear(self) -> None:
+        """Delete every stored response."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute('DELETE FROM responses')
+            conn.commit()
@@ -0,0 +1,186 @@
+"""
+Streaming stage executor.
+
+Runs a chain of per-item stages (e.g. enrich -> scene -> video) as a
+pipeline: each stage has its own worker threads and hands items to the next
+stage through a bounded queue. An item moves on as soon as its stage is
+done, so the first result is ready after one item's worth of work and total
+wall time is bounded by the slowest stage rather than the sum of all stages.
+
+The stages are dominated by network calls (ESPN, Gemini, Veo), so threads
+overlap them well despite the GIL.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """A pipeline stage applied to every item."""
+    name: str
+    fn: Callable[[Any], Any]  # Returns the next stage's input, or None to drop the item
+    workers: int = 1
+
+
+@dataclass
+class StageResult:
+    """An item that left the pipeline, by finishing or by being dropped."""
+    item: Any  # Output of the last stage that ran
+    stage: str  # Name of the last stage that ran
+    completed: bool  # Whether the item went through every stage
+    error: Optional[str] = None
+    seconds: dict[str, float] = field(default_factory=dict)  # Time spent per stage
+
+
+class StreamingExecutor:
+    """Moves items through stages connected by bounded queues."""
+
+    def __init__(self, stages: list[Stage], queue_size: int = 4):
+        """
+        Initialize the executor.
+
+        Args:
+            stages: Stages in order; each stage's output is the next one's input
+            queue_size: Capacity of each inter-stage queue. Bounds how far a
+                fast stage can run ahead of a slow one (and memory held).
+        """
+        if not stages:
+            raise ValueError("At least one stage is required")
+        self.stages = stages
+        self.queue_size = queue_size
+
+    def run(self, items: Iterable[Any]) -> Iterator[StageResult]:
+        """
+        Stream items through all stages.
+
+        Args:
+            items: Inputs to the first stage
+
+        Yields:
+            StageResult for every item as soon as it finishes or is dropped,
+            in completion order
+
+        Raises:
+            Whatever iterating items raised, once the items read before it
+            have left the pipeline
+        """
+        # queues[i] feeds stage i; the last queue collects results
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        results: queue.Queue = queue.Queue()
+        queues.append(results)
+
+        threads = []
+        for i, stage in enumerate(self.stages):
+            # The last worker of a stage to finish closes the next queue
+            remaining = [stage.workers]
+            lock = threading.Lock()
+            for n in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(i, queues[i], queues[i + 1], results, remaining, lock),
+                    name=f"{stage.name}-{n}",
+                    daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+
+        feed_errors: list[BaseException] = []
+        feeder = threading.Thread(
+            target=self._feed, args=(items, queues[0], self.stages[0].workers, feed_errors),
+            name="feeder", daemon=True
+        )
+        feeder.start()
+
+        while True:
+            result = results.get()
+            if result is _DONE:
+                break
+            yield result
+
+        feeder.join()
+        for thread in threads:
+            thread.join()
+
+        if feed_errors:
+            raise feed_errors[0]
+
+    @staticmethod
+    def _feed(
+        items: Iterable[Any],
+        out: queue.Queue,
+        consumers: int,
+        errors: list[BaseException]
+    ) -> None:
+        """
+        Put every input on the first queue, then one end marker per worker.
+
+        The end markers are sent even if iterating items fails, so the
+        workers (and run) still finish; the error is left in errors.
+        """
+        try:
+            for item in items:
+                out.put((item, {}))
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            for _ in range(consumers):
+                out.put(_DONE)
+
+    def _worker(
+        self,
+        index: int,
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+        results: queue.Queue,
+        remaining: list[int],
+        lock: threading.Lock
+    ) -> None:
+        """Apply stage `index` to items from inbox until its end marker arrives."""
+        stage = self.stages[index]
+        is_last = index == len(self.stages) - 1
+
+        while True:
+            entry = inbox.get()
+            if entry is _DONE:
+                break
+
+            item, seconds = entry
+            start = time.perf_counter()
+            try:
+                output = stage.fn(item)
+                error = None
+            except Exception as e:
+                output = None
+                error = f"{type(e).__name__}: {e}"
+            seconds = {**seconds, stage.name: time.perf_counter() - start}
+
+            if output is None or is_last:
+                # Finished, failed or dropped: report and don't pass on
+                results.put(StageResult(
+                    item=item if output is None else output,
+                    stage=stage.name,
+                    completed=is_last and output is not None,
+                    error=error,
+                    seconds=seconds,
+                ))
+            else:
+                outbox.put((output, seconds))
+
+        with lock:
+            remaining[0] -= 1
+            last_worker = remaining[0] == 0
+
+        if last_worker:
+            if is_last:
+                results.put(_DONE)
+            else:
+                for _ in range(self.stages[index + 1].workers):
+                    outbox.put(_DONE)
@@ -1,4 +1,11 @@
-from .scene_gen import SceneGenerator
-from .video_gen import VideoGenerator
-
+# Imports are done lazily so the Gemini/Veo SDKs are only loaded when used
 __all__ = ['SceneGenerator', 'VideoGenerator']
+
+def __getattr__(name):
+    if name == 'SceneGenerator':
+        from .scene_gen import SceneGenerator
+        return SceneGenerator
+    elif name == 'VideoGenerator':
+        from .video_gen import VideoGenerator
+        return VideoGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,18 +6,33 @@ optimized for coaches and GMs analyzing plays. Uses All-22 and End Zone camera
 perspectives standard in NFL film rooms.
 """
 
+import importlib.util
 import os
-from typing import Optional
+import sys
+from typing import Optional, Union
 from dataclasses import dataclass
 import pandas as pd
-import math
 
-# Try to import google.generativeai
+# Handle both package and script execution
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    from tracking.play_index import PlayIndex
+    from tracking.features import compute_player_features
+    from metrics import METRICS
+    from ratelimit import TokenBucket
 except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tracking.play_index import PlayIndex
+    from tracking.features import compute_player_features
+    from metrics import METRICS
+    from ratelimit import TokenBucket
+
+# google.generativeai takes ~0.5s to import, so only check that it's
+# installed here; it is imported when a SceneGenerator connects to Gemini
+try:
+    GEMINI_AVAILABLE = importlib.util.find_spec("google.generativeai") is not None
+except ModuleNotFoundError:
     GEMINI_AVAILABLE = False
+if not GEMINI_AVAILABLE:
     print("Warning: google-generativeai not installed. Scene generation will use templates only.")
 
 
@@ -33,6 +48,7 @@ class SceneDescription:
     formation_offense: str = ""  # Detected offensive formation/personnel
     formation_defense: str = ""  # Detected defensive alignment
     key_matchups: list[str] = None  # Notable matchups to watch
+    generated_by: str = "template"  # Gemini model name, or "template"
     
     def __post_init__(self):
         if self.key_matchups is None:
@@ -91,6 +107,10 @@ DEFENSIVE_FORMATIONS = {
 class SceneGenerator:
     """Generates tactical scene descriptions from tracking data for coaching analysis."""
     
+    # Bump whenever PROMPT_TEMPLATE or the template fallback changes, so
+    # checkpointed scene descriptions are regenerated
+    PROMPT_VERSION = 1
+    
     PROMPT_TEMPLATE = '''You are an NFL film analyst creating a coaching film description for video generation.
 The output will be used by coaches and GMs to analyze play development and make strategic decisions.
 
@@ -126,20 +146,28 @@ CRITICAL VISUAL REQUIREMENTS:
 
 Scene description:'''
 
-    def __init__(self, api_key: Optional[str] = None, model_name: str = "gemini-2.0-flash"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model_name: str = "gemini-2.0-flash",
+        rate_limiter: Optional[TokenBucket] = None
+    ):
         """
         Initialize the scene generator.
         
         Args:
             api_key: Google AI API key (uses GOOGLE_API_KEY env var if not provided)
             model_name: Gemini model to use
+            rate_limiter: Optional token bucket every Gemini request waits on
         """
         self.api_key = api_key or os.environ.get("GOOGLE_API_KEY")
         self.model_name = model_name
+        self.rate_limiter = rate_limiter
         self.model = None
         
         if GEMINI_AVAILABLE and self.api_key:
             try:
+                import google.generativeai as genai
                 genai.configure(api_key=self.api_key)
                 self.model = genai.GenerativeModel(model_name)
                 print(f"Gemini model {model_name} initialized")
@@ -163,13 +191,18 @@ Scene description:'''
         # Get pre-snap frame (frame_id closest to snap or first frame)
         pre_snap = tracking_df[tracking_df['frame_id'] == tracking_df['frame_id'].min()]
         
-        # Separate offense and defense
-        offense = pre_snap[pre_snap.get('club', '') == pre_snap.get('possession_team', '')]
-        defense = pre_snap[pre_snap.get('club', '') != pre_snap.get('possession_team', '')]
+        # Separate offense and defense (Big Data Bowl 2026 data only has player_side)
+        if 'club' in pre_snap and 'possession_team' in pre_snap:
+            is_offense = pre_snap['club'] == pre_snap['possession_team']
+        else:
+            is_offense = pre_snap.get('player_side', pd.Series('', index=pre_snap.index)) == 'Offense'
+        offense = pre_snap[is_offense]
+        defense = pre_snap[~is_offense]
         
-        # Count positions for personnel grouping
-        off_positions = offense['player_position'].value_counts() if 'player_position' in offense else {}
-        def_positions = defense['player_position'].value_counts() if 'player_position' in defense else {}
+        # Count positions for personnel grouping (as plain values, so a
+        # categorical column doesn't report zero counts for absent positions)
+        off_positions = offense['player_position'].astype(object).value_counts() if 'player_position' in offense else {}
+        def_positions = defense['player_position'].astype(object).value_counts() if 'player_position' in defense else {}
         
         # Determine offensive personnel (e.g., 11, 12, 21, etc.)
         rb_count = off_positions.get('RB', 0) + off_positions.get('FB', 0)
@@ -202,7 +235,8 @@ Scene description:'''
     def format_tracking_summary(
         self,
         tracking_df: pd.DataFrame,
-        max_players: int = 11
+        max_players: int = 11,
+        features: Optional[pd.DataFrame] = None
     ) -> str:
         """
         Format tracking data into a tactical summary organized by unit.
@@ -210,39 +244,31 @@ Scene description:'''
         Args:
             tracking_df: DataFrame with tracking data for a single play
             max_players: Maximum number of players to include per unit
+            features: Optional precomputed player features for the play
+                (from compute_player_features); computed if not given
             
         Returns:
             Formatted string summarizing player movements tactically
         """
-        if tracking_df.empty:
-            return "Player tracking data not available."
+        if features is None:
+            if tracking_df.empty:
+                return "Player tracking data not available."
+            features = compute_player_features(tracking_df)
         
         # Group by team/role
         offense_summary = []
         defense_summary = []
         
-        players = tracking_df.groupby('player_name')
-        
-        for player_name, player_data in players:
-            player_data = player_data.sort_values('frame_id')
+        for player in features.itertuples(index=False):
+            player_name = player.player_name
+            position = player.player_position
+            side = player.player_side
             
-            if player_data.empty:
-                continue
-            
-            first = player_data.iloc[0]
-            last = player_data.iloc[-1]
-            
-            position = first.get('player_position', 'Unknown')
-            role = first.get('player_role', '')
-            side = first.get('player_side', '')
-            
-            # Calculate tactical movement metrics
-            dx = last['x'] - first['x']
-            dy = last['y'] - first['y']
-            total_distance = math.sqrt(dx**2 + dy**2)
-            
-            # Get max speed and acceleration
-            max_speed = player_data['s'].max() if 's' in player_data else 0
+            # Tactical movement metrics, precomputed per player
+            dx = player.dx
+            dy = player.dy
+            total_distance = player.displacement
+            max_speed = player.max_speed
             
             # Determine route/assignment description
             if position in ['WR', 'TE', 'RB', 'FB']:
@@ -446,7 +472,8 @@ Scene description:'''
     def generate_description(
         self,
         enriched_play: dict,
-        tracking_df: Optional[pd.DataFrame] = None
+        tracking_df: Optional[pd.DataFrame] = None,
+        player_features: Optional[pd.DataFrame] = None
     ) -> SceneDescription:
         """
         Generate a tactical scene description for coaching analysis.
@@ -454,6 +481,8 @@ Scene description:'''
         Args:
             enriched_play: Enriched play data dict
             tracking_df: Optional tracking data DataFrame
+            player_features: Optional precomputed player features for the
+                play (from compute_player_features)
             
         Returns:
             SceneDescription with tactical content for coaches/GMs
@@ -466,7 +495,7 @@ Scene description:'''
         # Format tracking summary tactically
         tracking_summary = "Player tracking data not available."
         if tracking_df is not None and not tracking_df.empty:
-            tracking_summary = self.format_tracking_summary(tracking_df)
+            tracking_summary = self.format_tracking_summary(tracking_df, features=player_features)
         
         # Format formation analysis for prompt
         formation_text = (
@@ -483,6 +512,7 @@ Scene description:'''
         yard_line = enriched_play.get('absolute_yard_line', enriched_play.get('yard_line', 50))
         
         # Generate description
+        generated_by = "template"
         if self.model:
             # Use Gemini for detailed tactical description
             prompt = self.PROMPT_TEMPLATE.format(
@@ -500,9 +530,17 @@ Scene description:'''
             )
             
             try:
-                response = self.model.generate_content(prompt)
-                description = response.text.strip()
+                if self.rate_limiter is not None:
+                    waited = self.rate_limiter.acquire()
+                    METRICS.observe('rate_limit_wait_seconds', waited, service='gemini')
+                with METRICS.timer('external_call_seconds', service='gemini', endpoint='generate_content'):
+                    response = self.model.generate_content(prompt)
+                    description = response.text.strip()
+                generated_by = self.model_name
+                METRICS.inc('external_calls_total', service='gemini', endpoint='generate_content', outcome='ok')
             except Exception as e:
+                METRICS.inc('external_calls_total', service='gemini', endpoint='generate_content', outcome='error')
+                METRICS.inc('fallbacks_total', service='gemini')
                 print(f"Gemini error: {e}")
                 description = self.generate_template_description(
                     enriched_play, tracking_summary, formation_analysis
@@ -528,36 +566,43 @@ Scene description:'''
             formation_offense=formation_analysis.get('offense', ''),
             formation_defense=formation_analysis.get('defense', ''),
             key_matchups=[],
+            generated_by=generated_by,
         )
     
     def generate_batch(
         self,
         enriched_plays: list[dict],
-        tracking_data: Optional[pd.DataFrame] = None
+        tracking_data: Optional[Union[pd.DataFrame, PlayIndex]] = None
     ) -> list[SceneDescription]:
         """
         Generate scene descriptions for multiple plays.
         
         Args:
             enriched_plays: List of enriched play dicts
-            tracking_data: Optional full tracking DataFrame
+            tracking_data: Optional full tracking DataFrame or PlayIndex
             
         Returns:
             List of SceneDescriptions
         """
         results = []
         
+        # Index once so each play lookup is a slice instead of a full scan,
+        # and compute all player features in one pass
+        feature_index = None
+        if tracking_data is not None:
+            if not isinstance(tracking_data, PlayIndex):
+                tracking_data = PlayIndex(tracking_data)
+            feature_index = PlayIndex(compute_player_features(tracking_data.df))
+        
         for play in enriched_plays:
             # Get tracking data for this play if available
             play_tracking = None
+            player_features = None
             if tracking_data is not None:
-                mask = (
-                    (tracking_data['game_id'] == int(play['game_id'])) &
-                    (tracking_data['play_id'] == play['play_id'])
-                )
-                play_tracking = tracking_data[mask]
+                play_tracking = tracking_data.get(play['game_id'], play['play_id'])
+                player_features = feature_index.get(play['game_id'], play['play_id'])
             
-            scene = self.generate_description(play, play_tracking)
+            scene = self.generate_description(play, play_tracking, player_features)
             results.append(scene)
         
         return results
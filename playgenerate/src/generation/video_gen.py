@@ -5,19 +5,30 @@ Generates AI video clips from scene descriptions using the Veo API
 through Google AI Studio.
 """
 
+import importlib.util
 import os
+import sys
 import time
 from typing import Optional
 from dataclasses import dataclass
 from pathlib import Path
 
-# Try to import google.genai for Veo 3.1
+# Handle both package and script execution
 try:
-    from google import genai
-    from google.genai import types
-    GENAI_AVAILABLE = True
+    from metrics import METRICS
+    from ratelimit import TokenBucket
 except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from metrics import METRICS
+    from ratelimit import TokenBucket
+
+# google.genai takes ~0.4s to import, so only check that it's installed
+# here; it is imported when a VideoGenerator creates its Veo client
+try:
+    GENAI_AVAILABLE = importlib.util.find_spec("google.genai") is not None
+except ModuleNotFoundError:
     GENAI_AVAILABLE = False
+if not GENAI_AVAILABLE:
     print("Warning: google-genai not installed. Video generation unavailable.")
     print("Install with: pip install google-genai")
 
@@ -61,10 +72,17 @@ celebration shots, highlight reel style, lens flare, motion blur,
 cartoon, animated, artistic, abstract, obstructed view, missing players, 
 first person view, helmet cam, end zone camera"""
     
+    MODEL_NAME = "veo-3.1-fast-generate-preview"
+    
+    # Bump whenever the prompt prefix or enhancement changes, so
+    # checkpointed videos are regenerated
+    PROMPT_VERSION = 1
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         output_dir: str = "output/videos",
+        rate_limiter: Optional[TokenBucket] = None,
     ):
         """
         Initialize the video generator.
@@ -72,8 +90,10 @@ first person view, helmet cam, end zone camera"""
         Args:
             api_key: Google AI API key (uses GOOGLE_API_KEY env var if not provided)
             output_dir: Directory to save generated videos
+            rate_limiter: Optional token bucket every Veo submission waits on
         """
         self.api_key = api_key or os.environ.get("GOOGLE_API_KEY")
+        self.rate_limiter = rate_limiter
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -92,6 +112,7 @@ first person view, helmet cam, end zone camera"""
             
         try:
             # Initialize the client with API key
+            from google import genai
             self.client = genai.Client(api_key=self.api_key)
             print("Veo 3.1 client initialized successfully")
         except Exception as e:
@@ -174,8 +195,14 @@ first person view, helmet cam, end zone camera"""
             print(f"  Prompt: {enhanced_prompt[:100]}...")
             
             # Start video generation with Veo 3.1
+            from google.genai import types
+            if self.rate_limiter is not None:
+                waited = self.rate_limiter.acquire()
+                METRICS.observe('rate_limit_wait_seconds', waited, service='veo')
+            # Time the Veo call itself, not prompt building or the rate limit wait
+            start_time = time.time()
             operation = self.client.models.generate_videos(
-                model="veo-3.1-fast-generate-preview",
+                model=self.MODEL_NAME,
                 prompt=enhanced_prompt,
                 config=types.GenerateVideosConfig(
                     negative_prompt=self.NEGATIVE_PROMPT,
@@ -198,6 +225,7 @@ first person view, helmet cam, end zone camera"""
                 
                 time.sleep(20)
                 operation = self.client.operations.get(operation)
+                METRICS.inc('video_polls_total')
             
             # Check for errors in response
             if not operation.response or not operation.response.generated_videos:
@@ -210,6 +238,8 @@ first person view, helmet cam, end zone camera"""
             
             generation_time = time.time() - start_time
             print(f"  Video saved to {output_path} ({generation_time:.1f}s)")
+            METRICS.observe('external_call_seconds', generation_time, service='veo', endpoint='generate_videos')
+            METRICS.inc('external_calls_total', service='veo', endpoint='generate_videos', outcome='ok')
             
             return GeneratedVideo(
                 play_id=play_id,
@@ -225,6 +255,9 @@ first person view, helmet cam, end zone camera"""
         except Exception as e:
             error_msg = str(e)
             print(f"  Error: {error_msg}")
+            METRICS.observe('external_call_seconds', time.time() - start_time, service='veo', endpoint='generate_videos')
+            METRICS.inc('external_calls_total', service='veo', endpoint='generate_videos',
+                        outcome='timeout' if isinstance(e, TimeoutError) else 'error')
             
             return GeneratedVideo(
                 play_id=play_id,
@@ -280,7 +313,7 @@ first person view, helmet cam, end zone camera"""
             "client_initialized": self.client is not None,
             "api_key_set": self.api_key is not None,
             "output_dir": str(self.output_dir),
-            "model": "veo-3.1-fast-generate-preview",
+            "model": self.MODEL_NAME,
         }
 
 
@@ -0,0 +1,190 @@
+"""
+Byte-bounded LRU cache for long-lived in-memory caches.
+
+BoundedCache is a thread-safe MutableMapping that accounts for the
+approximate size of each value and, once the total passes max_bytes,
+evicts least recently used entries. Reads through get() count hits and
+misses; evictions and the cache's size are exported to METRICS
+(cache_evictions_total, cache_bytes, cache_entries) per cache name. An
+optional on_evict callback receives each evicted entry, e.g. to spill it
+to a persistent cache.
+
+Sizes come from approx_size(), a walk over dicts, lists, strings and
+numbers (decoded JSON), dataclasses and objects exposing nbytes (numpy
+arrays, PlayTable). It is an estimate; use it to bound memory, not to
+measure it exactly.
+"""
+
+import dataclasses
+import os
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Hashable, Iterator, Optional
+
+# Handle both package and script execution
+try:
+    from metrics import METRICS
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from metrics import METRICS
+
+
+MB = 1024 * 1024
+
+
+def approx_size(value: Any) -> int:
+    """Approximate bytes held by a value and everything it references."""
+    size = 0
+    stack = [value]
+    seen = set()
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            stack.extend(getattr(obj, f.name) for f in dataclasses.fields(obj))
+        elif hasattr(obj, 'nbytes') and not hasattr(obj, 'dtype'):
+            # numpy arrays' getsizeof already includes their buffer
+            size += int(obj.nbytes)
+    return size
+
+
+class BoundedCache(MutableMapping):
+    """LRU mapping capped by the approximate size of its values."""
+
+    def __init__(
+        self,
+        max_bytes: int,
+        name: str = 'cache',
+        sizeof: Callable[[Any], int] = approx_size,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Cap on the total size of cached values (0 or less
+                keeps nothing)
+            name: Label for the cache in METRICS
+            sizeof: Function estimating a value's size in bytes
+            on_evict: Optional callback for each (key, value) evicted to
+                stay under max_bytes
+        """
+        self.max_bytes = max_bytes
+        self.name = name
+        self.sizeof = sizeof
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._data: OrderedDict = OrderedDict()
+        self._sizes: dict = {}
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Look a key up, marking it recently used and counting a hit or miss."""
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._data[key]
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.put(key, value)
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None) -> None:
+        """
+        Store a value, evicting least recently used entries past max_bytes.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Bytes to account for the value, when the caller knows
+                better or more cheaply than sizeof
+        """
+        if size is None:
+            size = self.sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self.bytes -= self._sizes[key]
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._sizes[key] = size
+            self.bytes += size
+            evicted = self._evict()
+            self._report()
+        # Outside the lock: the callback may be slow (e.g. a disk write)
+        if self.on_evict is not None:
+            for item in evicted:
+                self.on_evict(*item)
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            del self._data[key]
+            self.bytes -= self._sizes.pop(key)
+            self._report()
+
+    def __contains__(self, key: object) -> bool:
+        # Membership checks neither count as lookups nor refresh recency
+        with self._lock:
+            return key in self._data
+
+    def __iter__(self) -> Iterator:
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.bytes = 0
+            self._report()
+
+    def _evict(self) -> list[tuple]:
+        """Drop least recently used entries until under max_bytes."""
+        evicted = []
+        while self._data and self.bytes > self.max_bytes:
+            key, value = self._data.popitem(last=False)
+            self.bytes -= self._sizes.pop(key)
+            evicted.append((key, value))
+        if evicted:
+            self.evictions += len(evicted)
+            METRICS.inc('cache_evictions_total', len(evicted), cache=self.name)
+        return evicted
+
+    def _report(self) -> None:
+        METRICS.set_gauge('cache_bytes', self.bytes, cache=self.name)
+        METRICS.set_gauge('cache_entries', len(self._data), cache=self.name)
+
+    def stats(self) -> dict:
+        """Entries, size, cap, hits, misses and evictions so far."""
+        with self._lock:
+            return {
+                'entries': len(self._data),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
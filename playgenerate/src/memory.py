@@ -0,0 +1,261 @@
+"""
+Per-stage memory accounting for pipeline runs.
+
+MemoryTracker records, for each pipeline stage (extract, load, enrich,
+scene, video, save), the process RSS on entry and exit and the peak RSS
+reached while the stage ran:
+
+    peak RSS        Linux's VmHWM high-water mark, reset at the start of each
+                    stage through /proc/self/clear_refs. Where that isn't
+                    writable (or off Linux) a background thread polls the RSS
+                    instead, which can miss very short spikes.
+    allocations     optionally, tracemalloc's peak of traced Python/numpy
+                    allocations during the stage and the source lines whose
+                    retained memory grew the most over it. Tracing slows the
+                    run down noticeably, so it is off by default.
+
+Peak RSS is process-wide, so stages running concurrently in one process
+(the streaming pipeline) are measured as one 'stream' stage. Like the
+profiler, stages don't nest: an inner stage counts toward the outer one.
+"""
+
+import os
+import re
+import resource
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+# Handle both package and script execution
+try:
+    from metrics import METRICS
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from metrics import METRICS
+
+
+STATUS_PATH = '/proc/self/status'
+CLEAR_REFS_PATH = '/proc/self/clear_refs'
+
+# Seconds between RSS polls when the high-water mark can't be reset
+POLL_INTERVAL = 0.05
+
+# Frames kept per traced allocation (1 groups sites by source line)
+TRACE_FRAMES = 1
+
+MB = 1024 * 1024
+
+
+def _status_kb(field_name: str) -> Optional[int]:
+    try:
+        with open(STATUS_PATH) as f:
+            match = re.search(rf'^{field_name}:\s+(\d+) kB', f.read(), re.MULTILINE)
+    except OSError:
+        return None
+    return int(match.group(1)) if match else None
+
+
+def rss_bytes() -> Optional[int]:
+    """Current resident set size of this process, or None if unknown."""
+    kb = _status_kb('VmRSS')
+    return kb * 1024 if kb is not None else None
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size since start (or the last reset_peak_rss)."""
+    kb = _status_kb('VmHWM')
+    if kb is not None:
+        return kb * 1024
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def reset_peak_rss() -> bool:
+    """
+    Reset the kernel's peak-RSS mark to the current RSS.
+
+    Returns:
+        True if the reset worked (Linux with a writable /proc/self/clear_refs)
+    """
+    try:
+        with open(CLEAR_REFS_PATH, 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+@dataclass
+class AllocationSite:
+    """Growth in memory held by one source line over a stage."""
+    site: str
+    size_bytes: int
+    blocks: int
+
+
+@dataclass
+class StageMemory:
+    """Memory usage of one pipeline stage (peak over repeated entries)."""
+    runs: int = 0
+    start_rss_bytes: Optional[int] = None
+    end_rss_bytes: Optional[int] = None
+    peak_rss_bytes: int = 0
+    traced_peak_bytes: Optional[int] = None
+    top_sites: list[AllocationSite] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        def mb(value):
+            return round(value / MB, 1) if value is not None else None
+        return {
+            'runs': self.runs,
+            'start_rss_mb': mb(self.start_rss_bytes),
+            'end_rss_mb': mb(self.end_rss_bytes),
+            'peak_rss_mb': mb(self.peak_rss_bytes),
+            'traced_peak_mb': mb(self.traced_peak_bytes),
+            'top_sites': [
+                {'site': s.site, 'size_kb': round(s.size_bytes / 1024, 1), 'blocks': s.blocks}
+                for s in self.top_sites
+            ],
+        }
+
+
+class _RSSPoller(threading.Thread):
+    """Tracks the highest RSS seen until stopped."""
+
+    def __init__(self, interval: float):
+        super().__init__(name='rss-poller', daemon=True)
+        self.interval = interval
+        self.peak = rss_bytes() or 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.peak = max(self.peak, rss_bytes() or 0)
+
+    def stop(self) -> int:
+        self._stop_event.set()
+        self.join()
+        return max(self.peak, rss_bytes() or 0)
+
+
+class MemoryTracker:
+    """Measures peak RSS and, optionally, allocation sites per stage."""
+
+    def __init__(self, trace_allocations: bool = False, top_sites: int = 10):
+        """
+        Initialize the tracker.
+
+        Args:
+            trace_allocations: Whether to trace allocations with tracemalloc
+                and keep each stage's largest allocation sites
+            top_sites: Allocation sites kept per stage
+        """
+        self.trace_allocations = trace_allocations
+        self.top_sites = top_sites
+        self.stages: dict[str, StageMemory] = {}
+        self._active: Optional[str] = None
+        if trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+
+    def reset(self) -> None:
+        """Drop the stages recorded so far."""
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure a block as (part of) the named stage."""
+        if self._active is not None:
+            yield
+            return
+
+        self._active = name
+        start_rss = rss_bytes()
+        poller = None
+        if not reset_peak_rss():
+            poller = _RSSPoller(POLL_INTERVAL)
+            poller.start()
+        start_snapshot = None
+        if self.trace_allocations:
+            start_snapshot = _snapshot()
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            peak = poller.stop() if poller is not None else peak_rss_bytes()
+            self._finish(name, start_rss, peak, start_snapshot)
+
+    def _finish(
+        self,
+        name: str,
+        start_rss: Optional[int],
+        peak: int,
+        start_snapshot: Optional[tracemalloc.Snapshot]
+    ) -> None:
+        stats = self.stages.setdefault(name, StageMemory())
+        stats.runs += 1
+        if stats.start_rss_bytes is None:
+            stats.start_rss_bytes = start_rss
+        stats.end_rss_bytes = rss_bytes()
+        stats.peak_rss_bytes = max(stats.peak_rss_bytes, peak)
+
+        if self.trace_allocations:
+            traced_peak = tracemalloc.get_traced_memory()[1]
+            stats.traced_peak_bytes = max(stats.traced_peak_bytes or 0, traced_peak)
+            stats.top_sites = self._largest_sites(start_snapshot)
+
+        METRICS.set_gauge('stage_peak_rss_bytes', stats.peak_rss_bytes, stage=name)
+        self._active = None
+
+    def _largest_sites(self, start_snapshot: tracemalloc.Snapshot) -> list[AllocationSite]:
+        sites = []
+        for stat in _snapshot().compare_to(start_snapshot, 'lineno'):
+            if stat.size_diff <= 0 or len(sites) == self.top_sites:
+                break
+            frame = stat.traceback[0]
+            sites.append(AllocationSite(
+                site=f"{_short_path(frame.filename)}:{frame.lineno}",
+                size_bytes=stat.size_diff,
+                blocks=stat.count_diff,
+            ))
+        return sites
+
+    def summary(self) -> dict:
+        """Per-stage memory usage, in MB, for the run summary."""
+        return {name: stats.to_dict() for name, stats in self.stages.items()}
+
+    def report(self) -> str:
+        """Human-readable per-stage table plus each stage's largest allocation sites."""
+        lines = [f"{'stage':<10} {'start MB':>10} {'end MB':>10} {'peak MB':>10} {'traced MB':>10}"]
+        for name, stats in self.stages.items():
+            row = stats.to_dict()
+            cells = ''.join(
+                f" {row[key]:>10.1f}" if row[key] is not None else f" {'-':>10}"
+                for key in ('start_rss_mb', 'end_rss_mb', 'peak_rss_mb', 'traced_peak_mb')
+            )
+            lines.append(f"{name:<10}{cells}")
+
+        for name, stats in self.stages.items():
+            if not stats.top_sites:
+                continue
+            lines += ["", f"Largest allocation growth in {name}:"]
+            for site in stats.top_sites:
+                lines.append(f"  {site.size_bytes / 1024:>10.1f} KB {site.blocks:>9} blocks  {site.site}")
+        return "\n".join(lines)
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+    ))
+
+
+def _short_path(filename: str) -> str:
+    for path in sorted(sys.path, key=len, reverse=True):
+        if path and filename.startswith(path + os.sep):
+            return filename[len(path) + 1:]
+    return filename
@@ -0,0 +1,336 @@
+"""
+Pipeline metrics: counters, latency histograms and per-stage throughput.
+
+One process-wide registry (METRICS) is shared by the pipeline, the ESPN
+client and the Gemini/Veo generators, so a run can be summarized in one
+place instead of read back from log lines:
+
+    stages          plays processed and wall time per stage (plays/sec)
+    counters        external calls by service and outcome, retries, fallbacks
+    gauges          point-in-time values such as per-stage peak RSS
+    histograms      external-call and per-play stage latencies
+    cache hit ratio derived from cache_lookups_total{cache, result}
+
+The registry is written as a JSON summary and as a Prometheus textfile (for
+node_exporter's textfile collector). Everything is guarded by one lock, so
+streaming-pipeline worker threads can record concurrently.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+
+# Prefix for Prometheus metric names
+NAMESPACE = 'teamcast'
+
+# Histogram bucket upper bounds in seconds, from cache-speed lookups up to
+# multi-minute Veo renders
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+    10.0, 30.0, 60.0, 120.0, 300.0, 600.0,
+)
+
+# Label sets are stored as sorted (name, value) tuples
+Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(labels: dict) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+@dataclass
+class Histogram:
+    """Fixed-bucket latency histogram."""
+    buckets: tuple = DEFAULT_BUCKETS
+    counts: list = field(default_factory=lambda: [0] * (len(DEFAULT_BUCKETS) + 1))
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile as the upper bound of the bucket it falls in.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value in seconds (inf past the last bucket), or None
+            if nothing was observed
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets + (float('inf'),), self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+
+@dataclass
+class StageStats:
+    """Plays processed and wall time spent in one pipeline stage."""
+    items: int = 0
+    seconds: float = 0.0
+
+    @property
+    def items_per_second(self) -> Optional[float]:
+        return self.items / self.seconds if self.seconds > 0 else None
+
+
+class MetricsRegistry:
+    """Thread-safe store of counters, histograms and stage stats."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        with self._lock:
+            self.started_at = time.time()
+            self.counters: dict[str, dict[Labels, float]] = defaultdict(lambda: defaultdict(float))
+            self.histograms: dict[str, dict[Labels, Histogram]] = defaultdict(dict)
+            self.gauges: dict[str, dict[Labels, float]] = defaultdict(dict)
+            self.stages: dict[str, StageStats] = defaultdict(StageStats)
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            name: Counter name (e.g. 'external_calls_total')
+            value: Amount to add
+            **labels: Label values (e.g. service='espn', outcome='ok')
+        """
+        with self._lock:
+            self.counters[name][_labels(labels)] += value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """
+        Set a gauge to a value.
+
+        Args:
+            name: Gauge name (e.g. 'stage_peak_rss_bytes')
+            value: Current value
+            **labels: Label values
+        """
+        with self._lock:
+            self.gauges[name][_labels(labels)] = value
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        """
+        Record a latency observation.
+
+        Args:
+            name: Histogram name (e.g. 'external_call_seconds')
+            seconds: Observed duration
+            **labels: Label values
+        """
+        key = _labels(labels)
+        with self._lock:
+            histogram = self.histograms[name].get(key)
+            if histogram is None:
+                histogram = self.histograms[name][key] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """Observe the duration of a block in a histogram (also on error)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def cache_lookup(self, cache: str, hit: bool) -> None:
+        """Count a cache hit or miss."""
+        self.inc('cache_lookups_total', cache=cache, result='hit' if hit else 'miss')
+
+    def record_stage(self, stage: str, items: int, seconds: float) -> None:
+        """Add processed plays and wall time to a stage."""
+        with self._lock:
+            stats = self.stages[stage]
+            stats.items += items
+            stats.seconds += seconds
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageStats]:
+        """
+        Time a pipeline stage.
+
+        Yields a StageStats whose `items` the caller sets to the number of
+        plays the stage processed; it is added to the stage's totals
+        together with the block's wall time on exit.
+        """
+        progress = StageStats()
+        start = time.perf_counter()
+        try:
+            yield progress
+        finally:
+            self.record_stage(name, progress.items, time.perf_counter() - start)
+
+    def cache_hit_ratios(self) -> dict[str, Optional[float]]:
+        """Hit ratio per cache from cache_lookups_total."""
+        with self._lock:
+            lookups = dict(self.counters.get('cache_lookups_total', {}))
+        totals: dict[str, list] = defaultdict(lambda: [0, 0])
+        for labels, value in lookups.items():
+            labels = dict(labels)
+            totals[labels['cache']][labels['result'] == 'hit'] += value
+        return {
+            cache: round(hits / (hits + misses), 4) if hits + misses else None
+            for cache, (misses, hits) in sorted(totals.items())
+        }
+
+    def snapshot(self) -> dict:
+        """
+        Build the JSON summary.
+
+        Returns:
+            Dict with 'elapsed_seconds', 'stages', 'cache_hit_ratio',
+            'counters', 'gauges' and 'histograms'
+        """
+        hit_ratios = self.cache_hit_ratios()
+        with self._lock:
+            return {
+                'elapsed_seconds': round(time.time() - self.started_at, 3),
+                'stages': {
+                    name: {
+                        'items': stats.items,
+                        'seconds': round(stats.seconds, 3),
+                        'items_per_second': (
+                            round(stats.items_per_second, 3)
+                            if stats.items_per_second is not None else None
+                        ),
+                    }
+                    for name, stats in self.stages.items()
+                },
+                'cache_hit_ratio': hit_ratios,
+                'counters': {
+                    name: [{'labels': dict(k), 'value': v} for k, v in sorted(series.items())]
+                    for name, series in self.counters.items()
+                },
+                'gauges': {
+                    name: [{'labels': dict(k), 'value': v} for k, v in sorted(series.items())]
+                    for name, series in self.gauges.items()
+                },
+                'histograms': {
+                    name: [
+                        {
+                            'labels': dict(k),
+                            'count': h.count,
+                            'sum': round(h.total, 3),
+                            'mean': round(h.total / h.count, 3) if h.count else None,
+                            'p50': h.quantile(0.5),
+                            'p95': h.quantile(0.95),
+                        }
+                        for k, h in sorted(series.items())
+                    ]
+                    for name, series in self.histograms.items()
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        """Render everything in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self.counters.items()):
+                metric = f"{NAMESPACE}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                for labels, value in sorted(series.items()):
+                    lines.append(f"{metric}{_format_labels(labels)} {value:g}")
+
+            for name, series in sorted(self.gauges.items()):
+                metric = f"{NAMESPACE}_{name}"
+                lines.append(f"# TYPE {metric} gauge")
+                for labels, value in sorted(series.items()):
+                    lines.append(f"{metric}{_format_labels(labels)} {value:.15g}")
+
+            for name, series in sorted(self.histograms.items()):
+                metric = f"{NAMESPACE}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for labels, h in sorted(series.items()):
+                    cumulative = 0
+                    for bound, n in zip(h.buckets + (float('inf'),), h.counts):
+                        cumulative += n
+                        le = '+Inf' if bound == float('inf') else f"{bound:g}"
+                        lines.append(
+                            f"{metric}_bucket{_format_labels(labels + (('le', le),))} {cumulative}"
+                        )
+                    lines.append(f"{metric}_sum{_format_labels(labels)} {h.total:.6f}")
+                    lines.append(f"{metric}_count{_format_labels(labels)} {h.count}")
+
+            if self.stages:
+                for suffix, attr in (('items_total', 'items'), ('seconds_total', 'seconds')):
+                    metric = f"{NAMESPACE}_stage_{suffix}"
+                    lines.append(f"# TYPE {metric} counter")
+                    for stage, stats in sorted(self.stages.items()):
+                        value = getattr(stats, attr)
+                        lines.append(f'{metric}{{stage="{stage}"}} {value:g}')
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, metrics_dir: str, name: str = 'pipeline', extra: Optional[dict] = None) -> str:
+        """
+        Write {name}.json and {name}.prom to a directory.
+
+        Both files are written to temporary names and renamed into place, so
+        readers (the web API, the textfile collector) never see partial files.
+
+        Args:
+            metrics_dir: Output directory
+            name: Base file name
+            extra: Optional run summary stored under 'run' in the JSON
+
+        Returns:
+            Path to the JSON file
+        """
+        os.makedirs(metrics_dir, exist_ok=True)
+        summary = self.snapshot()
+        if extra is not None:
+            summary = {'run': extra, **summary}
+
+        json_path = os.path.join(metrics_dir, f"{name}.json")
+        _atomic_write(json_path, json.dumps(summary, indent=2, default=str))
+        _atomic_write(os.path.join(metrics_dir, f"{name}.prom"), self.to_prometheus())
+        return json_path
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    body = ','.join(
+        '{}="{}"'.format(k, v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for k, v in labels
+    )
+    return '{' + body + '}'
+
+
+def _atomic_write(path: str, text: str) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+# Process-wide registry
+METRICS = MetricsRegistry()
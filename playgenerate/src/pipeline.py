@@ -8,10 +8,14 @@ Main orchestration module that:
 4. Creates video clips using Veo
 """
 
+import glob
 import os
 import sys
+import time
 import pandas as pd
-from typing import Optional
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, MutableMapping, Optional, Union
 from dataclasses import asdict
 from tqdm import tqdm
 from dotenv import load_dotenv
@@ -23,20 +27,77 @@ load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file_
 sys.path.insert(0, os.path.dirname(__file__))
 
 from enrichment.espn_client import ESPNClient
+from enrichment.response_cache import ResponseCache
 from enrichment.game_mapper import GameMapper
 from enrichment.play_matcher import PlayMatcher, EnrichedPlay
 from generation.scene_gen import SceneGenerator, SceneDescription
 from generation.video_gen import VideoGenerator, GeneratedVideo
+from checkpoint import CheckpointStore, content_hash
+from metrics import METRICS, StageStats
+from ratelimit import DEFAULT_RATE_LIMITS, shared_limiter
+from memory import MemoryTracker
+from executor import Stage, StreamingExecutor
+from tracking.store import TrackingStore, ARROW_AVAILABLE
+from tracking.play_index import PlayIndex
+from tracking.schema import apply_tracking_schema, memory_mb
+from tracking.features import compute_player_features
+from tracking.streaming import (
+    UniquePlayAccumulator, chunk_rows_for_budget, iter_csv_chunks, sample_csv,
+    SAMPLE_ROWS, LIMIT_CHUNK_ROWS
+)
+
+if TYPE_CHECKING:
+    import polars as pl
+    from profiling import StageProfiler
 
 
 class NFLPipeline:
     """Main pipeline for enriching and generating NFL play videos."""
     
+    # Tracking columns needed to build the unique-play table
+    PLAY_COLUMNS = [
+        'game_id', 'play_id', 'absolute_yardline_number', 'play_direction',
+        'ball_land_x', 'ball_land_y', 'num_frames_output',
+    ]
+    
+    # Output names for the unique-play table, in PLAY_COLUMNS order
+    PLAY_TABLE_COLUMNS = [
+        'game_id', 'play_id', 'absolute_yardline', 'play_direction',
+        'ball_land_x', 'ball_land_y', 'num_frames',
+    ]
+    
+    # Columns attached to enriched plays from their SceneDescription
+    SCENE_COLUMNS = [
+        'scene_description', 'camera_angle', 'formation_offense', 'formation_defense',
+    ]
+    
+    # Per-chunk memory ceiling for streaming ingestion when none is configured
+    DEFAULT_CHUNK_MEMORY_MB = 256
+    
+    # Dataframe engines for loading and aggregating tracking data
+    ENGINES = ('pandas', 'polars')
+    
+    # Default size cap for the persistent ESPN response cache
+    DEFAULT_ESPN_CACHE_MB = 1024
+    
     def __init__(
         self,
         data_dir: str,
         output_dir: str,
-        cache_dir: Optional[str] = None
+        cache_dir: Optional[str] = None,
+        use_store: bool = True,
+        memory_limit_mb: Optional[float] = None,
+        espn_cache: Optional[MutableMapping] = None,
+        espn_cache_mb: float = DEFAULT_ESPN_CACHE_MB,
+        espn_memory_mb: float = ESPNClient.DEFAULT_MEMORY_CACHE_MB,
+        resume: bool = True,
+        tracking_cache_size: int = 0,
+        lean_dtypes: bool = True,
+        engine: str = 'pandas',
+        profiler: Optional["StageProfiler"] = None,
+        memory_tracker: Optional[MemoryTracker] = None,
+        rate_limits: Optional[dict] = None,
+        rate_limit_dir: Optional[str] = None
     ):
         """
         Initialize the pipeline.
@@ -45,8 +106,47 @@ class NFLPipeline:
             data_dir: Directory containing Big Data Bowl CSV files
             output_dir: Directory for output files
             cache_dir: Optional directory for caching (defaults to output_dir)
+            use_store: Whether to read tracking data through the columnar
+                Parquet store (requires pyarrow, falls back to CSV)
+            memory_limit_mb: If set, extract plays by streaming tracking data
+                in chunks sized to stay under this ceiling
+            espn_cache: Optional mapping for ESPN responses, shared between
+                pipelines running in different worker processes (used as
+                is, so it must bound itself, e.g. batch's shared BoundedCache)
+            espn_cache_mb: Size cap for the persistent ESPN response cache
+                under cache_dir, reused across runs (0 disables it)
+            espn_memory_mb: Size cap for each in-memory ESPN cache (raw
+                responses, parsed games, the matcher's play tables), so
+                long-lived processes stay flat
+            resume: Whether to reuse per-play stage checkpoints whose inputs
+                are unchanged (False recomputes everything and refreshes them)
+            tracking_cache_size: Number of recent tracking loads to keep in
+                memory for reuse (for long-lived processes; 0 disables)
+            lean_dtypes: Whether to cast loaded tracking data to the compact
+                schema (categoricals, float32, small ints)
+            engine: 'pandas', or 'polars' to load and filter tracking data
+                and build the unique-play table with lazy polars queries
+                (falls back to pandas if polars isn't installed)
+            profiler: Optional StageProfiler to profile each stage
+            memory_tracker: Per-stage memory accounting (defaults to peak
+                RSS only; pass MemoryTracker(trace_allocations=True) to
+                also record the largest allocation sites)
+            rate_limits: Per-service (requests per second, burst) for
+                'espn', 'gemini' and 'veo', over ratelimit.DEFAULT_RATE_LIMITS
+                (None for a service disables its limit)
+            rate_limit_dir: Optional directory for token-bucket state files,
+                so every process using it shares one budget per service
         """
         self.data_dir = data_dir
+        self.memory_limit_mb = memory_limit_mb
+        self.lean_dtypes = lean_dtypes
+        
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {self.ENGINES}")
+        self.engine = engine
+        if engine == 'polars' and not self._polars().POLARS_AVAILABLE:
+            print("Warning: polars not installed. Falling back to the pandas engine.")
+            self.engine = 'pandas'
         self.output_dir = output_dir
         self.cache_dir = cache_dir or output_dir
         
@@ -54,41 +154,274 @@ class NFLPipeline:
         os.makedirs(os.path.join(output_dir, 'enriched'), exist_ok=True)
         os.makedirs(os.path.join(output_dir, 'videos'), exist_ok=True)
         
+        # One token bucket per rate-limited service, shared by this process's
+        # clients and, through rate_limit_dir, with other processes
+        limits = {**DEFAULT_RATE_LIMITS, **(rate_limits or {})}
+        self.rate_limiters = {
+            service: shared_limiter(service, *limit, state_dir=rate_limit_dir)
+            for service, limit in limits.items() if limit
+        }
+        
         # Initialize components
-        self.espn_client = ESPNClient(cache_enabled=True)
+        disk_cache = None
+        if espn_cache_mb > 0:
+            disk_cache = ResponseCache(
+                os.path.join(self.cache_dir, 'espn_cache.sqlite'),
+                max_bytes=int(espn_cache_mb * 1024 * 1024)
+            )
+        self.espn_client = ESPNClient(
+            cache_enabled=True,
+            cache=espn_cache,
+            disk_cache=disk_cache,
+            rate_limit_seconds=0,
+            rate_limiter=self.rate_limiters.get('espn'),
+            memory_cache_mb=espn_memory_mb
+        )
         self.game_mapper = GameMapper(
             espn_client=self.espn_client,
             cache_file=os.path.join(self.cache_dir, 'game_mappings.json')
         )
         self.play_matcher = PlayMatcher(
             espn_client=self.espn_client,
-            game_mapper=self.game_mapper
+            game_mapper=self.game_mapper,
+            cache_mb=espn_memory_mb
         )
         
-        # Initialize generation components
-        self.scene_generator = SceneGenerator()
-        self.video_generator = VideoGenerator(
-            output_dir=os.path.join(output_dir, 'videos')
+        # Generation components are created on first use: the Gemini/Veo
+        # SDKs are slow to import and the enrichment path never needs them
+        self._scene_generator: Optional[SceneGenerator] = None
+        self._video_generator: Optional[VideoGenerator] = None
+        
+        # Columnar tracking store, converted once per week from the CSVs
+        self.tracking_store: Optional[TrackingStore] = None
+        if use_store and ARROW_AVAILABLE:
+            self.tracking_store = TrackingStore(os.path.join(self.cache_dir, 'tracking_store'))
+        
+        # Per-play stage results, keyed by a hash of each stage's inputs
+        self.checkpoints = CheckpointStore(
+            os.path.join(self.cache_dir, 'checkpoints'), enabled=resume
         )
+        
+        # Recent tracking loads, most recently used last
+        self.tracking_cache_size = tracking_cache_size
+        self._tracking_cache: OrderedDict = OrderedDict()
+        
+        self.profiler = profiler
+        self.memory = memory_tracker or MemoryTracker()
+    
+    @contextmanager
+    def _stage(self, name: str) -> Iterator[StageStats]:
+        """Record a stage's metrics and memory and, when profiling, profile it."""
+        with METRICS.stage(name) as stats, self.memory.stage(name):
+            if self.profiler is None:
+                yield stats
+            else:
+                with self.profiler.stage(name):
+                    yield stats
+    
+    @property
+    def scene_generator(self) -> SceneGenerator:
+        """Scene generator, created on first use."""
+        if self._scene_generator is None:
+            self._scene_generator = SceneGenerator(rate_limiter=self.rate_limiters.get('gemini'))
+        return self._scene_generator
+    
+    @property
+    def video_generator(self) -> VideoGenerator:
+        """Video generator, created on first use."""
+        if self._video_generator is None:
+            self._video_generator = VideoGenerator(
+                output_dir=os.path.join(self.output_dir, 'videos'),
+                rate_limiter=self.rate_limiters.get('veo')
+            )
+        return self._video_generator
+    
+    def load_tracking_data(
+        self,
+        filename: str,
+        columns: Optional[list[str]] = None,
+        game_ids: Optional[list] = None,
+        play_ids: Optional[list] = None
+    ) -> pd.DataFrame:
+        """
+        Load tracking data, preferring the columnar store over the raw CSV.
+        
+        The first load of a week converts its CSV into the store; later loads
+        only read the requested columns, game partitions and play row groups.
+        
+        Args:
+            filename: CSV filename (e.g., 'input_2023_w01.csv')
+            columns: Optional list of columns to load (None loads all)
+            game_ids: Optional list of game_ids to restrict the rows to
+            play_ids: Optional list of play_ids to restrict the rows to
+            
+        Returns:
+            DataFrame with tracking data (shared with the in-memory cache
+            when tracking_cache_size is set; don't modify it in place)
+        """
+        cache_key = None
+        if self.tracking_cache_size:
+            cache_key = self._tracking_cache_key(filename, columns, game_ids, play_ids)
+            METRICS.cache_lookup('tracking', cache_key in self._tracking_cache)
+            if cache_key in self._tracking_cache:
+                self._tracking_cache.move_to_end(cache_key)
+                df = self._tracking_cache[cache_key]
+                print(f"Reused {len(df)} cached rows from {filename}")
+                return df
+        
+        partition = self._tracking_partition(filename)
+        source = 'polars' if self.engine == 'polars' else 'store' if partition else 'csv'
+        load_start = time.perf_counter()
+        
+        if self.engine == 'polars':
+            df = self._polars().load_tracking(
+                self.scan_tracking(filename), columns=columns, game_ids=game_ids, play_ids=play_ids,
+                column_order=self.tracking_store.stored_columns(*partition) if partition else None
+            )
+        elif partition:
+            df = self.tracking_store.read_week(
+                *partition, columns=columns, game_ids=game_ids, play_ids=play_ids
+            )
+        elif game_ids is not None or play_ids is not None:
+            # Filter chunk by chunk so only the matching rows are ever held
+            chunks = list(self.iter_tracking_chunks(
+                filename, columns=columns, game_ids=game_ids, play_ids=play_ids
+            ))
+            df = (pd.concat(chunks, ignore_index=True) if chunks
+                  else pd.read_csv(os.path.join(self.data_dir, 'train', filename),
+                                   usecols=columns, nrows=0))
+        else:
+            df = pd.read_csv(os.path.join(self.data_dir, 'train', filename), usecols=columns)
+        
+        METRICS.observe('tracking_load_seconds', time.perf_counter() - load_start, source=source)
+        
+        if self.lean_dtypes:
+            before_mb = memory_mb(df)
+            df = apply_tracking_schema(df)
+            after_mb = memory_mb(df)
+            saved = 100 * (1 - after_mb / before_mb) if before_mb else 0
+            print(f"Tracking memory: {before_mb:.1f} MB -> {after_mb:.1f} MB ({saved:.0f}% smaller)")
+        
+        if cache_key is not None:
+            self._tracking_cache[cache_key] = df
+            while len(self._tracking_cache) > self.tracking_cache_size:
+                self._tracking_cache.popitem(last=False)
+        
+        print(f"Loaded {len(df)} rows from {filename}")
+        return df
+    
+    @staticmethod
+    def _polars():
+        """Import the polars backend on first use (polars is slow to import)."""
+        from tracking import polars_backend
+        return polars_backend
     
-    def load_tracking_data(self, filename: str) -> pd.DataFrame:
+    def scan_tracking(self, filename: str) -> "pl.LazyFrame":
         """
-        Load tracking data from CSV file.
+        Open a tracking file as a polars LazyFrame (polars engine).
+        
+        Scans the columnar store when available, otherwise the CSV. Nothing
+        is read until the query is collected, and only the columns and
+        games/plays the query needs are read then.
         
         Args:
             filename: CSV filename (e.g., 'input_2023_w01.csv')
             
         Returns:
-            DataFrame with tracking data
+            LazyFrame over the week's tracking rows
+        """
+        partition = self._tracking_partition(filename)
+        if partition:
+            return self._polars().scan_store(self.tracking_store.partition_dir(*partition))
+        return self._polars().scan_csv(os.path.join(self.data_dir, 'train', filename))
+    
+    def _tracking_cache_key(
+        self,
+        filename: str,
+        columns: Optional[list[str]],
+        game_ids: Optional[list],
+        play_ids: Optional[list]
+    ) -> tuple:
+        """Key a tracking load by its arguments and the source file's version."""
+        try:
+            mtime_ns = os.stat(os.path.join(self.data_dir, 'train', filename)).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        return (
+            filename,
+            mtime_ns,
+            None if columns is None else tuple(columns),
+            None if game_ids is None else frozenset(int(g) for g in game_ids),
+            None if play_ids is None else frozenset(int(p) for p in play_ids),
+        )
+    
+    def _tracking_partition(self, filename: str) -> Optional[tuple[int, int]]:
+        """
+        Resolve a tracking file to its (season, week) store partition.
+        
+        Converts the CSV into the store on first use. Returns None when the
+        store is disabled or the filename has no season/week, in which case
+        callers read the CSV directly.
         """
         filepath = os.path.join(self.data_dir, 'train', filename)
+        partition = TrackingStore.parse_filename(filename) if self.tracking_store else None
+        
+        if partition and self.tracking_store.has_week(*partition, filepath):
+            return partition
         
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Tracking data file not found: {filepath}")
         
-        df = pd.read_csv(filepath)
-        print(f"Loaded {len(df)} rows from {filename}")
-        return df
+        if partition:
+            self.tracking_store.convert_csv(filepath, *partition)
+        return partition
+    
+    def iter_tracking_chunks(
+        self,
+        filename: str,
+        columns: Optional[list[str]] = None,
+        memory_limit_mb: Optional[float] = None,
+        max_chunk_rows: Optional[int] = None,
+        game_ids: Optional[list] = None,
+        play_ids: Optional[list] = None
+    ):
+        """
+        Stream tracking data in chunks sized to a memory ceiling.
+        
+        Args:
+            filename: CSV filename (e.g., 'input_2023_w01.csv')
+            columns: Optional list of columns to load (None loads all)
+            memory_limit_mb: Per-chunk memory ceiling (defaults to the
+                pipeline's memory_limit_mb, then DEFAULT_CHUNK_MEMORY_MB)
+            max_chunk_rows: Optional cap on rows per chunk
+            game_ids: Optional list of game_ids to restrict the rows to
+            play_ids: Optional list of play_ids to restrict the rows to
+            
+        Returns:
+            Iterator of tracking DataFrames
+        """
+        limit = memory_limit_mb or self.memory_limit_mb or self.DEFAULT_CHUNK_MEMORY_MB
+        partition = self._tracking_partition(filename)
+        
+        if partition:
+            sample = next(
+                self.tracking_store.iter_batches(*partition, SAMPLE_ROWS, columns=columns),
+                pd.DataFrame()
+            )
+            chunk_rows = chunk_rows_for_budget(sample, limit)
+            if max_chunk_rows:
+                chunk_rows = min(chunk_rows, max_chunk_rows)
+            return self.tracking_store.iter_batches(
+                *partition, chunk_rows, columns=columns, game_ids=game_ids, play_ids=play_ids
+            )
+        
+        filepath = os.path.join(self.data_dir, 'train', filename)
+        chunk_rows = chunk_rows_for_budget(sample_csv(filepath, columns), limit)
+        if max_chunk_rows:
+            chunk_rows = min(chunk_rows, max_chunk_rows)
+        return iter_csv_chunks(
+            filepath, chunk_rows, columns=columns, game_ids=game_ids, play_ids=play_ids
+        )
     
     def extract_unique_plays(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -109,12 +442,210 @@ class NFLPipeline:
             'num_frames_output': 'first',
         }).reset_index()
         
-        plays.columns = ['game_id', 'play_id', 'absolute_yardline', 'play_direction', 
-                        'ball_land_x', 'ball_land_y', 'num_frames']
+        plays.columns = self.PLAY_TABLE_COLUMNS
         
         print(f"Extracted {len(plays)} unique plays")
         return plays
     
+    def stream_unique_plays(
+        self,
+        filename: str,
+        memory_limit_mb: Optional[float] = None,
+        max_plays: Optional[int] = None,
+        game_ids: Optional[list] = None,
+        play_ids: Optional[list] = None
+    ) -> pd.DataFrame:
+        """
+        Extract unique plays without loading the whole week into memory.
+        
+        Reads the tracking data in chunks and folds each one into the play
+        table, giving the same result as extract_unique_plays. With max_plays
+        set, the result is the first max_plays plays in (game_id, play_id)
+        order; from the columnar store, which is sorted that way, reading
+        stops as soon as those plays have been fully read.
+        
+        Args:
+            filename: CSV filename (e.g., 'input_2023_w01.csv')
+            memory_limit_mb: Per-chunk memory ceiling
+            max_plays: Optional limit on number of plays to extract
+            game_ids: Optional list of game_ids to restrict plays to
+            play_ids: Optional list of play_ids to restrict plays to
+            
+        Returns:
+            DataFrame with one row per unique play
+        """
+        # The store is written sorted by (game_id, play_id); a CSV may be in
+        # any order, so it is read to the end
+        sorted_input = self._tracking_partition(filename) is not None
+        accumulator = UniquePlayAccumulator(
+            value_columns=self.PLAY_COLUMNS[2:], max_plays=max_plays, sorted_input=sorted_input
+        )
+        chunks = self.iter_tracking_chunks(
+            filename,
+            self.PLAY_COLUMNS,
+            memory_limit_mb,
+            max_chunk_rows=LIMIT_CHUNK_ROWS if max_plays and sorted_input else None,
+            game_ids=game_ids,
+            play_ids=play_ids,
+        )
+        
+        for chunk in chunks:
+            accumulator.add(chunk)
+            if accumulator.done:
+                break
+        
+        plays = accumulator.result()
+        plays.columns = self.PLAY_TABLE_COLUMNS
+        
+        print(f"Extracted {len(plays)} unique plays from {accumulator.rows_seen} rows "
+              f"in {accumulator.chunks_seen} chunks")
+        return plays
+    
+    def load_unique_plays(
+        self,
+        filename: str,
+        max_plays: Optional[int] = None,
+        game_ids: Optional[list] = None,
+        play_ids: Optional[list] = None
+    ) -> pd.DataFrame:
+        """
+        Get the unique-play table for a tracking file.
+        
+        Streams when the pipeline has a memory_limit_mb or a play limit is
+        given (so only the kept plays are held, and reading the sorted store
+        can stop early), otherwise loads the play columns in one read. A
+        limit keeps the first max_plays plays by (game_id, play_id) on every
+        path.
+        
+        Args:
+            filename: CSV filename (e.g., 'input_2023_w01.csv')
+            max_plays: Optional limit on number of plays
+            game_ids: Optional list of game_ids to restrict plays to
+            play_ids: Optional list of play_ids to restrict plays to
+            
+        Returns:
+            DataFrame with one row per unique play
+        """
+        if self.engine == 'polars' and not self.memory_limit_mb:
+            # A lazy group-by reads only the play columns, on all cores
+            plays = self._polars().unique_plays(
+                self.scan_tracking(filename), self.PLAY_COLUMNS[2:],
+                game_ids=game_ids, play_ids=play_ids, max_plays=max_plays
+            )
+            plays.columns = self.PLAY_TABLE_COLUMNS
+            print(f"Extracted {len(plays)} unique plays")
+            return plays
+        
+        if self.memory_limit_mb or max_plays:
+            plays = self.stream_unique_plays(
+                filename, max_plays=max_plays, game_ids=game_ids, play_ids=play_ids
+            )
+            if max_plays:
+                print(f"Limited to {max_plays} plays")
+            return plays
+        
+        return self.extract_unique_plays(
+            self.load_tracking_data(
+                filename, columns=self.PLAY_COLUMNS, game_ids=game_ids, play_ids=play_ids
+            )
+        )
+    
+    def enrich_play(self, row, sequence_hint: int) -> Optional[dict]:
+        """
+        Enrich a single play, reusing its checkpoint when the inputs match.
+        
+        Args:
+            row: Unique-play row (Series or dict with PLAY_TABLE_COLUMNS)
+            sequence_hint: Approximate position of the play in its game
+                (see sequence_hints)
+            
+        Returns:
+            Enriched play as a dict, or None if no ESPN match was found
+        """
+        match_args, key = self._enrich_inputs(row, sequence_hint)
+        cached = self.checkpoints.get('enrich', row['game_id'], row['play_id'], key)
+        if cached is not None:
+            return cached
+        
+        with METRICS.timer('play_stage_seconds', stage='enrich'):
+            enriched = self.play_matcher.match_play(**match_args)
+        
+        # Misses aren't checkpointed so they are retried on the next run
+        if not enriched:
+            METRICS.inc('enrich_unmatched_total')
+            return None
+        
+        result = asdict(enriched)
+        self.checkpoints.put('enrich', row['game_id'], row['play_id'], key, result)
+        return result
+    
+    def _enrich_inputs(self, row, sequence_hint: int) -> tuple[dict, str]:
+        """
+        PlayMatcher.match_play arguments for a play and their checkpoint key.
+        
+        The key covers every match input, the sequence hint included (it
+        breaks ties between candidate ESPN plays), and the version of the
+        game's ESPN data.
+        """
+        tracking_inputs = dict(
+            game_id=str(row['game_id']),
+            play_id=int(row['play_id']),
+            absolute_yardline=int(row['absolute_yardline']),
+            play_direction=row['play_direction'],
+            ball_land_x=float(row['ball_land_x']),
+            ball_land_y=float(row['ball_land_y']),
+            num_frames=int(row['num_frames'])
+        )
+        espn_version = self.play_matcher.get_game_version(tracking_inputs['game_id'])
+        match_args = dict(tracking_inputs, play_sequence_hint=int(sequence_hint))
+        return match_args, content_hash(match_args, espn_version)
+    
+    @staticmethod
+    def sequence_hints(plays_df: pd.DataFrame) -> pd.Series:
+        """
+        Each play's ordinal within its game, counting plays by play_id.
+        
+        Unlike a play's row position, this doesn't depend on the order plays
+        were read in, on how many other games were selected, or (since a
+        --max-plays limit keeps the first plays by (game_id, play_id)) on
+        the limit.
+        
+        Args:
+            plays_df: DataFrame with unique plays
+            
+        Returns:
+            Series of hints aligned with plays_df's index
+        """
+        return (plays_df.sort_values(['game_id', 'play_id'])
+                .groupby('game_id', sort=False).cumcount()
+                .reindex(plays_df.index))
+    
+    def prefetch_espn(self, plays_df: pd.DataFrame) -> int:
+        """
+        Fetch ESPN scoreboards and summaries for plays' games up front.
+        
+        Every game is mapped and its play-by-play fetched concurrently, so
+        the matching loop is served from memory instead of blocking on the
+        network game by game. Checkpointed plays need their game too: its
+        ESPN version is part of the enrich checkpoint key. On reruns the
+        persistent ESPN cache serves these without requests.
+        
+        Args:
+            plays_df: DataFrame with unique plays
+            
+        Returns:
+            Number of games whose ESPN plays are ready
+        """
+        games = sorted({str(game_id) for game_id in plays_df['game_id']})
+        if not games:
+            return 0
+        
+        with self._stage('prefetch') as stage:
+            ready = self.play_matcher.prefetch(games)
+            stage.items = len(games)
+        print(f"Prefetched ESPN play-by-play for {ready} of {len(games)} games")
+        return ready
+    
     def enrich_plays(
         self,
         plays_df: pd.DataFrame,
@@ -131,30 +662,117 @@ class NFLPipeline:
             DataFrame with enriched play data
         """
         enriched_plays = []
+        self.checkpoints.reset('enrich')
+        self.prefetch_espn(plays_df)
         
+        hints = self.sequence_hints(plays_df)
         iterator = plays_df.iterrows()
         if progress:
             iterator = tqdm(iterator, total=len(plays_df), desc="Enriching plays")
         
-        for idx, row in iterator:
-            enriched = self.play_matcher.match_play(
-                game_id=str(row['game_id']),
-                play_id=int(row['play_id']),
-                absolute_yardline=int(row['absolute_yardline']),
-                play_direction=row['play_direction'],
-                ball_land_x=float(row['ball_land_x']),
-                ball_land_y=float(row['ball_land_y']),
-                num_frames=int(row['num_frames']),
-                play_sequence_hint=idx
-            )
-            
-            if enriched:
-                enriched_plays.append(asdict(enriched))
+        with self._stage('enrich') as stage:
+            for idx, row in iterator:
+                enriched = self.enrich_play(row, hints[idx])
+                if enriched:
+                    enriched_plays.append(enriched)
+            stage.items = len(plays_df)
         
+        print(self.checkpoints.summary('enrich'))
         result_df = pd.DataFrame(enriched_plays)
+        if not result_df.empty:
+            # Same key types as plays read back from enriched CSVs
+            result_df = self.normalize_play_keys(result_df)
         print(f"Successfully enriched {len(result_df)} of {len(plays_df)} plays")
         return result_df
     
+    @staticmethod
+    def normalize_play_keys(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast (game_id, play_id) to int64 so frames from every code path join
+        on the same typed keys.
+        
+        Args:
+            df: DataFrame with game_id and play_id columns
+            
+        Returns:
+            DataFrame with int64 key columns
+        """
+        return df.astype({'game_id': 'int64', 'play_id': 'int64'})
+    
+    def attach_scenes(
+        self,
+        enriched_df: pd.DataFrame,
+        scenes: list[SceneDescription]
+    ) -> pd.DataFrame:
+        """
+        Join scene results onto enriched plays in a single merge.
+        
+        Existing scene columns are replaced. Plays without a scene get empty
+        strings.
+        
+        Args:
+            enriched_df: DataFrame with enriched plays
+            scenes: SceneDescription results for (some of) those plays
+            
+        Returns:
+            Enriched DataFrame with SCENE_COLUMNS attached
+        """
+        if enriched_df.empty:
+            return enriched_df.assign(**{column: '' for column in self.SCENE_COLUMNS})
+        
+        scene_df = pd.DataFrame({
+            'game_id': [s.game_id for s in scenes],
+            'play_id': [s.play_id for s in scenes],
+            'scene_description': [s.description for s in scenes],
+            'camera_angle': [s.camera_angle for s in scenes],
+            'formation_offense': [s.formation_offense for s in scenes],
+            'formation_defense': [s.formation_defense for s in scenes],
+        })
+        scene_df = self.normalize_play_keys(scene_df).drop_duplicates(
+            ['game_id', 'play_id'], keep='last'
+        )
+        
+        merged = self.normalize_play_keys(
+            enriched_df.drop(columns=self.SCENE_COLUMNS, errors='ignore')
+        ).merge(scene_df, on=['game_id', 'play_id'], how='left', validate='many_to_one')
+        
+        merged[self.SCENE_COLUMNS] = merged[self.SCENE_COLUMNS].fillna('')
+        return merged
+    
+    def upsert_plays(self, path: str, enriched_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merge enriched plays into the plays already saved at path.
+        
+        Args:
+            path: Existing enriched CSV (may be missing or empty)
+            enriched_df: New or updated enriched plays
+            
+        Returns:
+            Combined DataFrame sorted by (game_id, play_id)
+        """
+        try:
+            existing = pd.read_csv(path)
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            return enriched_df
+        
+        if existing.empty:
+            return enriched_df
+        if enriched_df.empty:
+            return existing
+        
+        keys = ['game_id', 'play_id']
+        existing = self.normalize_play_keys(existing)
+        updated = self.normalize_play_keys(enriched_df)
+        
+        # Carry over saved columns the new rows don't have
+        carried = [c for c in existing.columns if c not in updated.columns]
+        if carried:
+            updated = updated.merge(existing[keys + carried], on=keys, how='left')
+        
+        replaced = existing.set_index(keys).index.isin(updated.set_index(keys).index)
+        combined = pd.concat([existing[~replaced], updated], ignore_index=True)
+        return combined.sort_values(keys, kind='stable').reset_index(drop=True)
+    
     def save_enriched_data(
         self,
         enriched_df: pd.DataFrame,
@@ -163,6 +781,10 @@ class NFLPipeline:
         """
         Save enriched data to CSV.
         
+        Rows are upserted: plays already in the file but not in enriched_df
+        are kept, plays in both are replaced. Columns the new rows lack (e.g.
+        scene columns when only re-enriching) keep their saved values.
+        
         Args:
             enriched_df: DataFrame with enriched plays
             output_filename: Output filename
@@ -171,15 +793,44 @@ class NFLPipeline:
             Path to saved file
         """
         output_path = os.path.join(self.output_dir, 'enriched', output_filename)
-        enriched_df.to_csv(output_path, index=False)
+        with self._stage('save') as stage:
+            stage.items = len(enriched_df)
+            enriched_df = self.upsert_plays(output_path, enriched_df)
+            enriched_df.to_csv(output_path, index=False)
         print(f"Saved enriched data to {output_path}")
         return output_path
     
+    def write_metrics(self, results: Optional[dict] = None, name: str = 'pipeline') -> str:
+        """
+        Write the run's metrics as JSON and as a Prometheus textfile.
+        
+        Args:
+            results: Optional results dict from a pipeline run; its counts
+                and the per-stage memory usage are stored under 'run' in the
+                JSON summary
+            name: Base file name under output/metrics/
+            
+        Returns:
+            Path to the JSON summary
+        """
+        run = None
+        if results is not None:
+            run = {
+                k: v for k, v in results.items()
+                if v is None or isinstance(v, (int, float, str))
+            }
+            run['memory'] = self.memory.summary()
+        path = METRICS.write(os.path.join(self.output_dir, 'metrics'), name=name, extra=run)
+        print(f"Metrics written to {path}")
+        return path
+    
     def process_week(
         self,
         week_num: int,
         year: int = 2023,
-        max_plays: Optional[int] = None
+        max_plays: Optional[int] = None,
+        game_ids: Optional[list] = None,
+        play_ids: Optional[list] = None
     ) -> pd.DataFrame:
         """
         Process a full week of tracking data.
@@ -188,21 +839,20 @@ class NFLPipeline:
             week_num: Week number (1-18)
             year: Season year
             max_plays: Optional limit on number of plays to process
+            game_ids: Optional list of game_ids to restrict plays to
+            play_ids: Optional list of play_ids to restrict plays to
             
         Returns:
             DataFrame with enriched plays
         """
-        # Load tracking data
         filename = f"input_{year}_w{week_num:02d}.csv"
-        df = self.load_tracking_data(filename)
-        
-        # Extract unique plays
-        plays = self.extract_unique_plays(df)
         
-        # Limit if requested
-        if max_plays:
-            plays = plays.head(max_plays)
-            print(f"Limited to {max_plays} plays")
+        # Extract unique plays, stopping early when limited
+        with self._stage('extract') as stage:
+            plays = self.load_unique_plays(
+                filename, max_plays=max_plays, game_ids=game_ids, play_ids=play_ids
+            )
+            stage.items = len(plays)
         
         # Enrich plays
         enriched = self.enrich_plays(plays)
@@ -213,9 +863,23 @@ class NFLPipeline:
         
         return enriched
     
+    def build_play_index(self, df: pd.DataFrame) -> PlayIndex:
+        """
+        Sort tracking data once and index each play's row range.
+        
+        Args:
+            df: Full tracking DataFrame
+            
+        Returns:
+            PlayIndex for O(1) per-play lookups
+        """
+        index = PlayIndex(df)
+        print(f"Indexed {len(index)} plays over {len(index.df)} tracking rows")
+        return index
+    
     def get_play_tracking_data(
         self,
-        df: pd.DataFrame,
+        tracking: Union[pd.DataFrame, PlayIndex, "pl.LazyFrame"],
         game_id: str,
         play_id: int
     ) -> pd.DataFrame:
@@ -223,47 +887,46 @@ class NFLPipeline:
         Get all tracking data for a specific play.
         
         Args:
-            df: Full tracking DataFrame
+            tracking: PlayIndex (O(1) zero-copy slice), a polars LazyFrame
+                from scan_tracking (filter pushed into the scan) or a full
+                tracking DataFrame (scanned with a boolean mask and copied)
             game_id: Game ID
             play_id: Play ID
             
         Returns:
             DataFrame with tracking data for the play
         """
-        mask = (df['game_id'] == int(game_id)) & (df['play_id'] == play_id)
-        return df[mask].copy()
+        if isinstance(tracking, PlayIndex):
+            return tracking.get(game_id, play_id)
+        
+        if not isinstance(tracking, pd.DataFrame):
+            return self._polars().play_tracking(tracking, game_id, play_id)
+        
+        mask = (tracking['game_id'] == int(game_id)) & (tracking['play_id'] == play_id)
+        return tracking[mask].copy()
     
     def format_tracking_for_prompt(
         self,
-        tracking_df: pd.DataFrame
+        tracking_df: pd.DataFrame,
+        features: Optional[pd.DataFrame] = None
     ) -> str:
         """
         Format tracking data for use in Gemini prompts.
         
         Args:
             tracking_df: DataFrame with tracking data for a single play
+            features: Optional precomputed player features for the play
+                (from compute_player_features); computed if not given
             
         Returns:
             Formatted string describing player movements
         """
-        # Group by player
-        players = tracking_df.groupby('player_name')
+        if features is None:
+            features = compute_player_features(tracking_df)
         
         lines = []
-        for player_name, player_data in players:
-            player_data = player_data.sort_values('frame_id')
-            
-            # Get first and last positions
-            first = player_data.iloc[0]
-            last = player_data.iloc[-1]
-            
-            position = first['player_position']
-            role = first['player_role']
-            side = first['player_side']
-            
-            # Calculate movement
-            dx = last['x'] - first['x']
-            dy = last['y'] - first['y']
+        for player in features.itertuples(index=False):
+            dx, dy = player.dx, player.dy
             
             # Describe movement
             if abs(dx) < 1 and abs(dy) < 1:
@@ -280,14 +943,81 @@ class NFLPipeline:
                     direction.append("right")
                 movement = " and ".join(direction) if direction else "slight movement"
             
-            lines.append(f"- {player_name} ({position}, {side} {role}): {movement}")
+            lines.append(
+                f"- {player.player_name} ({player.player_position}, "
+                f"{player.player_side} {player.player_role}): {movement}"
+            )
         
         return "\n".join(lines)
     
+    def build_feature_index(self, play_index: PlayIndex) -> PlayIndex:
+        """
+        Compute every player's movement features in a single pass.
+        
+        Args:
+            play_index: Indexed tracking data
+            
+        Returns:
+            PlayIndex over the per-player feature table
+        """
+        return PlayIndex(compute_player_features(play_index.df))
+    
+    def generate_scene(
+        self,
+        play: dict,
+        play_index: Optional[PlayIndex] = None,
+        feature_index: Optional[PlayIndex] = None
+    ) -> SceneDescription:
+        """
+        Generate one play's scene description, reusing its checkpoint when
+        the inputs match.
+        
+        Args:
+            play: Enriched play dict
+            play_index: Optional indexed tracking data
+            feature_index: Optional indexed player features (required with
+                play_index)
+            
+        Returns:
+            SceneDescription for the play
+        """
+        generator = self.scene_generator
+        
+        # Template descriptions are cheap and deterministic; only model output
+        # is worth checkpointing
+        model_id = generator.model_name if generator.model else "template"
+        
+        # Get tracking data for this play if available
+        play_tracking = None
+        player_features = None
+        if play_index is not None:
+            play_tracking = play_index.get(play['game_id'], play['play_id'])
+            player_features = feature_index.get(play['game_id'], play['play_id'])
+        
+        # Scene columns from an earlier run aren't inputs; keys are typed the
+        # same whether the play came from ESPN or from an enriched CSV
+        play_input = {k: v for k, v in play.items() if k not in self.SCENE_COLUMNS}
+        play_input.update(game_id=int(play['game_id']), play_id=int(play['play_id']))
+        
+        key = content_hash(generator.PROMPT_VERSION, model_id, play_input, play_tracking)
+        cached = self.checkpoints.get('scene', play['game_id'], play['play_id'], key)
+        if cached is not None:
+            return SceneDescription(**cached)
+        
+        with METRICS.timer('play_stage_seconds', stage='scene'):
+            scene = generator.generate_description(play, play_tracking, player_features)
+        
+        # Template output (including a fallback after a Gemini error) isn't
+        # saved, so those plays go to Gemini again next run
+        if scene.generated_by == generator.model_name:
+            self.checkpoints.put('scene', play['game_id'], play['play_id'], key, asdict(scene))
+        
+        return scene
+    
     def generate_scenes(
         self,
         enriched_df: pd.DataFrame,
-        tracking_df: Optional[pd.DataFrame] = None,
+        tracking_df: Optional[Union[pd.DataFrame, PlayIndex]] = None,
         progress: bool = True
     ) -> list[SceneDescription]:
         """
@@ -295,35 +1025,73 @@ class NFLPipeline:
         
         Args:
             enriched_df: DataFrame with enriched plays
-            tracking_df: Optional tracking data for enhanced descriptions
+            tracking_df: Optional tracking data (or a prebuilt PlayIndex)
+                for enhanced descriptions
             progress: Whether to show progress bar
             
         Returns:
             List of SceneDescription objects
         """
         scenes = []
+        self.checkpoints.reset('scene')
         
-        iterator = enriched_df.iterrows()
-        if progress:
-            iterator = tqdm(iterator, total=len(enriched_df), desc="Generating scenes")
-        
-        for _, play in iterator:
-            play_dict = play.to_dict()
-            
-            # Get tracking data for this play if available
-            play_tracking = None
+        with self._stage('scene') as stage:
+            # Index once so each play's frames are a slice, not a full-frame
+            # mask, and compute every player's movement features in one pass
+            play_index = None
+            feature_index = None
             if tracking_df is not None:
-                mask = (
-                    (tracking_df['game_id'] == int(play['game_id'])) &
-                    (tracking_df['play_id'] == play['play_id'])
+                play_index = (
+                    tracking_df if isinstance(tracking_df, PlayIndex)
+                    else self.build_play_index(tracking_df)
                 )
-                play_tracking = tracking_df[mask]
+                feature_index = self.build_feature_index(play_index)
+            
+            iterator = enriched_df.iterrows()
+            if progress:
+                iterator = tqdm(iterator, total=len(enriched_df), desc="Generating scenes")
             
-            scene = self.scene_generator.generate_description(play_dict, play_tracking)
-            scenes.append(scene)
+            for _, play in iterator:
+                scenes.append(self.generate_scene(play.to_dict(), play_index, feature_index))
+            stage.items = len(scenes)
         
+        print(self.checkpoints.summary('scene'))
         return scenes
     
+    def generate_video(self, scene: SceneDescription) -> GeneratedVideo:
+        """
+        Generate one scene's video, reusing its checkpoint when the scene is
+        unchanged and the video file still exists.
+        
+        Args:
+            scene: SceneDescription to render
+            
+        Returns:
+            GeneratedVideo result
+        """
+        generator = self.video_generator
+        key = content_hash(
+            generator.PROMPT_VERSION, generator.MODEL_NAME,
+            scene.description, scene.style_hints
+        )
+        cached = self.checkpoints.get('video', scene.game_id, scene.play_id, key)
+        if cached is not None and os.path.exists(cached['video_path']):
+            return GeneratedVideo(**cached)
+        
+        with METRICS.timer('play_stage_seconds', stage='video'):
+            result = generator.generate_video(
+                scene_description=scene.description,
+                play_id=scene.play_id,
+                game_id=scene.game_id,
+                style_hints=scene.style_hints
+            )
+        
+        # Only successful videos are final; failures are retried
+        if result.success:
+            self.checkpoints.put('video', scene.game_id, scene.play_id, key, asdict(result))
+        
+        return result
+    
     def generate_videos(
         self,
         scenes: list[SceneDescription],
@@ -340,20 +1108,18 @@ class NFLPipeline:
             List of GeneratedVideo results
         """
         results = []
+        self.checkpoints.reset('video')
         
         iterator = scenes
         if progress:
             iterator = tqdm(scenes, desc="Generating videos")
         
-        for scene in iterator:
-            result = self.video_generator.generate_video(
-                scene_description=scene.description,
-                play_id=scene.play_id,
-                game_id=scene.game_id,
-                style_hints=scene.style_hints
-            )
-            results.append(result)
+        with self._stage('video') as stage:
+            for scene in iterator:
+                results.append(self.generate_video(scene))
+            stage.items = len(results)
         
+        print(self.checkpoints.summary('video'))
         return results
     
     def run_full_pipeline(
@@ -361,7 +1127,9 @@ class NFLPipeline:
         week_num: int,
         year: int = 2023,
         max_plays: int = 5,
-        generate_video: bool = True
+        generate_video: bool = True,
+        game_ids: Optional[list] = None,
+        play_ids: Optional[list] = None
     ) -> dict:
         """
         Run the full pipeline: load -> enrich -> scene gen -> video gen.
@@ -371,6 +1139,8 @@ class NFLPipeline:
             year: Season year
             max_plays: Maximum number of plays to process
             generate_video: Whether to attempt video generation
+            game_ids: Optional list of game_ids to restrict plays to
+            play_ids: Optional list of play_ids to restrict plays to
             
         Returns:
             Dict with results from each stage
@@ -382,9 +1152,20 @@ class NFLPipeline:
         print("STEP 1: Loading tracking data")
         print("="*60)
         filename = f"input_{year}_w{week_num:02d}.csv"
-        tracking_df = self.load_tracking_data(filename)
-        plays_df = self.extract_unique_plays(tracking_df)
-        plays_df = plays_df.head(max_plays)
+        with self._stage('extract') as stage:
+            plays_df = self.load_unique_plays(
+                filename, max_plays=max_plays, game_ids=game_ids, play_ids=play_ids
+            )
+            stage.items = len(plays_df)
+        
+        # Full tracking rows are only needed for the selected plays
+        with self._stage('load') as stage:
+            tracking_df = self.load_tracking_data(
+                filename,
+                game_ids=plays_df['game_id'].unique().tolist(),
+                play_ids=plays_df['play_id'].unique().tolist()
+            )
+            stage.items = len(plays_df)
         results['plays_loaded'] = len(plays_df)
         
         # Step 2: Enrich with ESPN
@@ -403,38 +1184,15 @@ class NFLPipeline:
         results['scenes'] = scenes
         
         # Add scene descriptions to enriched DataFrame
-        scene_data = {
-            (s.game_id, s.play_id): {
-                'scene_description': s.description,
-                'camera_angle': s.camera_angle,
-                'formation_offense': s.formation_offense,
-                'formation_defense': s.formation_defense,
-            }
-            for s in scenes
-        }
-        
-        # Merge scene data into enriched_df
-        enriched_df['scene_description'] = enriched_df.apply(
-            lambda row: scene_data.get((str(row['game_id']), row['play_id']), {}).get('scene_description', ''),
-            axis=1
-        )
-        enriched_df['camera_angle'] = enriched_df.apply(
-            lambda row: scene_data.get((str(row['game_id']), row['play_id']), {}).get('camera_angle', ''),
-            axis=1
-        )
-        enriched_df['formation_offense'] = enriched_df.apply(
-            lambda row: scene_data.get((str(row['game_id']), row['play_id']), {}).get('formation_offense', ''),
-            axis=1
-        )
-        enriched_df['formation_defense'] = enriched_df.apply(
-            lambda row: scene_data.get((str(row['game_id']), row['play_id']), {}).get('formation_defense', ''),
-            axis=1
-        )
+        enriched_df = self.attach_scenes(enriched_df, scenes)
         
         # Save enriched data with scene descriptions
         output_filename = f"enriched_{year}_w{week_num:02d}.csv"
         self.save_enriched_data(enriched_df, output_filename)
         
+        # Scenes are built; don't hold the tracking rows through video generation
+        del tracking_df
+        
         # Step 4: Generate videos (if requested)
         if generate_video:
             print("\n" + "="*60)
@@ -447,11 +1205,164 @@ class NFLPipeline:
         
         return results
     
+    def run_streaming_pipeline(
+        self,
+        week_num: int,
+        year: int = 2023,
+        max_plays: int = 5,
+        generate_video: bool = True,
+        game_ids: Optional[list] = None,
+        play_ids: Optional[list] = None,
+        enrich_workers: int = 2,
+        scene_workers: int = 4,
+        video_workers: int = 2,
+        queue_size: int = 4
+    ) -> dict:
+        """
+        Run enrich -> scene gen -> video gen with the stages overlapped.
+        
+        Each play moves to the next stage as soon as its current one is done,
+        through bounded queues, instead of waiting for every play to finish
+        the stage. The first video is ready after one play's worth of work,
+        and wall time is bounded by the slowest stage.
+        
+        Args:
+            week_num: Week number (1-18)
+            year: Season year
+            max_plays: Maximum number of plays to process
+            generate_video: Whether to attempt video generation
+            game_ids: Optional list of game_ids to restrict plays to
+            play_ids: Optional list of play_ids to restrict plays to
+            enrich_workers: Concurrent ESPN enrichment workers
+            scene_workers: Concurrent Gemini scene workers
+            video_workers: Concurrent Veo video workers
+            queue_size: Capacity of each queue between stages
+            
+        Returns:
+            Dict with the same results as run_full_pipeline, plus
+            'first_result_seconds', 'total_seconds' and 'failures'
+        """
+        results = {}
+        
+        print("\n" + "="*60)
+        print("Loading tracking data")
+        print("="*60)
+        filename = f"input_{year}_w{week_num:02d}.csv"
+        with self._stage('extract') as stage:
+            plays_df = self.load_unique_plays(
+                filename, max_plays=max_plays, game_ids=game_ids, play_ids=play_ids
+            )
+            stage.items = len(plays_df)
+        
+        with self._stage('load') as stage:
+            tracking_df = self.load_tracking_data(
+                filename,
+                game_ids=plays_df['game_id'].unique().tolist(),
+                play_ids=plays_df['play_id'].unique().tolist()
+            )
+            play_index = self.build_play_index(tracking_df)
+            feature_index = self.build_feature_index(play_index)
+            del tracking_df
+            stage.items = len(plays_df)
+        results['plays_loaded'] = len(plays_df)
+        
+        # Matching workers then never wait on ESPN
+        self.prefetch_espn(plays_df)
+        
+        hints = self.sequence_hints(plays_df)
+        
+        def enrich(item):
+            idx, row = item
+            return self.enrich_play(row, hints[idx])
+        
+        def describe(enriched):
+            return enriched, self.generate_scene(enriched, play_index, feature_index)
+        
+        def render(item):
+            enriched, scene = item
+            return enriched, scene, self.generate_video(scene)
+        
+        # Create the generators before workers race to do it
+        self.scene_generator
+        if generate_video:
+            self.video_generator
+        
+        stages = [
+            Stage('enrich', enrich, enrich_workers),
+            Stage('scene', describe, scene_workers),
+        ]
+        if generate_video:
+            stages.append(Stage('video', render, video_workers))
+        
+        print("\n" + "="*60)
+        print(f"Streaming {len(plays_df)} plays through {' -> '.join(s.name for s in stages)}")
+        print("="*60)
+        self.checkpoints.reset(*(stage.name for stage in stages))
+        
+        enriched_plays = []
+        scenes = []
+        videos = []
+        failures = []
+        first_result_seconds = None
+        start = time.time()
+        
+        executor = StreamingExecutor(stages, queue_size=queue_size)
+        with self._stage('stream') as stream:
+            for result in tqdm(executor.run(plays_df.iterrows()), total=len(plays_df), desc="Streaming plays"):
+                if not result.completed:
+                    # Plays without an ESPN match are dropped after enrichment
+                    if result.error:
+                        failures.append(f"{result.stage}: {result.error}")
+                    continue
+                
+                if first_result_seconds is None:
+                    first_result_seconds = time.time() - start
+                
+                enriched_plays.append(result.item[0])
+                scenes.append(result.item[1])
+                if generate_video:
+                    videos.append(result.item[2])
+            stream.items = len(scenes)
+        
+        results['total_seconds'] = time.time() - start
+        results['first_result_seconds'] = first_result_seconds
+        results['failures'] = failures
+        
+        # Stages overlap, so each one's throughput is over the whole run
+        stage_items = {'enrich': len(plays_df), 'scene': len(scenes), 'video': len(videos)}
+        for stage in stages:
+            METRICS.record_stage(stage.name, stage_items[stage.name], results['total_seconds'])
+        
+        for stage in stages:
+            print(self.checkpoints.summary(stage.name))
+        
+        enriched_df = pd.DataFrame(enriched_plays)
+        if not enriched_df.empty:
+            enriched_df = self.normalize_play_keys(enriched_df).sort_values(
+                ['game_id', 'play_id'], kind='stable'
+            ).reset_index(drop=True)
+        results['plays_enriched'] = len(enriched_df)
+        results['scenes_generated'] = len(scenes)
+        results['scenes'] = scenes
+        
+        enriched_df = self.attach_scenes(enriched_df, scenes)
+        output_filename = f"enriched_{year}_w{week_num:02d}.csv"
+        self.save_enriched_data(enriched_df, output_filename)
+        
+        if generate_video:
+            results['videos_attempted'] = len(videos)
+            results['videos_successful'] = sum(1 for v in videos if v.success)
+            results['videos'] = videos
+        
+        return results
+    
     def generate_scenes_from_enriched(
         self,
         week_num: int,
         year: int = 2023,
-        max_plays: Optional[int] = None
+        max_plays: Optional[int] = None,
+        game_ids: Optional[list] = None,
+        play_ids: Optional[list] = None
     ) -> dict:
         """
         Generate scene descriptions from existing enriched CSV data.
@@ -461,6 +1372,8 @@ class NFLPipeline:
             week_num: Week number (1-18)
             year: Season year
             max_plays: Optional limit on number of plays
+            game_ids: Optional list of game_ids to restrict plays to
+            play_ids: Optional list of play_ids to restrict plays to
             
         Returns:
             Dict with results
@@ -478,7 +1391,14 @@ class NFLPipeline:
         print(f"\n{'='*60}")
         print("Loading existing enriched data")
         print(f"{'='*60}")
-        enriched_df = pd.read_csv(enriched_path)
+        # Without filters the limit can be pushed into the CSV reader
+        filtered = game_ids is not None or play_ids is not None
+        enriched_df = pd.read_csv(enriched_path, nrows=None if filtered else max_plays)
+        
+        if game_ids is not None:
+            enriched_df = enriched_df[enriched_df['game_id'].isin([int(g) for g in game_ids])]
+        if play_ids is not None:
+            enriched_df = enriched_df[enriched_df['play_id'].isin([int(p) for p in play_ids])]
         print(f"Loaded {len(enriched_df)} enriched plays")
         
         if max_plays:
@@ -496,32 +1416,7 @@ class NFLPipeline:
         results['scenes'] = scenes
         
         # Add scene descriptions to DataFrame
-        scene_data = {
-            (str(s.game_id), s.play_id): {
-                'scene_description': s.description,
-                'camera_angle': s.camera_angle,
-                'formation_offense': s.formation_offense,
-                'formation_defense': s.formation_defense,
-            }
-            for s in scenes
-        }
-        
-        enriched_df['scene_description'] = enriched_df.apply(
-            lambda row: scene_data.get((str(row['game_id']), row['play_id']), {}).get('scene_description', ''),
-            axis=1
-        )
-        enriched_df['camera_angle'] = enriched_df.apply(
-            lambda row: scene_data.get((str(row['game_id']), row['play_id']), {}).get('camera_angle', ''),
-            axis=1
-        )
-        enriched_df['formation_offense'] = enriched_df.apply(
-            lambda row: scene_data.get((str(row['game_id']), row['play_id']), {}).get('formation_offense', ''),
-            axis=1
-        )
-        enriched_df['formation_defense'] = enriched_df.apply(
-            lambda row: scene_data.get((str(row['game_id']), row['play_id']), {}).get('formation_defense', ''),
-            axis=1
-        )
+        enriched_df = self.attach_scenes(enriched_df, scenes)
         
         # Save updated data
         output_filename = f"enriched_{year}_w{week_num:02d}.csv"
@@ -541,33 +1436,174 @@ def main():
                        help='Directory for output files')
     parser.add_argument('--week', type=int, default=1,
                        help='Week number to process')
-    parser.add_argument('--max-plays', type=int, default=5,
-                       help='Maximum number of plays to process')
+    parser.add_argument('--max-plays', type=int, default=None,
+                       help='Maximum number of plays to process (default: 5; '
+                            'batch mode processes every play unless set)')
+    parser.add_argument('--game-id', type=int, action='append', dest='game_ids',
+                       help='Only process this game_id (repeatable)')
+    parser.add_argument('--play-id', type=int, action='append', dest='play_ids',
+                       help='Only process this play_id (repeatable)')
     parser.add_argument('--full', action='store_true',
                        help='Run full pipeline including video generation')
     parser.add_argument('--no-video', action='store_true',
                        help='Skip video generation')
     parser.add_argument('--scenes-only', action='store_true',
                        help='Generate scene descriptions from existing enriched data')
+    parser.add_argument('--no-store', action='store_true',
+                       help='Read tracking CSVs directly instead of the columnar store')
+    parser.add_argument('--memory-limit-mb', type=float, default=None,
+                       help='Stream tracking data in chunks under this memory ceiling')
+    parser.add_argument('--build-store', action='store_true',
+                       help='Convert the week\'s tracking CSVs (every season) into the columnar store and exit')
+    parser.add_argument('--stream', action='store_true',
+                       help='With --full, overlap enrichment, scene and video generation per play')
+    parser.add_argument('--enrich-workers', type=int, default=2,
+                       help='Concurrent ESPN enrichment workers with --stream')
+    parser.add_argument('--scene-workers', type=int, default=4,
+                       help='Concurrent Gemini scene workers with --stream')
+    parser.add_argument('--video-workers', type=int, default=2,
+                       help='Concurrent Veo video workers with --stream')
+    parser.add_argument('--engine', choices=NFLPipeline.ENGINES, default='pandas',
+                       help='Dataframe engine for loading and aggregating tracking data')
+    parser.add_argument('--import-report', action='store_true',
+                       help='Report CLI startup time and import time per module, then exit')
+    parser.add_argument('--force', action='store_true',
+                       help='Ignore stage checkpoints and recompute every play')
+    parser.add_argument('--espn-rps', type=float, default=DEFAULT_RATE_LIMITS['espn'][0],
+                       help='Sustained ESPN requests per second, shared by all workers and processes')
+    parser.add_argument('--espn-burst', type=int, default=DEFAULT_RATE_LIMITS['espn'][1],
+                       help='ESPN requests allowed back to back after an idle period')
+    parser.add_argument('--gemini-rpm', type=float, default=None,
+                       help='Limit Gemini requests per minute (default: unlimited)')
+    parser.add_argument('--veo-rpm', type=float, default=None,
+                       help='Limit Veo video submissions per minute (default: unlimited)')
+    parser.add_argument('--espn-cache-mb', type=float, default=NFLPipeline.DEFAULT_ESPN_CACHE_MB,
+                       help='Size cap for the persistent ESPN response cache (0 disables it)')
+    parser.add_argument('--espn-memory-mb', type=float, default=ESPNClient.DEFAULT_MEMORY_CACHE_MB,
+                       help='Size cap for each in-memory ESPN cache (LRU eviction)')
+    parser.add_argument('--weeks', default=None,
+                       help='Process several weeks in parallel, e.g. "1-18" or "1,3,5-7"')
+    parser.add_argument('--seasons', default=None,
+                       help='Seasons to batch over, e.g. "2023" or "2022-2023" (default 2023)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Worker processes for --weeks/--seasons (default: CPU count)')
+    parser.add_argument('--profile', nargs='?', const='deterministic', default=None,
+                       choices=['deterministic', 'sampling'],
+                       help='Profile each stage (cProfile by default, or a stack sampler) '
+                            'and write output/profiles/')
+    parser.add_argument('--profile-interval', type=float, default=5.0,
+                       help='Milliseconds between stack samples with --profile sampling')
+    parser.add_argument('--profile-top', type=int, default=15,
+                       help='Hot functions listed per stage in the profile summary')
+    parser.add_argument('--trace-memory', action='store_true',
+                       help='Trace allocations with tracemalloc and report the largest '
+                            'allocation sites per stage (slower)')
+    parser.add_argument('--metrics-name', default='pipeline',
+                       help='Base name of the metrics files under output/metrics/ '
+                            '(give concurrent runs distinct names)')
     
     args = parser.parse_args()
     
+    if args.import_report:
+        from startup import import_report
+        print(import_report())
+        return
+    
     # Get absolute paths
     script_dir = os.path.dirname(os.path.dirname(__file__))
     data_dir = os.path.join(script_dir, args.data_dir)
     output_dir = os.path.join(script_dir, args.output_dir)
     
+    # Buckets live under output/ so concurrent runs and batch workers share them
+    rate_limits = {
+        'espn': (args.espn_rps, args.espn_burst) if args.espn_rps > 0 else None,
+        'gemini': (args.gemini_rpm / 60, 1) if args.gemini_rpm else None,
+        'veo': (args.veo_rpm / 60, 1) if args.veo_rpm else None,
+    }
+    rate_limit_dir = os.path.join(output_dir, 'ratelimits')
+    
+    if args.weeks or args.seasons:
+        # Batch mode: fan weeks out across worker processes
+        from batch import parse_range, run_batch
+        
+        results = run_batch(
+            data_dir=data_dir,
+            output_dir=output_dir,
+            seasons=parse_range(args.seasons or '2023'),
+            weeks=parse_range(args.weeks or str(args.week)),
+            workers=args.workers,
+            max_plays=args.max_plays,
+            full=args.full,
+            use_store=not args.no_store,
+            memory_limit_mb=args.memory_limit_mb,
+            resume=not args.force,
+            engine=args.engine,
+            espn_cache_mb=args.espn_cache_mb,
+            espn_memory_mb=args.espn_memory_mb,
+            rate_limits=rate_limits,
+            rate_limit_dir=rate_limit_dir
+        )
+        
+        print("\n" + "="*60)
+        print("BATCH SUMMARY")
+        print("="*60)
+        for result in results:
+            status = result['error'] or f"{result['plays_enriched']} plays enriched"
+            print(f"{result['season']} week {result['week']:2d}: {status}")
+        return
+    
+    if args.max_plays is None:
+        args.max_plays = 5
+    
+    profiler = None
+    if args.profile:
+        from profiling import StageProfiler
+        profiler = StageProfiler(
+            os.path.join(output_dir, 'profiles'),
+            mode=args.profile,
+            interval=args.profile_interval / 1000
+        )
+    
     # Initialize pipeline
     pipeline = NFLPipeline(
         data_dir=data_dir,
-        output_dir=output_dir
+        output_dir=output_dir,
+        use_store=not args.no_store,
+        memory_limit_mb=args.memory_limit_mb,
+        resume=not args.force,
+        engine=args.engine,
+        espn_cache_mb=args.espn_cache_mb,
+        espn_memory_mb=args.espn_memory_mb,
+        rate_limits=rate_limits,
+        rate_limit_dir=rate_limit_dir,
+        profiler=profiler,
+        memory_tracker=MemoryTracker(trace_allocations=args.trace_memory)
     )
     
-    if args.scenes_only:
+    if args.build_store:
+        if not pipeline.tracking_store:
+            print("pyarrow is not installed - cannot build the columnar store")
+            sys.exit(1)
+        
+        # Convert the week for every season on disk, not just 2023
+        csv_paths = sorted(glob.glob(
+            os.path.join(data_dir, 'train', f"input_*_w{args.week:02d}.csv")
+        ))
+        if not csv_paths:
+            print(f"No tracking CSVs for week {args.week} in {os.path.join(data_dir, 'train')}")
+            sys.exit(1)
+        for csv_path in csv_paths:
+            partition = TrackingStore.parse_filename(csv_path)
+            if partition:
+                pipeline.tracking_store.convert_csv(csv_path, *partition)
+    
+    elif args.scenes_only:
         # Generate scenes from existing enriched data
         results = pipeline.generate_scenes_from_enriched(
             week_num=args.week,
-            max_plays=args.max_plays
+            max_plays=args.max_plays,
+            game_ids=args.game_ids,
+            play_ids=args.play_ids
         )
         
         # Print summary
@@ -588,14 +1624,30 @@ def main():
             print(f"Formation (Def): {scene.formation_defense}")
             print(f"Duration hint: {scene.duration_hint}s")
             print(f"\n{scene.description}")
+        
+        pipeline.write_metrics({'mode': 'scenes-only', **results}, name=args.metrics_name)
     
     elif args.full:
         # Run full pipeline
-        results = pipeline.run_full_pipeline(
-            week_num=args.week,
-            max_plays=args.max_plays,
-            generate_video=not args.no_video
-        )
+        if args.stream:
+            results = pipeline.run_streaming_pipeline(
+                week_num=args.week,
+                max_plays=args.max_plays,
+                generate_video=not args.no_video,
+                game_ids=args.game_ids,
+                play_ids=args.play_ids,
+                enrich_workers=args.enrich_workers,
+                scene_workers=args.scene_workers,
+                video_workers=args.video_workers
+            )
+        else:
+            results = pipeline.run_full_pipeline(
+                week_num=args.week,
+                max_plays=args.max_plays,
+                generate_video=not args.no_video,
+                game_ids=args.game_ids,
+                play_ids=args.play_ids
+            )
         
         # Print summary
         print("\n" + "="*60)
@@ -605,6 +1657,10 @@ def main():
         print(f"Plays enriched: {results['plays_enriched']}")
         print(f"Scenes generated: {results['scenes_generated']}")
         
+        if results.get('first_result_seconds') is not None:
+            print(f"First play done after: {results['first_result_seconds']:.1f}s")
+            print(f"Total time: {results['total_seconds']:.1f}s")
+        
         if 'videos_attempted' in results:
             print(f"Videos attempted: {results['videos_attempted']}")
             print(f"Videos successful: {results['videos_successful']}")
@@ -619,11 +1675,15 @@ def main():
             print(f"Duration hint: {scene.duration_hint}s")
             print(f"Style: {', '.join(scene.style_hints)}")
             print(f"\n{scene.description}")
+        
+        pipeline.write_metrics({'mode': 'full', **results}, name=args.metrics_name)
     else:
         # Just enrich (original behavior)
         enriched = pipeline.process_week(
             week_num=args.week,
-            max_plays=args.max_plays
+            max_plays=args.max_plays,
+            game_ids=args.game_ids,
+            play_ids=args.play_ids
         )
         
         # Print sample results
@@ -636,6 +1696,20 @@ def main():
             print(f"  {play['down']}&{play['yards_to_go']} at yardline {play['absolute_yardline']}")
             print(f"  {play['play_description']}")
             print(f"  Confidence: {play['match_confidence']:.2f}")
+        
+        pipeline.write_metrics({'mode': 'enrich', 'plays_enriched': len(enriched)}, name=args.metrics_name)
+    
+    if pipeline.memory.stages:
+        print("\n" + "="*60)
+        print("MEMORY")
+        print("="*60)
+        print(pipeline.memory.report())
+    
+    if profiler is not None:
+        print("\n" + "="*60)
+        print("PROFILE")
+        print("="*60)
+        print(profiler.write(top=args.profile_top))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+"""
+Per-stage profiling for pipeline runs.
+
+StageProfiler wraps each pipeline stage (extract, load, enrich, scene,
+video, save) in a profiler and writes one profile per stage plus a summary
+of the hottest functions:
+
+    deterministic   cProfile; exact call counts, but adds overhead to every
+                    Python call and only sees the thread that runs the stage.
+                    Writes {stage}.prof (pstats / snakeviz).
+    sampling        a background thread snapshots every thread's stack with
+                    sys._current_frames() at a fixed interval; low overhead
+                    and sees streaming-pipeline worker threads. Threads
+                    parked in a threading wait (idle workers, tqdm's monitor)
+                    are skipped. Writes {stage}.folded (flamegraph.pl /
+                    speedscope).
+
+Stages don't nest: a stage entered while another is being profiled is
+counted as part of the outer one.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+MODES = ('deterministic', 'sampling')
+
+# Default sampling interval in seconds
+DEFAULT_INTERVAL = 0.005
+
+
+def _frame_label(code) -> str:
+    """Readable function label: module-relative file, line and name."""
+    filename = code.co_filename
+    for path in sorted(sys.path, key=len, reverse=True):
+        if path and filename.startswith(path + os.sep):
+            filename = filename[len(path) + 1:]
+            break
+    return f"{filename}:{code.co_firstlineno}({code.co_name})"
+
+
+class _Sampler(threading.Thread):
+    """Samples the stacks of all other threads until stopped."""
+
+    def __init__(self, interval: float):
+        super().__init__(name='stage-profiler', daemon=True)
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._labels: dict = {}
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if frame.f_code.co_name == 'wait' and frame.f_code.co_filename == threading.__file__:
+                    continue
+                stack = []
+                while frame is not None:
+                    label = self._labels.get(frame.f_code)
+                    if label is None:
+                        label = self._labels[frame.f_code] = _frame_label(frame.f_code)
+                    stack.append(label)
+                    frame = frame.f_back
+                self.stacks[tuple(reversed(stack))] += 1
+            self.samples += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+class StageProfiler:
+    """Profiles pipeline stages and writes per-stage profiles."""
+
+    def __init__(
+        self,
+        output_dir: str,
+        mode: str = 'deterministic',
+        interval: float = DEFAULT_INTERVAL
+    ):
+        """
+        Initialize the profiler.
+
+        Args:
+            output_dir: Directory for per-stage profiles and summary.txt
+            mode: 'deterministic' (cProfile) or 'sampling'
+            interval: Seconds between stack samples in sampling mode
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown profile mode {mode!r}, expected one of {MODES}")
+        self.output_dir = output_dir
+        self.mode = mode
+        self.interval = interval
+        self.seconds: Counter = Counter()
+        self._profiles: dict[str, cProfile.Profile] = {}
+        self._stacks: dict[str, Counter] = {}
+        self._active: Optional[str] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Profile a block as (part of) the named stage."""
+        if self._active is not None:
+            yield
+            return
+
+        self._active = name
+        start = time.perf_counter()
+        if self.mode == 'deterministic':
+            profile = self._profiles.setdefault(name, cProfile.Profile())
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                self._finish(name, start)
+        else:
+            sampler = _Sampler(self.interval)
+            sampler.start()
+            try:
+                yield
+            finally:
+                sampler.stop()
+                self._stacks.setdefault(name, Counter()).update(sampler.stacks)
+                self._finish(name, start)
+
+    def _finish(self, name: str, start: float) -> None:
+        self.seconds[name] += time.perf_counter() - start
+        self._active = None
+
+    def hot_functions(self, stage: str, top: int = 15) -> list[tuple[str, float, float]]:
+        """
+        Hottest functions of a stage.
+
+        Args:
+            stage: Stage name
+            top: Number of functions to return
+
+        Returns:
+            (function, self, total) tuples sorted by self cost: seconds in
+            deterministic mode, share of samples in sampling mode
+        """
+        if self.mode == 'deterministic':
+            stats = pstats.Stats(self._profiles[stage], stream=io.StringIO()).stats
+            rows = [
+                (f"{os.path.basename(f)}:{line}({fn})", tottime, cumtime)
+                for (f, line, fn), (_, _, tottime, cumtime, _) in stats.items()
+            ]
+        else:
+            stacks = self._stacks[stage]
+            total_samples = sum(stacks.values()) or 1
+            own: Counter = Counter()
+            inclusive: Counter = Counter()
+            for stack, count in stacks.items():
+                own[stack[-1]] += count
+                for label in set(stack):
+                    inclusive[label] += count
+            rows = [
+                (label, own[label] / total_samples, inclusive[label] / total_samples)
+                for label in inclusive
+            ]
+        return sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+
+    def write(self, top: int = 15) -> str:
+        """
+        Write per-stage profiles and summary.txt.
+
+        Args:
+            top: Hot functions listed per stage
+
+        Returns:
+            The summary text
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        for name in os.listdir(self.output_dir):
+            if name.endswith(('.prof', '.folded')):
+                os.remove(os.path.join(self.output_dir, name))
+        lines = [f"Profile mode: {self.mode}", ""]
+
+        for stage, seconds in self.seconds.items():
+            if self.mode == 'deterministic':
+                path = os.path.join(self.output_dir, f"{stage}.prof")
+                self._profiles[stage].dump_stats(path)
+                header = f"{'function':<60} {'self s':>9} {'total s':>9}"
+                fmt = "{:<60} {:>9.3f} {:>9.3f}"
+            else:
+                path = os.path.join(self.output_dir, f"{stage}.folded")
+                with open(path, 'w') as f:
+                    for stack, count in self._stacks[stage].most_common():
+                        f.write(f"{';'.join(stack)} {count}\n")
+                header = f"{'function':<60} {'self %':>9} {'total %':>9}"
+                fmt = "{:<60} {:>9.1%} {:>9.1%}"
+
+            lines += [f"== {stage}: {seconds:.2f}s -> {path}", header]
+            for label, own, total in self.hot_functions(stage, top):
+                lines.append(fmt.format(label[-60:], own, total))
+            lines.append("")
+
+        summary = "\n".join(lines)
+        with open(os.path.join(self.output_dir, 'summary.txt'), 'w') as f:
+            f.write(summary)
+        return summary
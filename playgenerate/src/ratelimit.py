@@ -0,0 +1,158 @@
+"""
+Token-bucket rate limiting for external APIs (ESPN, Gemini, Veo).
+
+A TokenBucket allows bursts of up to `burst` requests and a sustained
+`rate` requests per second. Callers reserve a token and sleep until it is
+due (acquire, or acquire_async from a coroutine). Reservations are handed
+out in order under a lock, so any number of threads share the budget
+without exceeding it.
+
+With a state file the bucket's state (tokens left, last update) lives in a
+small file updated under an exclusive flock, so every process pointing at
+the same file (batch workers, several pipeline runs, the pipeline worker)
+draws from one budget. Without fcntl (Windows) buckets are per process.
+
+shared_limiter() returns one bucket per service name and state directory,
+so every client in a process shares it.
+
+Layout:
+    {state_dir}/{name}.bucket
+"""
+
+import asyncio
+import os
+import struct
+import threading
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: no advisory locks, buckets are per process
+    fcntl = None
+
+
+# Default (requests per second, burst) per service; None means unlimited.
+# Gemini and Veo quotas depend on the account tier, so they're opt-in.
+DEFAULT_RATE_LIMITS = {
+    'espn': (2.0, 4),
+    'gemini': None,
+    'veo': None,
+}
+
+# State file format: tokens available, time of last update
+_STATE = struct.Struct('dd')
+
+
+class TokenBucket:
+    """Thread-safe token bucket, optionally shared across processes."""
+
+    def __init__(self, rate: float, burst: int = 1, state_file: Optional[str] = None):
+        """
+        Initialize the bucket (full, so the first `burst` requests go at once).
+
+        Args:
+            rate: Sustained requests per second
+            burst: Requests allowed back to back after an idle period
+            state_file: Optional file to keep the bucket's state in, shared
+                by every process using the same path
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.state_file = state_file if fcntl is not None else None
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.time()
+        if self.state_file:
+            os.makedirs(os.path.dirname(os.path.abspath(self.state_file)), exist_ok=True)
+
+    def _take(self, tokens: float, updated: float, count: float) -> tuple[float, float, float]:
+        """Refill for the time elapsed, take count tokens and return (tokens, now, wait)."""
+        now = time.time()
+        tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+        # Tokens go negative while requests queue up; each waits for its share
+        tokens -= count
+        return tokens, now, max(0.0, -tokens / self.rate)
+
+    def reserve(self, count: float = 1) -> float:
+        """
+        Reserve tokens for a request.
+
+        Args:
+            count: Tokens to take
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        with self._lock:
+            if self.state_file is None:
+                self._tokens, self._updated, wait = self._take(self._tokens, self._updated, count)
+                return wait
+
+            # Opened per call: a descriptor inherited across fork would share
+            # its flock with the parent
+            fd = os.open(self.state_file, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                raw = os.pread(fd, _STATE.size, 0)
+                state = _STATE.unpack(raw) if len(raw) == _STATE.size else (float(self.burst), time.time())
+                tokens, updated, wait = self._take(*state, count)
+                os.pwrite(fd, _STATE.pack(tokens, updated), 0)
+            finally:
+                os.close(fd)
+            return wait
+
+    def acquire(self, count: float = 1) -> float:
+        """
+        Block until tokens are available.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(count)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, count: float = 1) -> float:
+        """Coroutine version of acquire (sleeps without blocking the loop)."""
+        wait = self.reserve(count)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+_limiters: dict[tuple[str, Optional[str]], TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def shared_limiter(
+    name: str,
+    rate: float,
+    burst: int = 1,
+    state_dir: Optional[str] = None
+) -> TokenBucket:
+    """
+    Get the process-wide bucket for a service.
+
+    Args:
+        name: Service name (e.g. 'espn')
+        rate: Sustained requests per second
+        burst: Requests allowed back to back
+        state_dir: Optional directory for the bucket's state file, to share
+            the budget with other processes
+
+    Returns:
+        The same TokenBucket for every call with this name and state_dir
+        (replaced if the rate or burst changed)
+    """
+    key = (name, state_dir)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None or (limiter.rate, limiter.burst) != (rate, max(1, burst)):
+            state_file = os.path.join(state_dir, f"{name}.bucket") if state_dir else None
+            limiter = _limiters[key] = TokenBucket(rate, burst, state_file)
+    return limiter
@@ -0,0 +1,263 @@
+"""
+Long-lived pipeline worker.
+
+Serves the pipeline over a small local HTTP API so the web tier doesn't pay
+for a fresh interpreter, the pandas/Gemini/Veo imports and client setup on
+every request. One NFLPipeline is created at startup and reused, together
+with its ESPN response cache, game mappings and recently loaded tracking
+data.
+
+Endpoints (JSON):
+    GET  /health   -> {"status": "ok", "uptime_seconds": ..., "requests": ...}
+    GET  /metrics  -> Prometheus text format (GET /metrics.json for JSON)
+    POST /process  {"week": 1, "maxPlays": 10, "mode": "scenes-only"}
+        mode is "scenes-only" (default), "enrich" or "full"; "full" also
+        accepts "generateVideo" (default false). "year", "gameIds" and
+        "playIds" are optional.
+
+Usage (from the playgenerate directory):
+    python src/server.py --port 8765
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from metrics import METRICS
+from pipeline import NFLPipeline
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Largest request body accepted, in bytes
+MAX_BODY_BYTES = 64 * 1024
+
+
+class BadRequest(ValueError):
+    """Raised for malformed /process requests."""
+
+
+class PipelineWorker:
+    """Runs pipeline jobs against one warm NFLPipeline."""
+
+    def __init__(self, pipeline: NFLPipeline):
+        """
+        Initialize the worker.
+
+        Args:
+            pipeline: Pipeline kept alive across requests
+        """
+        self.pipeline = pipeline
+        self.started_at = time.time()
+        self.requests = 0
+        # Jobs write the same enriched CSVs and share clients; run one at a time
+        self._lock = threading.Lock()
+
+    def health(self) -> dict:
+        """Report liveness and basic counters."""
+        return {
+            'status': 'ok',
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+            'requests': self.requests,
+        }
+
+    def process(self, request: dict) -> dict:
+        """
+        Run a pipeline job.
+
+        Args:
+            request: Parsed JSON body (see module docstring)
+
+        Returns:
+            JSON-serializable result dict
+        """
+        mode = request.get('mode', 'scenes-only')
+        if mode not in ('scenes-only', 'enrich', 'full'):
+            raise BadRequest(f"Unknown mode: {mode}")
+
+        try:
+            week = int(request.get('week', 1))
+            year = int(request.get('year', 2023))
+            max_plays = request.get('maxPlays')
+            max_plays = int(max_plays) if max_plays is not None else None
+            game_ids = request.get('gameIds')
+            game_ids = [int(g) for g in game_ids] if game_ids is not None else None
+            play_ids = request.get('playIds')
+            play_ids = [int(p) for p in play_ids] if play_ids is not None else None
+        except (TypeError, ValueError) as e:
+            raise BadRequest(str(e))
+
+        with self._lock:
+            self.requests += 1
+            start = time.time()
+
+            if mode == 'scenes-only':
+                results = self.pipeline.generate_scenes_from_enriched(
+                    week_num=week, year=year, max_plays=max_plays,
+                    game_ids=game_ids, play_ids=play_ids
+                )
+                plays = results['plays_loaded']
+            elif mode == 'enrich':
+                plays = len(self.pipeline.process_week(
+                    week_num=week, year=year, max_plays=max_plays,
+                    game_ids=game_ids, play_ids=play_ids
+                ))
+                results = {'scenes_generated': 0, 'scenes': []}
+            else:
+                results = self.pipeline.run_full_pipeline(
+                    week_num=week, year=year, max_plays=max_plays or 5,
+                    generate_video=bool(request.get('generateVideo', False)),
+                    game_ids=game_ids, play_ids=play_ids
+                )
+                plays = results['plays_enriched']
+
+            seconds = time.time() - start
+
+        return {
+            'success': True,
+            'message': 'Pipeline completed successfully',
+            'mode': mode,
+            'playsProcessed': plays,
+            'scenesGenerated': results['scenes_generated'],
+            'scenes': [
+                {
+                    'gameId': scene.game_id,
+                    'playId': int(scene.play_id),
+                    'description': scene.description,
+                    'cameraAngle': scene.camera_angle,
+                    'formationOffense': scene.formation_offense,
+                    'formationDefense': scene.formation_defense,
+                }
+                for scene in results['scenes']
+            ],
+            'seconds': round(seconds, 3),
+        }
+
+
+def make_handler(worker: PipelineWorker) -> type:
+    """Build a request handler class bound to a worker."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, payload: dict) -> None:
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_text(self, status: int, text: str) -> None:
+            body = text.encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/health':
+                self._send(200, worker.health())
+            elif self.path == '/metrics':
+                self._send_text(200, METRICS.to_prometheus())
+            elif self.path == '/metrics.json':
+                self._send(200, METRICS.snapshot())
+            else:
+                self._send(404, {'success': False, 'error': 'Not found'})
+
+        def do_POST(self):
+            if self.path != '/process':
+                self._send(404, {'success': False, 'error': 'Not found'})
+                return
+
+            length = int(self.headers.get('Content-Length') or 0)
+            if length > MAX_BODY_BYTES:
+                self._send(413, {'success': False, 'error': 'Request body too large'})
+                return
+
+            try:
+                request = json.loads(self.rfile.read(length) or b'{}')
+                if not isinstance(request, dict):
+                    raise BadRequest("Request body must be a JSON object")
+                self._send(200, worker.process(request))
+            except (json.JSONDecodeError, BadRequest) as e:
+                self._send(400, {'success': False, 'error': 'Bad request', 'details': str(e)})
+            except FileNotFoundError as e:
+                self._send(404, {'success': False, 'error': 'Pipeline failed', 'details': str(e)})
+            except Exception as e:
+                self._send(500, {'success': False, 'error': 'Pipeline failed', 'details': str(e)})
+
+        def log_message(self, format, *args):
+            print(f"[worker] {self.address_string()} {format % args}")
+
+    return Handler
+
+
+def serve(
+    data_dir: str,
+    output_dir: str,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    pipeline: Optional[NFLPipeline] = None
+) -> None:
+    """
+    Start the worker and serve until interrupted.
+
+    Args:
+        data_dir: Directory containing Big Data Bowl data
+        output_dir: Directory for output files
+        host: Interface to bind (keep it local; there is no auth)
+        port: Port to listen on
+        pipeline: Optional prebuilt pipeline
+    """
+    worker = PipelineWorker(pipeline or NFLPipeline(
+        data_dir=data_dir, output_dir=output_dir, tracking_cache_size=4
+    ))
+    # Pay for the Gemini/Veo SDK imports at startup, not on the first request
+    worker.pipeline.scene_generator
+    worker.pipeline.video_generator
+    server = ThreadingHTTPServer((host, port), make_handler(worker))
+    print(f"Pipeline worker listening on http://{host}:{port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main():
+    """Entry point for the worker service."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Persistent NFL pipeline worker')
+    parser.add_argument('--data-dir', default='data/nfl-big-data-bowl-2026-prediction',
+                       help='Directory containing Big Data Bowl data')
+    parser.add_argument('--output-dir', default='output',
+                       help='Directory for output files')
+    parser.add_argument('--host', default=DEFAULT_HOST,
+                       help='Interface to bind')
+    parser.add_argument('--port', type=int,
+                       default=int(os.environ.get('PIPELINE_WORKER_PORT', DEFAULT_PORT)),
+                       help='Port to listen on')
+
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.dirname(__file__))
+    serve(
+        data_dir=os.path.join(script_dir, args.data_dir),
+        output_dir=os.path.join(script_dir, args.output_dir),
+        host=args.host,
+        port=args.port
+    )
+
+
+if __name__ == "__main__":
+    main()
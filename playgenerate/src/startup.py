@@ -0,0 +1,119 @@
+"""
+Startup-time report for the playgenerate CLI.
+
+Runs a fresh interpreter with `python -X importtime`, so the numbers reflect
+a cold start rather than modules this process has already imported, and
+summarizes import time per top-level module. The generation SDKs are loaded
+lazily, so their cost is measured separately as the time a stage pays when
+it first needs them.
+"""
+
+import os
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules deliberately left out of startup and imported by their stage
+DEFERRED_MODULES = {
+    'scene generation (Gemini)': 'google.generativeai',
+    'video generation (Veo)': 'google.genai',
+    'columnar tracking store': 'pyarrow.dataset',
+    'polars engine': 'polars',
+    'ESPN response decoding': 'orjson',
+}
+
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+@dataclass
+class ImportTiming:
+    """Import cost of one module from `-X importtime`."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # 0 for modules imported by the measured statement itself
+
+
+def measure_imports(statement: str) -> list[ImportTiming]:
+    """
+    Import-time every module loaded by a statement in a fresh interpreter.
+
+    Args:
+        statement: Python code to run (e.g. 'import pipeline')
+
+    Returns:
+        ImportTiming per module, in import order
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=SRC_DIR, capture_output=True, text=True
+    )
+
+    timings = []
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(ImportTiming(
+                module=module,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(indent) - 1) // 2,
+            ))
+    return timings
+
+
+def time_cli_startup(runs: int = 3) -> float:
+    """Best wall time in seconds of `python pipeline.py --help`."""
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, os.path.join(SRC_DIR, 'pipeline.py'), '--help'],
+            capture_output=True
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def import_report(top: int = 15) -> str:
+    """
+    Build the startup-time report.
+
+    Args:
+        top: Number of pipeline.py's direct imports to list
+
+    Returns:
+        Multi-line report
+    """
+    timings = measure_imports('import pipeline')
+    pipeline = next(t for t in timings if t.module == 'pipeline' and t.depth == 0)
+
+    # Modules imported directly by pipeline.py (their cumulative cost
+    # includes everything they pull in)
+    direct = sorted(
+        (t for t in timings if t.depth == 1),
+        key=lambda t: t.cumulative_us, reverse=True
+    )
+
+    lines = [
+        f"CLI startup (pipeline.py --help): {time_cli_startup() * 1000:.0f} ms",
+        f"Importing pipeline: {pipeline.cumulative_us / 1000:.0f} ms over {len(timings)} modules",
+        "",
+        f"{'module':<40} {'cumulative ms':>14} {'self ms':>9}",
+    ]
+    for t in direct[:top]:
+        lines.append(f"{t.module:<40} {t.cumulative_us / 1000:>14.1f} {t.self_us / 1000:>9.1f}")
+
+    lines += ["", "Deferred until their stage runs:"]
+    for stage, module in DEFERRED_MODULES.items():
+        deferred = [t for t in measure_imports(f'import {module}') if t.module == module]
+        cost = f"{deferred[0].cumulative_us / 1000:.0f} ms" if deferred else "not installed"
+        lines.append(f"  {module:<28} {cost:>10}  ({stage})")
+
+    return "\n".join(lines)
@@ -0,0 +1,8 @@
+# Imports are done lazily so pandas/pyarrow are only loaded when used
+__all__ = ['TrackingStore']
+
+def __getattr__(name):
+    if name == 'TrackingStore':
+        from .store import TrackingStore
+        return TrackingStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
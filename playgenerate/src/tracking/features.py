@@ -0,0 +1,94 @@
+"""
+Vectorized per-player movement features.
+
+Computes, for every player in every play, the first/last position,
+displacement, total path length, max speed and max acceleration in one pass
+over tracking data sorted by (game_id, play_id, player_name, frame_id).
+Prompt formatters read from this table instead of looping over groupby
+results per play.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Keys identifying one player within one play
+FEATURE_KEYS = ['game_id', 'play_id', 'player_name']
+
+# Per-player descriptive columns carried over from the player's first frame
+DESCRIPTIVE_COLUMNS = ['player_position', 'player_role', 'player_side']
+
+FEATURE_COLUMNS = FEATURE_KEYS + DESCRIPTIVE_COLUMNS + [
+    'first_x', 'first_y', 'last_x', 'last_y',
+    'dx', 'dy', 'displacement', 'path_length',
+    'max_speed', 'max_accel', 'num_frames',
+]
+
+
+def _group_max(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Per-group max of a float column, ignoring NaNs (like pandas max)."""
+    return np.fmax.reduceat(values.astype(np.float64), starts)
+
+
+def compute_player_features(tracking_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute movement features for every player in every play.
+
+    Args:
+        tracking_df: Tracking data for any number of plays. Must contain
+            game_id, play_id, player_name, frame_id, x and y; s, a and the
+            descriptive columns are used when present.
+
+    Returns:
+        DataFrame with one row per (game_id, play_id, player_name), sorted by
+        those keys, with FEATURE_COLUMNS
+    """
+    df = tracking_df[tracking_df['player_name'].notna()]
+    if df.empty:
+        return pd.DataFrame(columns=FEATURE_COLUMNS)
+
+    df = df.sort_values(FEATURE_KEYS + ['frame_id'], kind='stable')
+
+    game = df['game_id'].to_numpy()
+    play = df['play_id'].to_numpy()
+    name = df['player_name'].to_numpy()
+    x = df['x'].to_numpy(dtype=np.float64)
+    y = df['y'].to_numpy(dtype=np.float64)
+
+    # Row positions where a new (game, play, player) group begins
+    new_group = np.empty(len(df), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = (game[1:] != game[:-1]) | (play[1:] != play[:-1]) | (name[1:] != name[:-1])
+    starts = np.flatnonzero(new_group)
+    lasts = np.concatenate((starts[1:], [len(df)])) - 1
+
+    # Frame-to-frame step lengths, zeroed at group boundaries
+    steps = np.zeros(len(df))
+    steps[1:] = np.hypot(np.diff(x), np.diff(y))
+    steps[new_group] = 0.0
+
+    features = pd.DataFrame({
+        'game_id': game[starts],
+        'play_id': play[starts],
+        'player_name': name[starts],
+    })
+
+    for column in DESCRIPTIVE_COLUMNS:
+        if column in df:
+            features[column] = df[column].to_numpy()[starts]
+        else:
+            features[column] = 'Unknown' if column == 'player_position' else ''
+
+    features['first_x'] = x[starts]
+    features['first_y'] = y[starts]
+    features['last_x'] = x[lasts]
+    features['last_y'] = y[lasts]
+    features['dx'] = features['last_x'] - features['first_x']
+    features['dy'] = features['last_y'] - features['first_y']
+    features['displacement'] = np.hypot(features['dx'], features['dy'])
+    features['path_length'] = np.add.reduceat(steps, starts)
+    features['max_speed'] = _group_max(df['s'].to_numpy(), starts) if 's' in df else 0.0
+    features['max_accel'] = _group_max(df['a'].to_numpy(), starts) if 'a' in df else 0.0
+    features['num_frames'] = lasts - starts + 1
+
+    return features
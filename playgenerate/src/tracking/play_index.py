@@ -0,0 +1,103 @@
+"""
+Row-range index over tracking data.
+
+Sorts a tracking DataFrame by (game_id, play_id) once and records the start
+and end row of every play, so fetching a play's frames is a dict lookup plus
+a positional slice instead of a boolean mask over the whole frame.
+"""
+
+from typing import Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class PlayIndex:
+    """Maps (game_id, play_id) to a contiguous row range of tracking data."""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Build the index.
+
+        Args:
+            df: Tracking DataFrame with game_id and play_id columns. It is
+                sorted (stably, keeping frame order within each play) only if
+                it isn't already grouped by play.
+        """
+        if not self._is_sorted(df):
+            df = df.sort_values(['game_id', 'play_id'], kind='stable')
+        self.df = df.reset_index(drop=True)
+        self._ranges: dict[tuple[int, int], tuple[int, int]] = self._build_ranges(self.df)
+
+    @staticmethod
+    def _is_sorted(df: pd.DataFrame) -> bool:
+        """Check whether rows are already ordered by (game_id, play_id)."""
+        if len(df) < 2:
+            return True
+        game = df['game_id'].to_numpy()
+        play = df['play_id'].to_numpy()
+        game_step = np.diff(game)
+        if (game_step < 0).any():
+            return False
+        # Within a game, play_id must not decrease
+        return not ((game_step == 0) & (np.diff(play) < 0)).any()
+
+    @staticmethod
+    def _build_ranges(df: pd.DataFrame) -> dict[tuple[int, int], tuple[int, int]]:
+        """Find the [start, stop) row range of each play in sorted data."""
+        if df.empty:
+            return {}
+
+        game = df['game_id'].to_numpy()
+        play = df['play_id'].to_numpy()
+
+        # Rows where a new play begins
+        boundaries = np.flatnonzero((game[1:] != game[:-1]) | (play[1:] != play[:-1])) + 1
+        starts = np.concatenate(([0], boundaries))
+        stops = np.concatenate((boundaries, [len(df)]))
+
+        return {
+            (int(g), int(p)): (int(start), int(stop))
+            for g, p, start, stop in zip(game[starts], play[starts], starts, stops)
+        }
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __contains__(self, key: tuple) -> bool:
+        return (int(key[0]), int(key[1])) in self._ranges
+
+    def keys(self) -> Iterator[tuple[int, int]]:
+        """Iterate over (game_id, play_id) pairs in row order."""
+        return iter(self._ranges)
+
+    def row_range(self, game_id, play_id) -> Optional[tuple[int, int]]:
+        """
+        Get the [start, stop) row range of a play.
+
+        Args:
+            game_id: Game ID (str or int)
+            play_id: Play ID
+
+        Returns:
+            Tuple of (start, stop), or None if the play isn't indexed
+        """
+        return self._ranges.get((int(game_id), int(play_id)))
+
+    def get(self, game_id, play_id) -> pd.DataFrame:
+        """
+        Get all tracking rows for a play.
+
+        Args:
+            game_id: Game ID (str or int)
+            play_id: Play ID
+
+        Returns:
+            Positional slice of the sorted tracking data (empty if the play
+            isn't indexed). The slice shares memory with the index; copy it
+            before modifying.
+        """
+        rows = self.row_range(game_id, play_id)
+        if rows is None:
+            return self.df.iloc[0:0]
+        return self.df.iloc[rows[0]:rows[1]]
@@ -0,0 +1,143 @@
+"""
+Polars lazy backend for tracking data.
+
+Builds LazyFrame queries over a week's tracking data (the raw CSV or the
+columnar store) so polars pushes column projections and game/play filters
+down into the scan and runs group-bys on all cores. Results are returned as
+pandas DataFrames with the same columns and order as the pandas code paths,
+so everything downstream works unchanged.
+"""
+
+import glob
+import os
+from typing import Iterable, Optional
+
+import pandas as pd
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    from .streaming import PLAY_KEYS
+except ImportError:
+    from streaming import PLAY_KEYS
+
+
+def scan_csv(csv_path: str) -> "pl.LazyFrame":
+    """Lazily scan a weekly tracking CSV."""
+    return pl.scan_csv(csv_path, infer_schema_length=10_000)
+
+
+def scan_store(partition_dir: str) -> "pl.LazyFrame":
+    """
+    Lazily scan a week's partition of the columnar store.
+
+    Args:
+        partition_dir: Directory from TrackingStore.partition_dir
+
+    Returns:
+        LazyFrame including the game_id partition column
+    """
+    files = sorted(glob.glob(os.path.join(partition_dir, 'game_id=*', '*.parquet')))
+    return pl.scan_parquet(files, hive_partitioning=True)
+
+
+def _filtered(
+    lf: "pl.LazyFrame",
+    game_ids: Optional[Iterable] = None,
+    play_ids: Optional[Iterable] = None
+) -> "pl.LazyFrame":
+    """Apply optional game/play filters (pushed down into the scan)."""
+    if game_ids is not None:
+        lf = lf.filter(pl.col('game_id').is_in([int(g) for g in game_ids]))
+    if play_ids is not None:
+        lf = lf.filter(pl.col('play_id').is_in([int(p) for p in play_ids]))
+    return lf
+
+
+def load_tracking(
+    lf: "pl.LazyFrame",
+    columns: Optional[list[str]] = None,
+    game_ids: Optional[Iterable] = None,
+    play_ids: Optional[Iterable] = None,
+    column_order: Optional[list[str]] = None
+) -> pd.DataFrame:
+    """
+    Collect tracking rows.
+
+    Args:
+        lf: LazyFrame from scan_csv or scan_store
+        columns: Optional list of columns to load (None loads all)
+        game_ids: Optional game_id filter
+        play_ids: Optional play_id filter
+        column_order: Column order for a full load (the store's partition
+            column otherwise comes last)
+
+    Returns:
+        pandas DataFrame with tracking data
+    """
+    lf = _filtered(lf, game_ids, play_ids)
+    select = columns or column_order
+    if select:
+        lf = lf.select(select)
+    return lf.collect().to_pandas()
+
+
+def unique_plays(
+    lf: "pl.LazyFrame",
+    value_columns: list[str],
+    game_ids: Optional[Iterable] = None,
+    play_ids: Optional[Iterable] = None,
+    max_plays: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Build the one-row-per-play table with a lazy group-by.
+
+    Only PLAY_KEYS and value_columns are read. Each value is the play's
+    first non-null value, matching pandas groupby().first().
+
+    Args:
+        lf: LazyFrame from scan_csv or scan_store
+        value_columns: Per-play columns to keep
+        game_ids: Optional game_id filter
+        play_ids: Optional play_id filter
+        max_plays: Optional limit; keeps the first plays in (game_id,
+            play_id) order, like the pandas paths
+
+    Returns:
+        pandas DataFrame with PLAY_KEYS + value_columns, sorted by PLAY_KEYS
+    """
+    # Sort before head() so the limit keeps the same plays whatever order
+    # the source (or the parallel group-by) produces them in
+    plays = (
+        _filtered(lf, game_ids, play_ids)
+        .select(PLAY_KEYS + value_columns)
+        .group_by(PLAY_KEYS)
+        .agg([pl.col(c).drop_nulls().first() for c in value_columns])
+        .sort(PLAY_KEYS)
+    )
+    if max_plays is not None:
+        plays = plays.head(max_plays)
+    return plays.collect().to_pandas()
+
+
+def play_tracking(lf: "pl.LazyFrame", game_id, play_id) -> pd.DataFrame:
+    """
+    Collect one play's tracking rows.
+
+    Against the store, the filter prunes to the game's partition and the
+    play's row groups before anything is read.
+
+    Args:
+        lf: LazyFrame from scan_csv or scan_store
+        game_id: Game ID (str or int)
+        play_id: Play ID
+
+    Returns:
+        pandas DataFrame with the play's rows
+    """
+    return load_tracking(lf, game_ids=[game_id], play_ids=[play_id])
+
@@ -0,0 +1,75 @@
+"""
+Memory-lean dtype schema for tracking DataFrames.
+
+Tracking rows repeat the same handful of strings (player names, positions,
+roles, sides, play direction) on every frame and store kinematics with far
+more precision than the sensors provide. Applying this schema at load time
+turns the repeated strings into categoricals, the kinematics into float32
+and the ids into the smallest integer type that holds them.
+
+game_id stays int64: BDB ids like 2023090700 don't fit in int32.
+"""
+
+import pandas as pd
+
+
+# Repeated per-player / per-play strings
+CATEGORY_COLUMNS = [
+    'play_direction', 'player_name', 'player_position', 'player_side',
+    'player_role', 'player_height', 'player_birth_date',
+]
+
+# Positions, speeds and angles; float32 keeps ~7 significant digits, far
+# more than the tracking hardware measures. ball_land_x/y stay float64: they
+# are per-play values copied into the play table, enriched CSVs and prompts,
+# where float32 would print 83.78 as 83.77999877929688
+FLOAT32_COLUMNS = [
+    'x', 'y', 's', 'a', 'dir', 'o',
+]
+
+INT_COLUMNS = {
+    'game_id': 'int64',
+    'play_id': 'int32',
+    'nfl_id': 'int32',
+    'frame_id': 'int16',
+    'absolute_yardline_number': 'int16',
+    'num_frames_output': 'int16',
+    'player_weight': 'int16',
+}
+
+
+def apply_tracking_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast tracking columns to the lean schema.
+
+    Columns not in the schema are left alone. Integer columns containing
+    missing values use the nullable integer type of the same width.
+
+    Args:
+        df: Tracking DataFrame (any subset of columns)
+
+    Returns:
+        DataFrame with compact dtypes
+    """
+    dtypes = {}
+
+    for column in CATEGORY_COLUMNS:
+        if column in df and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            dtypes[column] = 'category'
+
+    for column in FLOAT32_COLUMNS:
+        if column in df and df[column].dtype != 'float32':
+            dtypes[column] = 'float32'
+
+    for column, dtype in INT_COLUMNS.items():
+        if column in df and df[column].dtype != dtype:
+            if df[column].isna().any():
+                dtype = dtype.capitalize()
+            dtypes[column] = dtype
+
+    return df.astype(dtypes) if dtypes else df
+
+
+def memory_mb(df: pd.DataFrame) -> float:
+    """Deep memory usage of a DataFrame in MB."""
+    return df.memory_usage(deep=True).sum() / (1024 * 1024)
@@ -0,0 +1,290 @@
+"""
+Columnar tracking store for Big Data Bowl data.
+
+Converts the weekly `input_{year}_w{NN}.csv` tracking files into a Parquet
+dataset partitioned by season/week/game_id:
+
+    tracking_store/season=2023/week=01/game_id=2023090700/part-0.parquet
+
+The conversion runs once per week. Reads afterwards are memory-mapped and use
+column projection plus partition/row-group pruning, so callers that only need
+a handful of columns (or a handful of games) never parse the full week.
+"""
+
+import importlib.util
+import json
+import os
+import re
+import shutil
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+import pandas as pd
+
+# pyarrow is optional - without it the pipeline falls back to plain CSV reads.
+# Its dataset and CSV modules are slow to import, so only check that it's
+# installed here; the store imports them when it first reads or converts
+try:
+    ARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+except ModuleNotFoundError:
+    ARROW_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import pyarrow.dataset as ds
+
+
+# Matches tracking filenames like 'input_2023_w01.csv'
+TRACKING_FILE_PATTERN = re.compile(r'input_(\d{4})_w(\d{2})\.csv$')
+
+# Marker written after a week has been fully converted
+SUCCESS_MARKER = '_SUCCESS'
+
+
+class TrackingStore:
+    """Partitioned Parquet store for weekly tracking data."""
+
+    # Rows per Parquet row group. Plays are ~1-3k rows, so a row group spans
+    # a few plays and play_id filters can skip most of a game's file.
+    ROW_GROUP_SIZE = 16_384
+
+    def __init__(self, store_dir: str):
+        """
+        Initialize the tracking store.
+
+        Args:
+            store_dir: Root directory of the Parquet dataset
+        """
+        if not ARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for the columnar tracking store")
+
+        self.store_dir = store_dir
+
+    @staticmethod
+    def _partitioning() -> "ds.Partitioning":
+        """Hive partitioning on game_id, below the season/week directories."""
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        return ds.partitioning(pa.schema([('game_id', pa.int64())]), flavor='hive')
+
+    @staticmethod
+    def parse_filename(filename: str) -> Optional[tuple[int, int]]:
+        """
+        Parse season and week from a tracking filename.
+
+        Args:
+            filename: Tracking filename (e.g., 'input_2023_w01.csv')
+
+        Returns:
+            Tuple of (season, week), or None if the name doesn't match
+        """
+        match = TRACKING_FILE_PATTERN.search(os.path.basename(filename))
+        if not match:
+            return None
+        return int(match.group(1)), int(match.group(2))
+
+    def partition_dir(self, season: int, week: int) -> str:
+        """Get the directory holding a week's partition."""
+        return os.path.join(self.store_dir, f"season={season}", f"week={week:02d}")
+
+    @staticmethod
+    def _source_stamp(source_path: str) -> dict:
+        """Identify a source CSV by path, size and modification time."""
+        stat = os.stat(source_path)
+        return {
+            'source': os.path.abspath(source_path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+
+    def has_week(self, season: int, week: int, source_path: Optional[str] = None) -> bool:
+        """
+        Check whether a week has been converted.
+
+        Args:
+            season: Season year
+            week: Week number
+            source_path: Optional source CSV; if given, the partition is only
+                considered current when it was built from this exact file
+
+        Returns:
+            True if the week can be read from the store
+        """
+        marker = os.path.join(self.partition_dir(season, week), SUCCESS_MARKER)
+        if not os.path.exists(marker):
+            return False
+
+        if source_path is None or not os.path.exists(source_path):
+            return True
+
+        try:
+            with open(marker, 'r') as f:
+                stamp = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return False
+
+        current = self._source_stamp(source_path)
+        return stamp.get('size') == current['size'] and stamp.get('mtime_ns') == current['mtime_ns']
+
+    def stored_columns(self, season: int, week: int) -> list[str]:
+        """Get a week's columns in their original CSV order."""
+        marker = os.path.join(self.partition_dir(season, week), SUCCESS_MARKER)
+        with open(marker, 'r') as f:
+            return json.load(f)['columns']
+
+    def convert_csv(self, csv_path: str, season: int, week: int) -> str:
+        """
+        Convert a weekly tracking CSV into the partitioned store.
+
+        Rows are sorted by (game_id, play_id) before writing so each play is
+        contiguous and row-group statistics can prune play_id filters.
+
+        Args:
+            csv_path: Path to the tracking CSV
+            season: Season year
+            week: Week number
+
+        Returns:
+            Path to the written partition directory
+        """
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        import pyarrow.dataset as ds
+
+        table = pa_csv.read_csv(csv_path)
+
+        # Arrow infers dates (player_birth_date); keep them as text like pandas
+        for i, field in enumerate(table.schema):
+            if pa.types.is_temporal(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+
+        table = table.sort_by([('game_id', 'ascending'), ('play_id', 'ascending')])
+
+        final_dir = self.partition_dir(season, week)
+        tmp_dir = final_dir + '.tmp'
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        ds.write_dataset(
+            table,
+            tmp_dir,
+            format='parquet',
+            partitioning=self._partitioning(),
+            max_rows_per_group=self.ROW_GROUP_SIZE,
+            min_rows_per_group=min(self.ROW_GROUP_SIZE, 1024),
+            existing_data_behavior='overwrite_or_ignore',
+        )
+
+        with open(os.path.join(tmp_dir, SUCCESS_MARKER), 'w') as f:
+            json.dump({
+                **self._source_stamp(csv_path),
+                'rows': table.num_rows,
+                'columns': table.column_names,
+            }, f)
+
+        # Swap the finished partition into place
+        shutil.rmtree(final_dir, ignore_errors=True)
+        os.makedirs(os.path.dirname(final_dir), exist_ok=True)
+        os.replace(tmp_dir, final_dir)
+
+        print(f"Converted {table.num_rows} rows from {os.path.basename(csv_path)} to {final_dir}")
+        return final_dir
+
+    def _dataset(self, season: int, week: int) -> "ds.Dataset":
+        """Open a week's partition as a memory-mapped Arrow dataset."""
+        import pyarrow.dataset as ds
+        from pyarrow import fs as pa_fs
+
+        return ds.dataset(
+            self.partition_dir(season, week),
+            format='parquet',
+            partitioning=self._partitioning(),
+            filesystem=pa_fs.LocalFileSystem(use_mmap=True),
+        )
+
+    @staticmethod
+    def _filter_expression(
+        game_ids: Optional[Iterable] = None,
+        play_ids: Optional[Iterable] = None
+    ) -> Optional["ds.Expression"]:
+        """Build a row filter from optional game_id/play_id sets."""
+        import pyarrow.dataset as ds
+
+        filters = []
+        if game_ids is not None:
+            filters.append(ds.field('game_id').isin([int(g) for g in game_ids]))
+        if play_ids is not None:
+            filters.append(ds.field('play_id').isin([int(p) for p in play_ids]))
+
+        expression = None
+        for f in filters:
+            expression = f if expression is None else expression & f
+        return expression
+
+    def read_week(
+        self,
+        season: int,
+        week: int,
+        columns: Optional[list[str]] = None,
+        game_ids: Optional[Iterable] = None,
+        play_ids: Optional[Iterable] = None
+    ) -> pd.DataFrame:
+        """
+        Read a week of tracking data from the store.
+
+        Args:
+            season: Season year
+            week: Week number
+            columns: Optional column projection (None reads all columns)
+            game_ids: Optional game_id filter (prunes whole partitions)
+            play_ids: Optional play_id filter (prunes row groups)
+
+        Returns:
+            DataFrame with the requested tracking rows and columns
+        """
+        # Partition keys come back last; restore the CSV column order
+        if columns is None:
+            columns = self.stored_columns(season, week)
+
+        table = self._dataset(season, week).to_table(
+            columns=columns,
+            filter=self._filter_expression(game_ids, play_ids),
+        )
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    def iter_batches(
+        self,
+        season: int,
+        week: int,
+        batch_rows: int,
+        columns: Optional[list[str]] = None,
+        game_ids: Optional[Iterable] = None,
+        play_ids: Optional[Iterable] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream a week of tracking data in bounded-size batches.
+
+        Batches arrive in (game_id, play_id) order, so each play's rows are
+        contiguous across batch boundaries.
+
+        Args:
+            season: Season year
+            week: Week number
+            batch_rows: Maximum rows per yielded DataFrame
+            columns: Optional column projection (None reads all columns)
+            game_ids: Optional game_id filter
+            play_ids: Optional play_id filter
+
+        Yields:
+            DataFrames of at most batch_rows rows
+        """
+        if columns is None:
+            columns = self.stored_columns(season, week)
+
+        batches = self._dataset(season, week).to_batches(
+            columns=columns,
+            filter=self._filter_expression(game_ids, play_ids),
+            batch_size=batch_rows,
+            batch_readahead=1,
+            fragment_readahead=1,
+        )
+        for batch in batches:
+            if batch.num_rows:
+                yield batch.to_pandas()
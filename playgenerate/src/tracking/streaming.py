@@ -0,0 +1,182 @@
+"""
+Bounded-memory streaming ingestion for tracking data.
+
+Reads tracking data in fixed-size chunks and builds the one-row-per-play table
+incrementally, so a full week never has to be resident at once. Chunk sizes
+are derived from a memory ceiling using a small sample of the input.
+"""
+
+from typing import Iterable, Iterator, Optional
+
+import pandas as pd
+
+
+# Keys identifying a single play
+PLAY_KEYS = ['game_id', 'play_id']
+
+# A parsed chunk briefly coexists with the parser's buffers and the groupby
+# output, so only a fraction of the ceiling is spent on the chunk itself
+PARSE_OVERHEAD = 3.0
+
+# Never go below this many rows per chunk, however small the ceiling
+MIN_CHUNK_ROWS = 1_000
+
+# Rows read up front to estimate the in-memory size of a row
+SAMPLE_ROWS = 5_000
+
+# Chunk size used when a play limit is pushed down into a sorted source. A
+# play is a few thousand rows, so small chunks let the reader stop shortly
+# after the last play needed.
+LIMIT_CHUNK_ROWS = 20_000
+
+
+def chunk_rows_for_budget(sample: pd.DataFrame, memory_limit_mb: float) -> int:
+    """
+    Compute how many rows fit in a chunk under a memory ceiling.
+
+    Args:
+        sample: A representative sample of the tracking data
+        memory_limit_mb: Memory ceiling for a single chunk in MB
+
+    Returns:
+        Number of rows per chunk
+    """
+    if sample.empty:
+        return MIN_CHUNK_ROWS
+
+    bytes_per_row = sample.memory_usage(deep=True, index=False).sum() / len(sample)
+    rows = int(memory_limit_mb * 1024 * 1024 / (bytes_per_row * PARSE_OVERHEAD))
+    return max(MIN_CHUNK_ROWS, rows)
+
+
+def sample_csv(filepath: str, columns: Optional[list[str]] = None) -> pd.DataFrame:
+    """Read the first SAMPLE_ROWS rows of a tracking CSV."""
+    return pd.read_csv(filepath, usecols=columns, nrows=SAMPLE_ROWS)
+
+
+def iter_csv_chunks(
+    filepath: str,
+    chunk_rows: int,
+    columns: Optional[list[str]] = None,
+    game_ids: Optional[Iterable] = None,
+    play_ids: Optional[Iterable] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a tracking CSV in fixed-size chunks.
+
+    Args:
+        filepath: Path to the tracking CSV
+        chunk_rows: Rows per chunk
+        columns: Optional list of columns to parse
+        game_ids: Optional game_id filter applied to each chunk
+        play_ids: Optional play_id filter applied to each chunk
+
+    Yields:
+        DataFrames of at most chunk_rows rows (empty chunks are skipped)
+    """
+    game_ids = None if game_ids is None else {int(g) for g in game_ids}
+    play_ids = None if play_ids is None else {int(p) for p in play_ids}
+
+    with pd.read_csv(filepath, usecols=columns, chunksize=chunk_rows) as reader:
+        for chunk in reader:
+            if game_ids is not None:
+                chunk = chunk[chunk['game_id'].isin(game_ids)]
+            if play_ids is not None:
+                chunk = chunk[chunk['play_id'].isin(play_ids)]
+            if not chunk.empty:
+                yield chunk
+
+
+class UniquePlayAccumulator:
+    """
+    Builds the one-row-per-play table from a stream of tracking chunks.
+
+    With max_plays set, the result is the first max_plays plays in
+    (game_id, play_id) order, the same plays a full extraction followed by
+    head(max_plays) returns, and only that many plays are held at a time.
+    Tracking rows are grouped by play, so when chunks also arrive in
+    (game_id, play_id) order (the columnar store) a play is complete as soon
+    as a later one starts, and the accumulator reports done once max_plays
+    plays are complete, letting the reader stop early. A CSV in any other
+    order has to be read to the end.
+    """
+
+    def __init__(
+        self,
+        value_columns: list[str],
+        max_plays: Optional[int] = None,
+        sorted_input: bool = False
+    ):
+        """
+        Initialize the accumulator.
+
+        Args:
+            value_columns: Per-play columns to keep (first value per play)
+            max_plays: Optional number of plays to keep
+            sorted_input: Whether chunks arrive in (game_id, play_id) order,
+                so reading can stop once max_plays plays are complete
+        """
+        self.value_columns = value_columns
+        self.max_plays = max_plays
+        self.sorted_input = sorted_input
+        self.rows_seen = 0
+        self.chunks_seen = 0
+        self._plays: Optional[pd.DataFrame] = None
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        """
+        Fold a chunk of tracking rows into the play table.
+
+        Args:
+            chunk: DataFrame with PLAY_KEYS and the value columns
+        """
+        self.rows_seen += len(chunk)
+        self.chunks_seen += 1
+
+        firsts = chunk.groupby(PLAY_KEYS, sort=False)[self.value_columns].first()
+
+        if self._plays is None:
+            self._plays = firsts
+        else:
+            # A play can straddle a chunk boundary; keep its earliest values,
+            # matching groupby().first() over the whole week
+            combined = pd.concat([self._plays, firsts])
+            self._plays = combined.groupby(level=PLAY_KEYS, sort=False).first()
+
+        if self.max_plays is not None and len(self._plays) > self.max_plays + 1:
+            # A play that falls out of the lowest keys can't come back, so
+            # only those (plus one, which tells done that the rest are
+            # complete) are worth keeping
+            self._plays = self._plays.sort_index().iloc[:self.max_plays + 1]
+
+    @property
+    def num_plays(self) -> int:
+        """Number of distinct plays seen so far."""
+        return 0 if self._plays is None else len(self._plays)
+
+    @property
+    def done(self) -> bool:
+        """Whether the first max_plays plays have been fully read."""
+        # In sorted input, the (max_plays + 1)-th play having started means
+        # the first max_plays are complete
+        return (
+            self.sorted_input
+            and self.max_plays is not None
+            and self.num_plays > self.max_plays
+        )
+
+    def result(self) -> pd.DataFrame:
+        """
+        Get the accumulated play table.
+
+        Returns:
+            DataFrame with one row per play (at most max_plays), sorted by
+            (game_id, play_id)
+        """
+        if self._plays is None:
+            return pd.DataFrame(columns=PLAY_KEYS + self.value_columns)
+
+        plays = self._plays.sort_index()
+        if self.max_plays is not None:
+            plays = plays.iloc[:self.max_plays]
+        return plays.reset_index()
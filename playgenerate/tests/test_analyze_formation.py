@@ -0,0 +1,73 @@
+"""
+SceneGenerator.analyze_formation must split offense from defense both for
+tracking data with club/possession_team columns and for the 2026 Big Data
+Bowl input, which only has player_side.
+
+Run from the playgenerate directory:
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+from generation.scene_gen import SceneGenerator
+
+# 11 personnel against a 4-3 front
+OFFENSE = ['QB', 'RB', 'TE', 'WR', 'WR', 'WR', 'T', 'T', 'G', 'G', 'C']
+DEFENSE = ['DE', 'DE', 'DT', 'DT', 'MLB', 'OLB', 'OLB', 'CB', 'CB', 'SS', 'FS']
+
+
+def pre_snap_rows(**columns) -> pd.DataFrame:
+    """First two frames of a play: 11 offensive then 11 defensive players."""
+    frame = pd.DataFrame({
+        'player_position': OFFENSE + DEFENSE,
+        'player_side': ['Offense'] * 11 + ['Defense'] * 11,
+        **columns,
+    })
+    return pd.concat([frame.assign(frame_id=1), frame.assign(frame_id=2)], ignore_index=True)
+
+
+class AnalyzeFormationTest(unittest.TestCase):
+
+    def setUp(self):
+        with mock.patch.dict(os.environ, {'GOOGLE_API_KEY': ''}):
+            self.generator = SceneGenerator()
+
+    def assert_formation(self, tracking_df: pd.DataFrame) -> None:
+        formation = self.generator.analyze_formation(tracking_df)
+        self.assertEqual(formation['personnel'], '11 personnel (3 WR)')
+        self.assertEqual(formation['defense'], '4-3 Base')
+        self.assertEqual(sum(formation['off_positions'].values()), 11)
+        self.assertEqual(sum(formation['def_positions'].values()), 11)
+
+    def test_player_side_only(self):
+        self.assert_formation(pre_snap_rows())
+
+    def test_club_and_possession_team(self):
+        # club/possession_team win over player_side when both are present
+        tracking_df = pre_snap_rows(
+            club=['DET'] * 11 + ['KC'] * 11,
+            possession_team='DET',
+        ).assign(player_side='')
+        self.assert_formation(tracking_df)
+
+    def test_lean_dtypes(self):
+        tracking_df = pre_snap_rows().astype(
+            {'player_position': 'category', 'player_side': 'category'}
+        )
+        self.assert_formation(tracking_df)
+
+    def test_empty(self):
+        formation = self.generator.analyze_formation(pd.DataFrame())
+        self.assertEqual(formation['defense'], 'Unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+NFLPipeline.attach_scenes must put each scene on its own play, whatever the
+key types on either side, and leave plays without a scene blank.
+
+Run from the playgenerate directory:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+from generation.scene_gen import SceneDescription
+from pipeline import NFLPipeline
+
+
+def scene(game_id, play_id, description: str) -> SceneDescription:
+    return SceneDescription(
+        play_id=play_id,
+        game_id=game_id,
+        description=description,
+        camera_angle='sideline',
+        duration_hint=8.0,
+        style_hints=[],
+        formation_offense=f"offense {description}",
+        formation_defense=f"defense {description}",
+    )
+
+
+class AttachScenesTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.pipeline = NFLPipeline(
+                os.path.join(cls.tmp.name, 'data'), os.path.join(cls.tmp.name, 'out'),
+                use_store=False
+            )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def enriched(self) -> pd.DataFrame:
+        # Keys as strings, like enriched rows built from PlayMatcher results
+        return pd.DataFrame({
+            'game_id': ['2023090700', '2023090700', '2023090701'],
+            'play_id': [101, 56, 80],
+            'down': [1, 3, 2],
+        })
+
+    def test_scenes_land_on_their_plays(self):
+        scenes = [
+            scene('2023090701', 80, 'c'),
+            scene(2023090700, '56', 'b'),
+            scene('2023090700', 101, 'a'),
+        ]
+        merged = self.pipeline.attach_scenes(self.enriched(), scenes)
+
+        self.assertListEqual(merged['play_id'].tolist(), [101, 56, 80])
+        self.assertListEqual(merged['down'].tolist(), [1, 3, 2])
+        self.assertListEqual(merged['scene_description'].tolist(), ['a', 'b', 'c'])
+        self.assertListEqual(merged['formation_defense'].tolist(),
+                             ['defense a', 'defense b', 'defense c'])
+        self.assertEqual(merged['game_id'].dtype, 'int64')
+
+    def test_plays_without_scene_are_blank(self):
+        merged = self.pipeline.attach_scenes(self.enriched(), [scene('2023090700', 56, 'b')])
+        self.assertListEqual(merged['scene_description'].tolist(), ['', 'b', ''])
+        self.assertListEqual(merged['camera_angle'].tolist(), ['', 'sideline', ''])
+
+    def test_existing_scene_columns_are_replaced(self):
+        enriched = self.enriched().assign(scene_description='stale', camera_angle='stale')
+        merged = self.pipeline.attach_scenes(enriched, [scene('2023090701', 80, 'new')])
+        self.assertListEqual(merged['scene_description'].tolist(), ['', '', 'new'])
+        self.assertEqual(list(merged.columns).count('scene_description'), 1)
+
+    def test_last_scene_for_a_play_wins(self):
+        scenes = [scene('2023090700', 56, 'first'), scene('2023090700', 56, 'retry')]
+        merged = self.pipeline.attach_scenes(self.enriched(), scenes)
+        self.assertEqual(len(merged), 3)
+        self.assertEqual(merged.loc[merged['play_id'] == 56, 'scene_description'].item(), 'retry')
+
+    def test_empty(self):
+        merged = self.pipeline.attach_scenes(self.enriched().iloc[0:0], [])
+        self.assertTrue(merged.empty)
+        for column in NFLPipeline.SCENE_COLUMNS:
+            self.assertIn(column, merged.columns)
+
+        merged = self.pipeline.attach_scenes(self.enriched(), [])
+        self.assertTrue((merged[NFLPipeline.SCENE_COLUMNS] == '').all().all())
+
+
+if __name__ == '__main__':
+    unittest.main()
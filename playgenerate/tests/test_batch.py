@@ -0,0 +1,84 @@
+"""
+Batch runner helpers: week/season range specs, empty batches and merging a
+season's per-week outputs.
+
+Run from the playgenerate directory:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+import batch
+from batch import merge_season_outputs, parse_range, run_batch
+
+
+class ParseRangeTest(unittest.TestCase):
+
+    def test_single_and_ranges(self):
+        self.assertListEqual(parse_range('3'), [3])
+        self.assertListEqual(parse_range('1-4'), [1, 2, 3, 4])
+        self.assertListEqual(parse_range('1,3,5-7'), [1, 3, 5, 6, 7])
+
+    def test_sorted_and_unique(self):
+        self.assertListEqual(parse_range('9, 2-4 ,3,1'), [1, 2, 3, 4, 9])
+
+    def test_empty(self):
+        self.assertListEqual(parse_range(''), [])
+        self.assertListEqual(parse_range(' , '), [])
+        # A backwards range holds nothing
+        self.assertListEqual(parse_range('5-3'), [])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            parse_range('w1')
+
+
+class RunBatchTest(unittest.TestCase):
+
+    def test_empty_batch_starts_no_workers(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(batch, 'ProcessPoolExecutor') as pool, \
+                contextlib.redirect_stdout(io.StringIO()):
+            self.assertListEqual(run_batch(tmp, tmp, seasons=[2023], weeks=[]), [])
+            self.assertListEqual(run_batch(tmp, tmp, seasons=[], weeks=[1, 2]), [])
+        pool.assert_not_called()
+
+
+class MergeSeasonOutputsTest(unittest.TestCase):
+
+    def test_merges_weeks_and_skips_missing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            enriched_dir = os.path.join(tmp, 'enriched')
+            os.makedirs(enriched_dir)
+            pd.DataFrame({'play_id': [1, 2]}).to_csv(
+                os.path.join(enriched_dir, 'enriched_2023_w01.csv'), index=False
+            )
+            pd.DataFrame({'play_id': [3]}).to_csv(
+                os.path.join(enriched_dir, 'enriched_2023_w03.csv'), index=False
+            )
+            # A week with no enriched plays
+            open(os.path.join(enriched_dir, 'enriched_2023_w04.csv'), 'w').close()
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                path = merge_season_outputs(tmp, 2023, [1, 2, 3, 4])
+                self.assertIsNone(merge_season_outputs(tmp, 2024, [1, 2]))
+
+            self.assertEqual(os.path.basename(path), 'enriched_2023_w01-w04.csv')
+            merged = pd.read_csv(path)
+            self.assertListEqual(merged['play_id'].tolist(), [1, 2, 3])
+            self.assertListEqual(merged['week'].tolist(), [1, 1, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Enrichment checkpoints must be reused on a rerun with the same inputs and
+recomputed when any match input (the sequence hint included) or the game's
+ESPN data changes.
+
+Run from the playgenerate directory:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+from enrichment.play_matcher import EnrichedPlay
+from pipeline import NFLPipeline
+
+
+class FakeMatcher:
+    """Stands in for PlayMatcher: every play matches, calls are recorded."""
+
+    def __init__(self, version: str = 'espn:final:"etag-1"'):
+        self.version = version
+        self.matched = []
+
+    def get_game_version(self, game_id: str):
+        return self.version
+
+    def prefetch(self, bdb_game_ids) -> int:
+        return len(list(bdb_game_ids))
+
+    def match_play(self, play_sequence_hint=None, **play):
+        self.matched.append((play['game_id'], play['play_id'], play_sequence_hint))
+        if play['play_id'] == 999:
+            return None
+        return EnrichedPlay(
+            **play,
+            quarter=1, game_clock='15:00', down=1, yards_to_go=10,
+            play_description='pass complete', play_type='Pass Reception',
+            scoring_play=False, home_team='KC', away_team='DET',
+            stadium='Arrowhead', home_score=0, away_score=0,
+            match_confidence=0.9
+        )
+
+
+def unique_plays(keys) -> pd.DataFrame:
+    return pd.DataFrame({
+        'game_id': [g for g, _ in keys],
+        'play_id': [p for _, p in keys],
+        'absolute_yardline': 35,
+        'play_direction': 'right',
+        'ball_land_x': 50.5,
+        'ball_land_y': 20.25,
+        'num_frames': 20,
+    })
+
+
+class EnrichCheckpointTest(unittest.TestCase):
+
+    KEYS = [(2023090701, 100), (2023090700, 75), (2023090700, 50), (2023090701, 60)]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def pipeline(self, matcher: FakeMatcher, resume: bool = True) -> NFLPipeline:
+        pipeline = NFLPipeline(
+            os.path.join(self.tmp.name, 'data'), os.path.join(self.tmp.name, 'out'),
+            use_store=False, resume=resume
+        )
+        pipeline.play_matcher = matcher
+        return pipeline
+
+    def enrich(self, pipeline: NFLPipeline, plays_df: pd.DataFrame) -> pd.DataFrame:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return pipeline.enrich_plays(plays_df, progress=False)
+
+    def test_sequence_hints_count_plays_within_game(self):
+        hints = NFLPipeline.sequence_hints(unique_plays(self.KEYS))
+        self.assertListEqual(hints.tolist(), [1, 1, 0, 0])
+
+    def test_sequence_hints_ignore_row_order_and_limits(self):
+        plays_df = unique_plays(self.KEYS)
+        expected = dict(zip(self.KEYS, NFLPipeline.sequence_hints(plays_df)))
+
+        # Sorted and limited, as --max-plays loads them
+        limited = plays_df.sort_values(['game_id', 'play_id']).head(3).reset_index(drop=True)
+        # Restricted to one game, in reverse order
+        one_game = plays_df[plays_df['game_id'] == 2023090701].iloc[::-1]
+        for subset in (limited, one_game):
+            hints = NFLPipeline.sequence_hints(subset)
+            for (_, row), hint in zip(subset.iterrows(), hints):
+                self.assertEqual(hint, expected[(row['game_id'], row['play_id'])])
+
+    def test_key_covers_sequence_hint_and_espn_version(self):
+        pipeline = self.pipeline(FakeMatcher())
+        row = unique_plays(self.KEYS).iloc[0]
+        match_args, key = pipeline._enrich_inputs(row, 1)
+        self.assertEqual(match_args['play_sequence_hint'], 1)
+        self.assertEqual(pipeline._enrich_inputs(row, 1)[1], key)
+        self.assertNotEqual(pipeline._enrich_inputs(row, 2)[1], key)
+
+        pipeline.play_matcher.version = 'espn:final:"etag-2"'
+        self.assertNotEqual(pipeline._enrich_inputs(row, 1)[1], key)
+
+    def test_rerun_reuses_checkpoints(self):
+        plays_df = unique_plays(self.KEYS)
+        first = self.enrich(self.pipeline(FakeMatcher()), plays_df)
+        self.assertEqual(len(first), len(self.KEYS))
+
+        matcher = FakeMatcher()
+        pipeline = self.pipeline(matcher)
+        second = self.enrich(pipeline, plays_df)
+        self.assertListEqual(matcher.matched, [])
+        self.assertEqual(pipeline.checkpoints.hits['enrich'], len(self.KEYS))
+        pd.testing.assert_frame_equal(second, first)
+
+    def test_changed_espn_version_recomputes(self):
+        plays_df = unique_plays(self.KEYS)
+        self.enrich(self.pipeline(FakeMatcher()), plays_df)
+
+        matcher = FakeMatcher(version='espn:final:"etag-2"')
+        self.enrich(self.pipeline(matcher), plays_df)
+        self.assertEqual(len(matcher.matched), len(self.KEYS))
+
+    def test_hints_passed_to_matcher(self):
+        matcher = FakeMatcher()
+        self.enrich(self.pipeline(matcher), unique_plays(self.KEYS))
+        self.assertListEqual(
+            [hint for _, _, hint in matcher.matched], [1, 1, 0, 0]
+        )
+
+    def test_force_and_misses_recompute(self):
+        plays_df = unique_plays(self.KEYS + [(2023090700, 999)])
+        self.enrich(self.pipeline(FakeMatcher()), plays_df)
+
+        # The unmatched play isn't checkpointed, so it's retried
+        matcher = FakeMatcher()
+        self.enrich(self.pipeline(matcher), plays_df)
+        self.assertListEqual([p for _, p, _ in matcher.matched], [999])
+
+        # resume=False ignores checkpoints
+        matcher = FakeMatcher()
+        self.enrich(self.pipeline(matcher, resume=False), plays_df)
+        self.assertEqual(len(matcher.matched), len(self.KEYS) + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+StreamingExecutor must deliver every item, report drops and stage errors,
+and shut its threads down, including when the input iterator itself fails.
+
+Run from the playgenerate directory:
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+from executor import Stage, StreamingExecutor
+
+STAGE_NAMES = ('double', 'drop_odd', 'fail_on_8')
+
+
+def failing_source(count: int):
+    yield from range(count)
+    raise RuntimeError("tracking file truncated")
+
+
+def fail_on_8(n: int) -> int:
+    if n == 8:
+        raise ValueError("bad item")
+    return n
+
+
+class StreamingExecutorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = StreamingExecutor([
+            Stage('double', lambda n: n * 2, workers=3),
+            Stage('drop_odd', lambda n: n if n % 4 == 0 else None, workers=2),
+            Stage('fail_on_8', fail_on_8, workers=1),
+        ], queue_size=2)
+
+    def run_with_timeout(self, items, timeout: float = 10.0):
+        """Collect run()'s results and error in a thread, failing on a hang."""
+        outcome = {'results': [], 'error': None}
+
+        def consume():
+            try:
+                for result in self.executor.run(items):
+                    outcome['results'].append(result)
+            except Exception as e:
+                outcome['error'] = e
+
+        thread = threading.Thread(target=consume, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        self.assertFalse(thread.is_alive(), "StreamingExecutor.run did not finish")
+        return outcome['results'], outcome['error']
+
+    def assert_threads_stopped(self):
+        names = {t.name.split('-')[0] for t in threading.enumerate()}
+        self.assertTrue(names.isdisjoint(STAGE_NAMES + ('feeder',)), names)
+
+    def test_every_item_leaves_the_pipeline(self):
+        results, error = self.run_with_timeout(range(20))
+        self.assertIsNone(error)
+        self.assertEqual(len(results), 20)
+
+        completed = sorted(r.item for r in results if r.completed)
+        self.assertListEqual(completed, [n * 2 for n in range(0, 20, 2) if n != 4])
+
+        dropped = [r for r in results if r.stage == 'drop_odd']
+        self.assertEqual(len(dropped), 10)
+        self.assertTrue(all(r.error is None and not r.completed for r in dropped))
+
+        failed = [r for r in results if r.error]
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0].stage, 'fail_on_8')
+        self.assertEqual(failed[0].item, 8)
+        self.assertIn('ValueError', failed[0].error)
+
+        for result in results:
+            self.assertIn('double', result.seconds)
+        self.assert_threads_stopped()
+
+    def test_empty_input(self):
+        results, error = self.run_with_timeout([])
+        self.assertIsNone(error)
+        self.assertListEqual(results, [])
+        self.assert_threads_stopped()
+
+    def test_failing_source_finishes_and_reraises(self):
+        results, error = self.run_with_timeout(failing_source(6))
+        self.assertIsInstance(error, RuntimeError)
+        # Items read before the failure still went through
+        self.assertEqual(len(results), 6)
+        self.assert_threads_stopped()
+
+    def test_source_failing_immediately(self):
+        results, error = self.run_with_timeout(failing_source(0))
+        self.assertIsInstance(error, RuntimeError)
+        self.assertListEqual(results, [])
+        self.assert_threads_stopped()
+
+    def test_requires_a_stage(self):
+        with self.assertRaises(ValueError):
+            StreamingExecutor([])
+
+
+if __name__ == '__main__':
+    unittest.main()
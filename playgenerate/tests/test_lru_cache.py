@@ -0,0 +1,113 @@
+"""
+BoundedCache must stay under its byte cap by evicting least recently used
+entries, including when batch workers share one through CacheManager.
+
+Run from the playgenerate directory:
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+from lru_cache import BoundedCache, approx_size
+
+
+class BoundedCacheTest(unittest.TestCase):
+
+    def test_evicts_least_recently_used(self):
+        cache = BoundedCache(300, sizeof=lambda value: 100)
+        for key in 'abc':
+            cache[key] = key
+        # Reading 'a' makes 'b' the least recently used
+        self.assertEqual(cache.get('a'), 'a')
+        cache['d'] = 'd'
+
+        self.assertListEqual(list(cache), ['c', 'a', 'd'])
+        self.assertEqual(cache.bytes, 300)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_membership_does_not_refresh(self):
+        cache = BoundedCache(200, sizeof=lambda value: 100)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertIn('a', cache)
+        cache['c'] = 3
+        self.assertNotIn('a', cache)
+
+    def test_explicit_sizes_and_replacement(self):
+        cache = BoundedCache(1000)
+        cache.put('a', 'x', size=600)
+        cache.put('a', 'y', size=100)
+        self.assertEqual(cache.bytes, 100)
+        cache.put('b', 'z', size=900)
+        self.assertEqual(cache.bytes, 1000)
+        self.assertEqual(len(cache), 2)
+
+        cache.put('c', 'w', size=1)
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.bytes, 901)
+
+    def test_value_over_the_cap_is_not_kept(self):
+        evicted = []
+        cache = BoundedCache(100, on_evict=lambda key, value: evicted.append(key))
+        cache.put('small', 1, size=50)
+        cache.put('huge', 2, size=500)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.bytes, 0)
+        self.assertListEqual(evicted, ['small', 'huge'])
+
+    def test_on_evict_receives_entries(self):
+        evicted = {}
+        cache = BoundedCache(
+            200, sizeof=lambda value: 100, on_evict=lambda key, value: evicted.update({key: value})
+        )
+        for i in range(5):
+            cache[f"k{i}"] = i
+        self.assertDictEqual(evicted, {'k0': 0, 'k1': 1, 'k2': 2})
+
+    def test_hits_misses_and_delete(self):
+        cache = BoundedCache(1000)
+        cache['a'] = 'value'
+        cache.get('a')
+        cache.get('missing')
+        del cache['a']
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries'], stats['bytes']), (1, 1, 0, 0))
+
+    def test_zero_cap_keeps_nothing(self):
+        cache = BoundedCache(0)
+        cache['a'] = 'value'
+        self.assertEqual(len(cache), 0)
+
+    def test_approx_size(self):
+        small = {'plays': [{'text': 'x' * 10}]}
+        large = {'plays': [{'text': 'x' * 10_000}] * 2 + [{'text': 'y' * 10_000}]}
+        self.assertGreater(approx_size(large), approx_size(small) + 20_000)
+        self.assertGreaterEqual(approx_size(np.zeros(1000)), 8000)
+
+
+class SharedCacheTest(unittest.TestCase):
+
+    def test_manager_hosted_cache_is_capped(self):
+        from batch import CacheManager
+
+        with CacheManager() as manager:
+            cache = manager.BoundedCache(300, name='test_shared')
+            for i in range(5):
+                cache.put(f"url{i}", {'n': i}, size=100)
+            self.assertIsNone(cache.get('url0'))
+            self.assertEqual(cache.get('url4'), {'n': 4})
+            stats = cache.stats()
+            self.assertEqual(stats['entries'], 3)
+            self.assertLessEqual(stats['bytes'], 300)
+            self.assertEqual(stats['evictions'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
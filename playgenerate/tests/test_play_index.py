@@ -0,0 +1,95 @@
+"""
+PlayIndex must return exactly a play's tracking rows, in frame order,
+whether or not the tracking data arrives grouped by play.
+
+Run from the playgenerate directory:
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+from tracking.play_index import PlayIndex
+
+
+def tracking_rows(seed: int = 0) -> pd.DataFrame:
+    """Frames of 3 games x 4 plays x 2 players, in shuffled play order."""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for game_id in (2023090700, 2023090701, 2023091000):
+        for play_id in (56, 80, 101, 1234):
+            rows = int(rng.integers(2, 6))
+            for player in ('A', 'B'):
+                frames.append(pd.DataFrame({
+                    'game_id': game_id,
+                    'play_id': play_id,
+                    'player_name': player,
+                    'frame_id': np.arange(1, rows + 1),
+                    'x': rng.uniform(0, 120, rows),
+                }))
+    order = rng.permutation(len(frames))
+    return pd.concat([frames[i] for i in order], ignore_index=True)
+
+
+class PlayIndexTest(unittest.TestCase):
+
+    def assert_plays_match(self, tracking_df: pd.DataFrame, index: PlayIndex) -> None:
+        keys = tracking_df[['game_id', 'play_id']].drop_duplicates()
+        self.assertEqual(len(index), len(keys))
+        for game_id, play_id in keys.itertuples(index=False):
+            expected = tracking_df[
+                (tracking_df['game_id'] == game_id) & (tracking_df['play_id'] == play_id)
+            ]
+            pd.testing.assert_frame_equal(
+                index.get(game_id, play_id).reset_index(drop=True),
+                expected.reset_index(drop=True)
+            )
+
+    def test_unsorted_input(self):
+        tracking_df = tracking_rows()
+        index = PlayIndex(tracking_df)
+        self.assert_plays_match(tracking_df, index)
+        self.assertListEqual(list(index.keys()), sorted(index.keys()))
+
+    def test_sorted_input(self):
+        tracking_df = tracking_rows().sort_values(['game_id', 'play_id'], kind='stable')
+        index = PlayIndex(tracking_df)
+        self.assert_plays_match(tracking_df, index)
+
+    def test_ranges_tile_the_rows(self):
+        index = PlayIndex(tracking_rows())
+        ranges = sorted(index.row_range(*key) for key in index.keys())
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], len(index.df))
+        for (_, stop), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(stop, start)
+
+    def test_lookup_by_string_ids(self):
+        index = PlayIndex(tracking_rows())
+        self.assertIn(('2023090701', '80'), index)
+        self.assertEqual(index.row_range('2023090701', 80), index.row_range(2023090701, 80))
+
+    def test_missing_play(self):
+        tracking_df = tracking_rows()
+        index = PlayIndex(tracking_df)
+        self.assertNotIn((2023090700, 999), index)
+        self.assertIsNone(index.row_range(2023090700, 999))
+        missing = index.get(2023090700, 999)
+        self.assertTrue(missing.empty)
+        self.assertListEqual(list(missing.columns), list(tracking_df.columns))
+
+    def test_empty(self):
+        index = PlayIndex(tracking_rows().iloc[0:0])
+        self.assertEqual(len(index), 0)
+        self.assertTrue(index.get(2023090700, 56).empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
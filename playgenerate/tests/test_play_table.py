@@ -0,0 +1,193 @@
+"""
+PlayTable must hold the same plays as parsing a summary's drives into
+PlayInfo objects, and PlayMatcher's vectorized scoring must pick the same
+ESPN play, with the same score, as scoring those plays one at a time.
+
+Run from the playgenerate directory:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+from enrichment.espn_client import PlayInfo
+from enrichment.play_matcher import PlayMatcher
+from enrichment.play_table import PlayTable
+
+PLAY_TYPES = ['Pass Reception', 'Rush', 'Pass Incompletion', 'Punt', 'Kickoff', 'Sack']
+
+
+def game_summary(seed: int = 0, drives: int = 20, current: bool = True) -> dict:
+    """A summary with random drives; kicks have no down and often no yard line."""
+    rng = np.random.default_rng(seed)
+
+    def play(n: int) -> dict:
+        kick = rng.random() < 0.15
+        return {
+            'id': str(401547353000 + n),
+            'period': {'number': int(1 + n // 40)},
+            'clock': {'displayValue': f"{int(rng.integers(0, 15))}:{int(rng.integers(0, 60)):02d}"},
+            'start': {
+                'down': 0 if kick else int(rng.integers(1, 5)),
+                'distance': int(rng.integers(1, 20)),
+                'yardLine': 0 if kick and rng.random() < 0.7 else int(rng.integers(1, 100)),
+                'team': {'abbreviation': str(rng.choice(['KC', 'DET']))},
+            },
+            'text': f"play {n}",
+            'type': {'text': str(rng.choice(PLAY_TYPES[3:] if kick else PLAY_TYPES[:3]))},
+            'scoringPlay': bool(rng.random() < 0.05),
+            'homeScore': int(rng.integers(0, 30)),
+            'awayScore': int(rng.integers(0, 30)),
+        }
+
+    n = 0
+    previous = []
+    for _ in range(drives):
+        plays = []
+        for _ in range(int(rng.integers(1, 10))):
+            plays.append(play(n))
+            n += 1
+        previous.append({'plays': plays})
+    summary = {'drives': {'previous': previous}}
+    if current:
+        summary['drives']['current'] = {'plays': [play(n), play(n + 1)]}
+    return summary
+
+
+def reference_plays(summary: dict) -> list[PlayInfo]:
+    """Walk the drives into PlayInfo objects, as the client did per call."""
+    drives = list(summary['drives'].get('previous', []))
+    if summary['drives'].get('current'):
+        drives.append(summary['drives']['current'])
+    return [
+        PlayInfo(
+            play_id=str(play['id']),
+            quarter=play['period']['number'],
+            clock=play['clock']['displayValue'],
+            down=play['start']['down'],
+            distance=play['start']['distance'],
+            yard_line=play['start']['yardLine'],
+            yard_line_side=play['start']['team']['abbreviation'],
+            play_text=play['text'],
+            play_type=play['type']['text'],
+            scoring_play=play['scoringPlay'],
+            home_score=play['homeScore'],
+            away_score=play['awayScore'],
+        )
+        for drive in drives for play in drive['plays']
+    ]
+
+
+def reference_best(plays: list[PlayInfo], yardline: int, hint) -> tuple:
+    """Score one play at a time, keeping the first highest score."""
+    best_idx, best_score = None, 0.0
+    for idx, play in enumerate(plays):
+        if play.yard_line == 0 and play.down == 0:
+            continue
+        sequence_dist = abs(idx - (hint or 0)) if hint else idx
+        score = PlayMatcher.calculate_match_score(
+            bdb_yardline=yardline,
+            espn_yardline=play.yard_line,
+            bdb_direction='right',
+            espn_down=play.down,
+            sequence_distance=sequence_dist
+        )
+        if score > best_score:
+            best_idx, best_score = idx, score
+    return best_idx, best_score
+
+
+class PlayTableTest(unittest.TestCase):
+
+    def test_matches_parsed_plays(self):
+        for seed, current in ((0, True), (1, False)):
+            summary = game_summary(seed, current=current)
+            table = PlayTable.from_summary(summary)
+            expected = reference_plays(summary)
+            self.assertEqual(len(table), len(expected))
+            self.assertListEqual(table.to_plays(), expected)
+            for index in (0, len(expected) // 2, len(expected) - 1):
+                self.assertEqual(table.row(index), expected[index])
+
+    def test_repeated_strings_are_pooled(self):
+        table = PlayTable.from_summary(game_summary())
+        self.assertLessEqual(len(set(table.play_type.tolist())), len(PLAY_TYPES))
+        self.assertLessEqual(len(set(table.yard_line_side.tolist())), 2)
+        self.assertEqual(len(set(table.pool.values)), len(table.pool))
+
+    def test_missing_values_become_zero(self):
+        summary = {'drives': {'previous': [{'plays': [
+            {'id': 1, 'start': {'down': None, 'yardLine': None}, 'homeScore': None},
+        ]}]}}
+        play = PlayTable.from_summary(summary).row(0)
+        self.assertEqual((play.down, play.yard_line, play.home_score, play.quarter), (0, 0, 0, 0))
+        self.assertEqual(play.play_id, '1')
+
+    def test_empty(self):
+        self.assertEqual(len(PlayTable.from_summary(None)), 0)
+        self.assertEqual(len(PlayTable.from_summary({'drives': {}})), 0)
+
+
+class MatchScoresTest(unittest.TestCase):
+
+    YARDLINES = range(10, 111, 7)
+    HINTS = (None, 0, 1, 5, 37, 500)
+
+    def setUp(self):
+        self.summary = game_summary(seed=2)
+        self.table = PlayTable.from_summary(self.summary)
+        self.plays = reference_plays(self.summary)
+
+    def test_scores_match_scalar_scorer(self):
+        for yardline in self.YARDLINES:
+            for hint in self.HINTS:
+                scores = PlayMatcher.match_scores(self.table, yardline, hint)
+                for idx, play in enumerate(self.plays):
+                    if play.yard_line == 0 and play.down == 0:
+                        self.assertEqual(scores[idx], 0.0)
+                        continue
+                    sequence_dist = abs(idx - hint) if hint else idx
+                    self.assertEqual(scores[idx], PlayMatcher.calculate_match_score(
+                        yardline, play.yard_line, 'right', play.down, sequence_dist
+                    ))
+
+    def test_match_play_picks_the_same_play(self):
+        client = mock.Mock()
+        client.get_play_table.return_value = self.table
+        client.get_game_info.return_value = None
+        mapper = mock.Mock()
+        mapper.get_mapping.return_value = SimpleNamespace(
+            espn_game_id='401547353', home_team='KC', away_team='DET', stadium='Arrowhead'
+        )
+        matcher = PlayMatcher(client, mapper)
+
+        for yardline in self.YARDLINES:
+            for hint in self.HINTS:
+                with self.subTest(yardline=yardline, hint=hint):
+                    best_idx, best_score = reference_best(self.plays, yardline, hint)
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        match = matcher.match_play(
+                            '2023090700', 56, yardline, play_sequence_hint=hint
+                        )
+                    if best_idx is None or best_score < 0.3:
+                        self.assertIsNone(match)
+                        continue
+                    best = self.plays[best_idx]
+                    self.assertEqual(match.match_confidence, best_score)
+                    self.assertEqual(match.play_description, best.play_text)
+                    self.assertEqual((match.quarter, match.game_clock, match.down),
+                                     (best.quarter, best.clock, best.down))
+
+
+if __name__ == '__main__':
+    unittest.main()
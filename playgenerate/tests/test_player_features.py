@@ -0,0 +1,123 @@
+"""
+compute_player_features must agree with a plain per-player groupby over the
+same tracking rows.
+
+Run from the playgenerate directory:
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+from tracking.features import FEATURE_COLUMNS, FEATURE_KEYS, compute_player_features
+
+
+def tracking_rows(seed: int = 0) -> pd.DataFrame:
+    """Shuffled frames of 2 games x 3 plays x 4 players, with some NaN speeds."""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for game_id in (2023090700, 2023090701):
+        for play_id in (56, 80, 101):
+            for i, player in enumerate(('Ann Ay', 'Bo Bee', 'Cy Sea', 'Di Dee')):
+                rows = int(rng.integers(1, 8))
+                frames.append(pd.DataFrame({
+                    'game_id': game_id,
+                    'play_id': play_id,
+                    'player_name': player,
+                    'player_position': ['QB', 'WR', 'CB', 'SS'][i],
+                    'player_role': ['Passer', 'Targeted Receiver', 'Defensive Coverage', 'Defensive Coverage'][i],
+                    'player_side': ['Offense', 'Offense', 'Defense', 'Defense'][i],
+                    'frame_id': np.arange(1, rows + 1),
+                    'x': rng.uniform(0, 120, rows),
+                    'y': rng.uniform(0, 53.3, rows),
+                    's': np.where(rng.random(rows) < 0.2, np.nan, rng.uniform(0, 10, rows)),
+                    'a': rng.uniform(0, 6, rows),
+                }))
+    df = pd.concat(frames, ignore_index=True)
+    # Ball rows have no player and are skipped
+    ball = df.iloc[:3].assign(player_name=np.nan)
+    df = pd.concat([df, ball], ignore_index=True)
+    return df.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def reference_features(tracking_df: pd.DataFrame) -> pd.DataFrame:
+    """The per-player loop the vectorized version replaced."""
+    rows = []
+    players = tracking_df.dropna(subset=['player_name'])
+    for (game_id, play_id, name), group in players.groupby(FEATURE_KEYS, sort=True):
+        group = group.sort_values('frame_id')
+        first, last = group.iloc[0], group.iloc[-1]
+        dx, dy = last['x'] - first['x'], last['y'] - first['y']
+        rows.append({
+            'game_id': game_id,
+            'play_id': play_id,
+            'player_name': name,
+            'player_position': first['player_position'],
+            'player_role': first['player_role'],
+            'player_side': first['player_side'],
+            'first_x': first['x'],
+            'first_y': first['y'],
+            'last_x': last['x'],
+            'last_y': last['y'],
+            'dx': dx,
+            'dy': dy,
+            'displacement': np.hypot(dx, dy),
+            'path_length': np.hypot(group['x'].diff(), group['y'].diff()).sum(),
+            'max_speed': group['s'].max(),
+            'max_accel': group['a'].max(),
+            'num_frames': len(group),
+        })
+    return pd.DataFrame(rows, columns=FEATURE_COLUMNS)
+
+
+class PlayerFeaturesTest(unittest.TestCase):
+
+    def test_matches_groupby(self):
+        tracking_df = tracking_rows()
+        pd.testing.assert_frame_equal(
+            compute_player_features(tracking_df),
+            reference_features(tracking_df),
+            check_dtype=False
+        )
+
+    def test_lean_dtypes(self):
+        tracking_df = tracking_rows(seed=1)
+        lean = tracking_df.astype({
+            'player_name': 'category', 'player_position': 'category',
+            'x': 'float32', 'y': 'float32', 's': 'float32', 'a': 'float32',
+            'play_id': 'int32', 'frame_id': 'int16',
+        })
+        pd.testing.assert_frame_equal(
+            compute_player_features(lean),
+            reference_features(lean),
+            check_dtype=False, check_categorical=False, rtol=1e-5
+        )
+
+    def test_all_nan_speeds(self):
+        tracking_df = tracking_rows().assign(s=np.nan)
+        self.assertTrue(compute_player_features(tracking_df)['max_speed'].isna().all())
+
+    def test_optional_columns(self):
+        tracking_df = tracking_rows().drop(columns=['s', 'a', 'player_position', 'player_role'])
+        features = compute_player_features(tracking_df)
+        self.assertTrue((features['max_speed'] == 0.0).all())
+        self.assertTrue((features['max_accel'] == 0.0).all())
+        self.assertTrue((features['player_position'] == 'Unknown').all())
+        self.assertTrue((features['player_role'] == '').all())
+
+    def test_no_players(self):
+        tracking_df = tracking_rows().assign(player_name=np.nan)
+        features = compute_player_features(tracking_df)
+        self.assertTrue(features.empty)
+        self.assertListEqual(list(features.columns), FEATURE_COLUMNS)
+
+
+if __name__ == '__main__':
+    unittest.main()
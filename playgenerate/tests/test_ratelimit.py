@@ -0,0 +1,118 @@
+"""
+TokenBucket must allow `burst` requests at once and `rate` per second after
+that, across threads and (with a state file) across bucket instances.
+
+Run from the playgenerate directory:
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+import ratelimit
+from ratelimit import TokenBucket, shared_limiter
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping advances the clock."""
+
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+        self.slept = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(ratelimit, 'time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=2.0, burst=3)
+        waits = [bucket.reserve() for _ in range(6)]
+        self.assertListEqual(waits, [0.0, 0.0, 0.0, 0.5, 1.0, 1.5])
+
+    def test_refills_up_to_burst(self):
+        bucket = TokenBucket(rate=2.0, burst=2)
+        bucket.reserve()
+        bucket.reserve()
+        self.clock.now += 0.5
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.5)
+
+        # A long idle period refills no more than the burst
+        self.clock.now += 60
+        self.assertListEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.5])
+
+    def test_acquire_sleeps_for_its_reservation(self):
+        bucket = TokenBucket(rate=4.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertEqual(bucket.acquire(), 0.25)
+        self.assertListEqual(self.clock.slept, [0.25])
+
+    def test_threads_share_the_budget(self):
+        bucket = TokenBucket(rate=10.0, burst=1)
+        waits = []
+        lock = threading.Lock()
+
+        def reserve():
+            wait = bucket.reserve()
+            with lock:
+                waits.append(wait)
+
+        threads = [threading.Thread(target=reserve) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Every thread got its own slot, 0.1s apart
+        self.assertListEqual(sorted(round(w, 6) for w in waits), [i / 10 for i in range(20)])
+
+    @unittest.skipIf(ratelimit.fcntl is None, "state files need fcntl")
+    def test_state_file_is_shared(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            state_file = os.path.join(tmp, 'espn.bucket')
+            first = TokenBucket(rate=1.0, burst=2, state_file=state_file)
+            second = TokenBucket(rate=1.0, burst=2, state_file=state_file)
+            self.assertEqual(first.reserve(), 0.0)
+            self.assertEqual(second.reserve(), 0.0)
+            self.assertEqual(first.reserve(), 1.0)
+            self.assertEqual(second.reserve(), 2.0)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class SharedLimiterTest(unittest.TestCase):
+
+    def test_one_bucket_per_service(self):
+        limiter = shared_limiter('test-service', 3.0, 2)
+        self.assertIs(shared_limiter('test-service', 3.0, 2), limiter)
+        self.assertIsNot(shared_limiter('test-other', 3.0, 2), limiter)
+
+    def test_replaced_when_limits_change(self):
+        limiter = shared_limiter('test-changed', 3.0, 2)
+        replaced = shared_limiter('test-changed', 5.0, 2)
+        self.assertIsNot(replaced, limiter)
+        self.assertEqual(replaced.rate, 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
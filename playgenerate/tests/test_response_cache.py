@@ -0,0 +1,174 @@
+"""
+The persistent ESPN response cache: entries expire after their TTL (final
+games never do), keep their validators for conditional requests, survive
+across cache instances and are evicted least recently used first.
+
+Run from the playgenerate directory:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+from enrichment import response_cache
+from enrichment.espn_client import ESPNClient
+from enrichment.response_cache import ResponseCache
+
+SCOREBOARD_URL = 'https://espn.test/scoreboard?dates=20230907'
+
+
+def scoreboard(state: str) -> dict:
+    return {'events': [{'id': '401547353', 'status': {'type': {
+        'state': state, 'completed': state == 'post',
+    }}}]}
+
+
+class FakeClock:
+    """Stands in for the time module."""
+
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, data: dict = None, headers: dict = None):
+        self.status_code = status_code
+        self.content = json.dumps(data).encode() if data is not None else b''
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class ResponseCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, 'espn_cache.sqlite')
+        self.clock = FakeClock()
+        patcher = mock.patch.object(response_cache, 'time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class ResponseCacheTest(ResponseCacheTestCase):
+
+    def test_ttl(self):
+        cache = ResponseCache(self.path)
+        cache.put('live', {'n': 1}, ttl_seconds=60)
+        cache.put('final', {'n': 2}, ttl_seconds=None)
+        self.assertTrue(cache.get('live').fresh)
+
+        self.clock.now += 61
+        live = cache.get('live')
+        # Expired entries are still returned, for revalidation
+        self.assertFalse(live.fresh)
+        self.assertEqual(live.data, {'n': 1})
+
+        self.clock.now += 10 * 365 * 86400
+        self.assertTrue(cache.get('final').fresh)
+
+    def test_refresh_extends_expiry(self):
+        cache = ResponseCache(self.path)
+        cache.put('live', {'n': 1}, ttl_seconds=60, etag='"v1"')
+        self.clock.now += 61
+        cache.refresh('live', ttl_seconds=60)
+        entry = cache.get('live')
+        self.assertTrue(entry.fresh)
+        self.assertEqual(entry.etag, '"v1"')
+
+    def test_validators(self):
+        cache = ResponseCache(self.path)
+        cache.put('a', {}, etag='"abc"', last_modified='Thu, 07 Sep 2023 00:00:00 GMT')
+        self.assertEqual(cache.validators('a'), ('"abc"', 'Thu, 07 Sep 2023 00:00:00 GMT'))
+        self.assertEqual(cache.validators('missing'), (None, None))
+
+    def test_persists_across_instances(self):
+        ResponseCache(self.path).put('a', {'plays': [1, 2, 3]})
+        cache = ResponseCache(self.path)
+        self.assertTrue(cache.contains('a'))
+        self.assertEqual(cache.get('a').data, {'plays': [1, 2, 3]})
+        self.assertIsNone(cache.get('b'))
+
+    def test_evicts_least_recently_used(self):
+        body = {'text': os.urandom(2000).hex()}
+        entry_bytes = len(response_cache.zlib.compress(response_cache._dumps(body), 1))
+        cache = ResponseCache(self.path, max_bytes=int(entry_bytes * 3.5))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            for url in ('a', 'b', 'c'):
+                self.clock.now += 1
+                cache.put(url, body)
+            # Reading 'a' makes 'b' the least recently used
+            self.clock.now += 1
+            cache.get('a')
+            self.clock.now += 1
+            cache.put('d', body)
+
+        self.assertFalse(cache.contains('b'))
+        for url in ('a', 'c', 'd'):
+            self.assertTrue(cache.contains(url))
+        self.assertLessEqual(cache.stats()['bytes'], cache.max_bytes)
+
+
+class ConditionalRequestTest(ResponseCacheTestCase):
+
+    def client(self) -> ESPNClient:
+        # A fresh client has an empty in-memory cache, like a new run
+        client = ESPNClient(rate_limit_seconds=0, disk_cache=ResponseCache(self.path))
+        client.session = mock.Mock()
+        return client
+
+    def test_expired_entry_is_revalidated(self):
+        client = self.client()
+        client.session.get.return_value = FakeResponse(200, scoreboard('pre'), {'ETag': '"v1"'})
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(client._get(SCOREBOARD_URL), scoreboard('pre'))
+
+        # Still fresh: served without a request
+        client = self.client()
+        self.clock.now += ESPNClient.DEFAULT_TTL_SECONDS - 1
+        self.assertEqual(client._get(SCOREBOARD_URL), scoreboard('pre'))
+        client.session.get.assert_not_called()
+
+        # Expired: a conditional request, answered 304
+        client = self.client()
+        self.clock.now += 2
+        client.session.get.return_value = FakeResponse(304)
+        self.assertEqual(client._get(SCOREBOARD_URL), scoreboard('pre'))
+        headers = client.session.get.call_args.kwargs['headers']
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+        self.assertTrue(ResponseCache(self.path).get(SCOREBOARD_URL).fresh)
+
+    def test_changed_response_replaces_entry(self):
+        client = self.client()
+        client.session.get.return_value = FakeResponse(200, scoreboard('in'), {'ETag': '"v1"'})
+        client._get(SCOREBOARD_URL)
+
+        # Live games expire quickly
+        client = self.client()
+        self.clock.now += ESPNClient.LIVE_TTL_SECONDS + 1
+        client.session.get.return_value = FakeResponse(200, scoreboard('post'), {'ETag': '"v2"'})
+        self.assertEqual(client._get(SCOREBOARD_URL), scoreboard('post'))
+
+        stored = ResponseCache(self.path).get(SCOREBOARD_URL)
+        self.assertEqual(stored.etag, '"v2"')
+        # A final game never expires
+        self.assertIsNone(stored.expires_at)
+
+
+if __name__ == '__main__':
+    unittest.main()
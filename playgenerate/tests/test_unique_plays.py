@@ -0,0 +1,147 @@
+"""
+The polars and pandas engines, reading either the CSV or the columnar store,
+must build the same unique-play table, and a max_plays limit must keep the
+first plays by (game_id, play_id).
+
+Run from the playgenerate directory:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+PLAYGEN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PLAYGEN_DIR, 'src'))
+
+from pipeline import NFLPipeline
+from tracking.polars_backend import POLARS_AVAILABLE
+from tracking.store import ARROW_AVAILABLE
+
+FILENAME = 'input_2023_w01.csv'
+
+
+def write_tracking(data_dir: str, games: int = 6, plays_per_game: int = 40,
+                   seed: int = 0) -> None:
+    """Write a tracking CSV whose plays are grouped but not in sorted order."""
+    rng = np.random.default_rng(seed)
+    keys = [(2023090700 + g, 50 + 25 * p) for g in range(games) for p in range(plays_per_game)]
+    order = rng.permutation(len(keys))
+
+    frames = []
+    for i in order:
+        game_id, play_id = keys[i]
+        rows = int(rng.integers(5, 30))
+        yardline = np.full(rows, float(rng.integers(10, 100)))
+        # Leading nulls check that each value is the play's first non-null
+        yardline[:int(rng.integers(0, 3))] = np.nan
+        frames.append(pd.DataFrame({
+            'game_id': game_id,
+            'play_id': play_id,
+            'frame_id': np.arange(1, rows + 1),
+            'absolute_yardline_number': yardline,
+            'play_direction': rng.choice(['left', 'right']),
+            # Two decimals, like the BDB files
+            'ball_land_x': round(rng.uniform(0, 120), 2),
+            'ball_land_y': round(rng.uniform(0, 53.3), 2),
+            'num_frames_output': int(rng.integers(10, 40)),
+        }))
+
+    train_dir = os.path.join(data_dir, 'train')
+    os.makedirs(train_dir, exist_ok=True)
+    pd.concat(frames).to_csv(os.path.join(train_dir, FILENAME), index=False)
+
+
+class UniquePlaysTestCase(unittest.TestCase):
+
+    MAX_PLAYS = (None, 1, 7, 100, 1000)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.data_dir = os.path.join(cls.tmp.name, 'data')
+        write_tracking(cls.data_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def unique_plays(self, engine: str, use_store: bool, max_plays) -> pd.DataFrame:
+        output_dir = os.path.join(self.tmp.name, f"out_{engine}_{use_store}")
+        with contextlib.redirect_stdout(io.StringIO()):
+            pipeline = NFLPipeline(
+                self.data_dir, output_dir, use_store=use_store, engine=engine
+            )
+            plays = pipeline.load_unique_plays(FILENAME, max_plays=max_plays)
+        return plays.reset_index(drop=True)
+
+    def assert_plays_equal(self, actual: pd.DataFrame, expected: pd.DataFrame) -> None:
+        pd.testing.assert_frame_equal(
+            actual.reset_index(drop=True), expected.reset_index(drop=True),
+            check_dtype=False, check_categorical=False, check_exact=True
+        )
+
+
+class UniquePlaysLimitTest(UniquePlaysTestCase):
+
+    def test_limit_keeps_first_plays_by_key(self):
+        # The whole-file read is the reference; its group-by sorts by key
+        everything = self.unique_plays('pandas', False, None)
+        self.assertTrue(everything[['game_id', 'play_id']].apply(tuple, axis=1).is_monotonic_increasing)
+        for max_plays in self.MAX_PLAYS[1:]:
+            with self.subTest(max_plays=max_plays):
+                self.assert_plays_equal(
+                    self.unique_plays('pandas', False, max_plays), everything.head(max_plays)
+                )
+
+    @unittest.skipUnless(ARROW_AVAILABLE, "pyarrow is not installed")
+    def test_store_matches_csv(self):
+        for max_plays in self.MAX_PLAYS:
+            with self.subTest(max_plays=max_plays):
+                self.assert_plays_equal(
+                    self.unique_plays('pandas', True, max_plays),
+                    self.unique_plays('pandas', False, max_plays)
+                )
+
+    def test_filtered_tracking_load(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            pipeline = NFLPipeline(self.data_dir, os.path.join(self.tmp.name, 'out_filter'),
+                                   use_store=False, lean_dtypes=False)
+            everything = pipeline.load_tracking_data(FILENAME)
+            filtered = pipeline.load_tracking_data(FILENAME, game_ids=[2023090701], play_ids=[75, 100])
+            missing = pipeline.load_tracking_data(FILENAME, game_ids=[1])
+        expected = everything[everything['game_id'].eq(2023090701) & everything['play_id'].isin([75, 100])]
+        self.assert_plays_equal(filtered, expected)
+        self.assertTrue(missing.empty)
+        self.assertListEqual(list(missing.columns), list(everything.columns))
+
+
+@unittest.skipUnless(POLARS_AVAILABLE, "polars is not installed")
+class UniquePlaysEngineParityTest(UniquePlaysTestCase):
+
+    def assert_engines_match(self, use_store: bool) -> None:
+        for max_plays in self.MAX_PLAYS:
+            with self.subTest(use_store=use_store, max_plays=max_plays):
+                expected = self.unique_plays('pandas', use_store, max_plays)
+                # Repeat the polars query; its group-by runs on all cores
+                for _ in range(3):
+                    self.assert_plays_equal(
+                        self.unique_plays('polars', use_store, max_plays), expected
+                    )
+
+    def test_csv(self):
+        self.assert_engines_match(use_store=False)
+
+    @unittest.skipUnless(ARROW_AVAILABLE, "pyarrow is not installed")
+    def test_store(self):
+        self.assert_engines_match(use_store=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,20 +1,79 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { exec } from 'child_process';
+import { randomUUID } from 'crypto';
 import { promisify } from 'util';
 import path from 'path';
 
 const execAsync = promisify(exec);
 
+// Persistent pipeline worker (playgenerate/src/server.py). Keeps the pipeline,
+// its caches and imports warm, so requests skip Python startup entirely.
+const WORKER_URL = process.env.PIPELINE_WORKER_URL || 'http://127.0.0.1:8765';
+
+/**
+ * Run the job on the pipeline worker. Returns null if the worker isn't
+ * running, so the caller can fall back to spawning the pipeline script.
+ */
+async function runOnWorker(week: number, maxPlays: number): Promise<NextResponse | null> {
+  let response: Response;
+  try {
+    response = await fetch(`${WORKER_URL}/process`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ week, maxPlays, mode: 'scenes-only' }),
+      signal: AbortSignal.timeout(120000), // 2 minute timeout
+    });
+  } catch (error) {
+    if (error instanceof Error && error.name === 'TimeoutError') {
+      // The worker is up but the job is slow; don't run it a second time
+      return NextResponse.json(
+        { success: false, error: 'Pipeline timed out', details: error.message },
+        { status: 504 }
+      );
+    }
+    console.log('Pipeline worker unavailable, falling back to script:', error instanceof Error ? error.message : error);
+    return null;
+  }
+
+  const result = await response.json();
+  return NextResponse.json(result, { status: response.status });
+}
+
+/**
+ * Read the metrics summary a run wrote under its own --metrics-name
+ * (playgenerate/output/metrics/{metricsName}.json), then remove the run's
+ * metrics files. Returns null if the summary is missing.
+ */
+async function readRunMetrics(playgenDir: string, metricsName: string): Promise<Record<string, any> | null> {
+  const { promises: fs } = await import('fs');
+  const metricsBase = path.join(playgenDir, 'output', 'metrics', metricsName);
+  try {
+    return JSON.parse(await fs.readFile(`${metricsBase}.json`, 'utf-8'));
+  } catch {
+    return null;
+  } finally {
+    await Promise.all(['json', 'prom'].map((ext) => fs.rm(`${metricsBase}.${ext}`, { force: true })));
+  }
+}
+
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json();
     const { week = 1, maxPlays = 10 } = body;
 
+    const workerResponse = await runOnWorker(week, maxPlays);
+    if (workerResponse) {
+      return workerResponse;
+    }
+
     // Path to the pipeline
     const playgenDir = path.join(process.cwd(), '..', 'playgenerate');
     const venvActivate = `source ${path.join(playgenDir, 'venv', 'bin', 'activate')}`;
+    // Metrics go to a file of this run's own, so concurrent runs can't overwrite them
+    const metricsName = `pipeline-${randomUUID()}`;
+
     // Use --scenes-only to generate tactical scene descriptions from existing enriched data
-    const pythonCmd = `python3 ${path.join(playgenDir, 'src', 'pipeline.py')} --week ${week} --max-plays ${maxPlays} --scenes-only`;
+    const pythonCmd = `python3 ${path.join(playgenDir, 'src', 'pipeline.py')} --week ${week} --max-plays ${maxPlays} --scenes-only --metrics-name ${metricsName}`;
     
     // Full command
     const fullCmd = `cd ${playgenDir} && ${venvActivate} && ${pythonCmd}`;
@@ -30,13 +89,16 @@ export async function POST(request: NextRequest) {
     console.log('Pipeline stdout:', stdout);
     if (stderr) console.log('Pipeline stderr:', stderr);
 
-    // Parse output to extract stats
-    const linesProcessed = stdout.match(/Successfully enriched (\d+)/)?.[1] || '0';
+    // Counts come from the run's metrics summary rather than the log text
+    const metrics = await readRunMetrics(playgenDir, metricsName);
+    const run = metrics?.run ?? {};
 
     return NextResponse.json({
       success: true,
       message: 'Pipeline completed successfully',
-      playsProcessed: parseInt(linesProcessed),
+      playsProcessed: run.plays_enriched ?? run.plays_loaded ?? 0,
+      scenesGenerated: run.scenes_generated ?? 0,
+      stages: metrics?.stages ?? {},
       stdout: stdout.slice(-2000), // Last 2000 chars of output
     });
 